@@ -0,0 +1,119 @@
+#
+# user-statistician: Github action for generating a user stats card
+# 
+# Copyright (c) 2022 Vincent A Cicirello
+# https://www.cicirello.org/
+#
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from Colors import iconTemplates
+from ColorUtil import highContrastingColor
+
+class ImageLayout :
+    """The layout of a stats image (i.e., the positions and widths of
+    all of its text, and the geometry of its language chart), without
+    its colors. The same layout can be painted with any color theme
+    that agrees on whether the title has icons, which is much cheaper
+    than generating the image again.
+    """
+
+    __slots__ = [
+        '_parts',
+        '_hasTitleIcon'
+        ]
+
+    colorKeys = ("bg", "border", "icons", "text", "title")
+    slotDelimiter = "\x00"
+
+    def __init__(self, image, hasTitleIcon) :
+        """Initializes the layout.
+
+        Keyword arguments:
+        image - An image generated with the colors from slotColors, such that
+            each color (and the title icons) is a slot delimited by slotDelimiter.
+        hasTitleIcon - True if the image was generated with title icons.
+        """
+        # Even indexes are literal svg, and odd indexes are the names of slots.
+        self._parts = image.split(ImageLayout.slotDelimiter)
+        self._hasTitleIcon = hasTitleIcon
+
+    @staticmethod
+    def slot(name) :
+        """Formats the placeholder for a slot.
+
+        Keyword arguments:
+        name - The name of the slot.
+        """
+        return ImageLayout.slotDelimiter + name + ImageLayout.slotDelimiter
+
+    @staticmethod
+    def slotColors(hasTitleIcon) :
+        """Gets a color theme whose colors are slots, for generating
+        a layout.
+
+        Keyword arguments:
+        hasTitleIcon - True if the title should have icons.
+        """
+        colors = { key : ImageLayout.slot(key) for key in ImageLayout.colorKeys }
+        if hasTitleIcon :
+            colors["title-icon"] = ImageLayout.slot("title-icon")
+        return colors
+
+    @staticmethod
+    def titleIconSlot(size, x, y) :
+        """Formats the slot for a title icon, which carries the
+        icon's geometry.
+
+        Keyword arguments:
+        size - The size of the icon.
+        x - The x coordinate of the icon.
+        y - The y coordinate of the icon.
+        """
+        return ImageLayout.slot("title-icon:{0}:{1}:{2}".format(size, x, y))
+
+    def hasTitleIcon(self) :
+        """Checks whether the layout has title icons."""
+        return self._hasTitleIcon
+
+    def paint(self, colors) :
+        """Paints the layout with a color theme, returning the image.
+
+        Keyword arguments:
+        colors - A dictionary containing the color theme, which must
+            agree with the layout on whether there are title icons
+            (i.e., whether it has the key "title-icon").
+        """
+        if ("title-icon" in colors) != self._hasTitleIcon :
+            raise ValueError("The color theme and the layout disagree on whether the title has icons.")
+        highContrast = highContrastingColor(colors["bg"])
+        values = { key : colors[key] for key in ImageLayout.colorKeys }
+        values["contrast"] = highContrast
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2) :
+            name = parts[i]
+            if name in values :
+                parts[i] = values[name]
+            else :
+                size, x, y = name.split(":")[1:]
+                parts[i] = iconTemplates[colors["title-icon"]].format(size, x, y, highContrast)
+                values[name] = parts[i]
+        return "".join(parts)
@@ -0,0 +1,234 @@
+#
+# user-statistician: Github action for generating a user stats card
+# 
+# Copyright (c) 2022 Vincent A Cicirello
+# https://www.cicirello.org/
+#
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+from collections import OrderedDict
+import json
+import os
+import threading
+
+class ImageSkeleton :
+    """The static parts of a stats image (i.e., everything other than
+    the values of the stats and other dynamic strings), with numbered
+    slots for the values.
+    """
+
+    __slots__ = [
+        '_parts'
+        ]
+
+    slotDelimiter = "\x01"
+
+    def __init__(self, parts) :
+        """Initializes the skeleton.
+
+        Keyword arguments:
+        parts - A list alternating between literal svg (even indexes)
+            and the indexes of the values that fill the slots (odd indexes).
+        """
+        self._parts = parts
+
+    @staticmethod
+    def fromImage(image) :
+        """Creates a skeleton from an image that was generated
+        with each value in a slot delimited by slotDelimiter.
+
+        Keyword arguments:
+        image - The image.
+        """
+        parts = image.split(ImageSkeleton.slotDelimiter)
+        for i in range(1, len(parts), 2) :
+            parts[i] = int(parts[i])
+        return ImageSkeleton(parts)
+
+    @staticmethod
+    def slot(index) :
+        """Formats the placeholder for a slot.
+
+        Keyword arguments:
+        index - The index of the value that fills the slot.
+        """
+        return ImageSkeleton.slotDelimiter + str(index) + ImageSkeleton.slotDelimiter
+
+    def fill(self, values) :
+        """Fills the slots with values, returning the image.
+
+        Keyword arguments:
+        values - A list of the values, as strings.
+        """
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2) :
+            parts[i] = values[parts[i]]
+        return "".join(parts)
+
+    def patch(self, image, values) :
+        """Patches an image that was filled from this skeleton with new
+        values, replacing only the values that changed, and returning
+        the patched image, which is identical to filling the skeleton with
+        the new values. Returns None if the image wasn't filled from this
+        skeleton (e.g., if it has a different layout), or if the values
+        can't be located unambiguously because two slots are adjacent.
+
+        Keyword arguments:
+        image - The image.
+        values - A list of the new values, as strings.
+        """
+        parts = self._parts
+        if not image.startswith(parts[0]) :
+            return None
+        # Locates each value by the literal svg that follows it. If an old
+        # value contains that literal, it is split at the wrong place, but
+        # the spans still alternate with the literals, so replacing each span
+        # that differs from its new value still produces the filled skeleton.
+        spans = []
+        start = len(parts[0])
+        for i in range(1, len(parts), 2) :
+            literal = parts[i+1]
+            # A value followed immediately by another value can't be
+            # told apart from it.
+            if len(literal) == 0 :
+                return None
+            if i + 2 < len(parts) :
+                end = image.find(literal, start)
+            elif image.endswith(literal) :
+                end = len(image) - len(literal)
+            else :
+                end = -1
+            if end < start :
+                return None
+            spans.append((parts[i], start, end))
+            start = end + len(literal)
+        # The literals could also be found in an image that merely contains
+        # them, so verifies that the image is exactly the filled skeleton.
+        if start != len(image) :
+            return None
+        patched = []
+        copied = 0
+        for index, start, end in spans :
+            if image[start:end] != values[index] :
+                patched.append(image[copied:start])
+                patched.append(values[index])
+                copied = end
+        if copied == 0 :
+            return image
+        patched.append(image[copied:])
+        return "".join(patched)
+
+    def getParts(self) :
+        """Gets the list of literal svg and slot indexes."""
+        return self._parts
+
+class SkeletonCache :
+    """A thread-safe cache of image skeletons, keyed by everything
+    that determines the static parts of an image, which evicts the
+    least recently used skeleton when full. It can be persisted
+    between runs.
+    """
+
+    __slots__ = [
+        '_skeletons',
+        '_maxSize',
+        '_lock'
+        ]
+
+    def __init__(self, maxSize=256, skeletons=None) :
+        """Initializes the cache.
+
+        Keyword arguments:
+        maxSize - The maximum number of skeletons in the cache.
+        skeletons - A dictionary mapping keys to skeletons, in order
+            from least to most recently used.
+        """
+        self._maxSize = maxSize
+        self._skeletons = OrderedDict(skeletons) if skeletons != None else OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def load(filename, maxSize=256) :
+        """Loads a cache from a file. If the file doesn't exist
+        or can't be parsed, this returns an empty cache.
+
+        Keyword arguments:
+        filename - The filename of the cache, with complete path.
+        maxSize - The maximum number of skeletons in the cache.
+        """
+        try :
+            with open(filename, "r", encoding="UTF-8") as f :
+                data = json.load(f)
+            return SkeletonCache(
+                maxSize,
+                [ (key, ImageSkeleton(parts)) for key, parts in data[-maxSize:] ]
+                )
+        except (IOError, ValueError, TypeError) :
+            return SkeletonCache(maxSize)
+
+    def save(self, filename) :
+        """Saves the cache to a file, creating any missing directories from the path.
+        The file is replaced atomically so that an interrupted run can't leave
+        a truncated cache behind.
+
+        Keyword arguments:
+        filename - The filename of the cache, with complete path.
+        """
+        with self._lock :
+            data = [ [key, skeleton.getParts()] for key, skeleton in self._skeletons.items() ]
+        directoryName = os.path.dirname(filename)
+        if len(directoryName) > 0 :
+            os.makedirs(directoryName, exist_ok=True, mode=0o777)
+        tempFilename = filename + ".tmp"
+        with open(tempFilename, "w", encoding="UTF-8") as f :
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tempFilename, filename)
+
+    def get(self, key) :
+        """Gets the skeleton for a key, or None if it isn't cached.
+
+        Keyword arguments:
+        key - The key.
+        """
+        with self._lock :
+            skeleton = self._skeletons.get(key)
+            if skeleton != None :
+                self._skeletons.move_to_end(key)
+            return skeleton
+
+    def put(self, key, skeleton) :
+        """Adds a skeleton to the cache.
+
+        Keyword arguments:
+        key - The key.
+        skeleton - The skeleton.
+        """
+        with self._lock :
+            self._skeletons[key] = skeleton
+            self._skeletons.move_to_end(key)
+            while len(self._skeletons) > self._maxSize :
+                self._skeletons.popitem(last=False)
+
+    def __len__(self) :
+        """Gets the number of skeletons in the cache."""
+        with self._lock :
+            return len(self._skeletons)
@@ -0,0 +1,97 @@
+#
+# user-statistician: Github action for generating a user stats card
+# 
+# Copyright (c) 2022 Vincent A Cicirello
+# https://www.cicirello.org/
+#
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import threading
+
+class InternTable :
+    """A table of interned strings, such as language names and colors,
+    with optional integer ids. Interning the strings parsed from the
+    query results means that in a process that parses the stats of many
+    users, only one copy of each distinct string is kept, and dict lookups
+    of interned strings are cheaper (their hashes are cached, and equal
+    keys are usually identical objects).
+    """
+
+    __slots__ = [
+        '_ids',
+        '_strings',
+        '_lock'
+        ]
+
+    def __init__(self) :
+        """Initializes an empty table."""
+        self._ids = {}
+        self._strings = []
+        self._lock = threading.Lock()
+
+    def intern(self, s) :
+        """Returns the table's copy of a string, adding
+        it to the table if it isn't already present.
+
+        Keyword arguments:
+        s - The string, which may be None, in which case None is returned.
+        """
+        if s == None :
+            return None
+        i = self._ids.get(s)
+        if i == None :
+            i = self.getId(s)
+        return self._strings[i]
+
+    def getId(self, s) :
+        """Returns the integer id of a string, adding it to the
+        table if it isn't already present. Ids are assigned
+        consecutively starting from 0.
+
+        Keyword arguments:
+        s - The string.
+        """
+        i = self._ids.get(s)
+        if i == None :
+            with self._lock :
+                i = self._ids.get(s)
+                if i == None :
+                    i = len(self._strings)
+                    self._strings.append(s)
+                    self._ids[s] = i
+        return i
+
+    def getString(self, i) :
+        """Returns the string with a given id.
+
+        Keyword arguments:
+        i - The id.
+        """
+        return self._strings[i]
+
+    def __len__(self) :
+        """Gets the number of distinct strings in the table."""
+        return len(self._strings)
+
+# The table shared by default by all of the stats parsed in a process.
+sharedInternTable = InternTable()
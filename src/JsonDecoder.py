@@ -0,0 +1,179 @@
+#
+# user-statistician: Github action for generating a user stats card
+# 
+# Copyright (c) 2022 Vincent A Cicirello
+# https://www.cicirello.org/
+#
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+
+# Use a faster decoder if one is installed, otherwise Python's json module.
+# Both decode directly from bytes.
+try :
+    import orjson
+    _loads = orjson.loads
+    decoderName = "orjson"
+except ImportError :
+    _loads = json.loads
+    decoderName = "json"
+
+# Separator between the pages of results that the GitHub CLI
+# outputs when paginating, which simply concatenates the pages.
+_pageSeparator = b'}{"data"'
+
+class CompactRecord(tuple) :
+    """A compact, immutable, alternative to a dict for JSON objects.
+    The values are stored in a tuple, and the keys are shared by all
+    records with the same keys. It supports the read-only parts of the
+    dict interface that the parser uses: indexing by key, in, get,
+    keys, values, and items.
+    """
+
+    __slots__ = ()
+
+    # Maps keys to indexes. Each set of keys has its own subclass.
+    _index = {}
+
+    def __getitem__(self, key) :
+        return tuple.__getitem__(self, self._index[key])
+
+    def __contains__(self, key) :
+        return key in self._index
+
+    def get(self, key, default=None) :
+        """Gets the value for a key, or the default if there is no such key.
+
+        Keyword arguments:
+        key - The key.
+        default - The value if the key is not present.
+        """
+        i = self._index.get(key)
+        return default if i == None else tuple.__getitem__(self, i)
+
+    def keys(self) :
+        """Gets the keys."""
+        return self._index.keys()
+
+    def values(self) :
+        """Gets the values."""
+        return tuple.__iter__(self)
+
+    def items(self) :
+        """Gets the key, value pairs."""
+        return zip(self._index.keys(), tuple.__iter__(self))
+
+    def __repr__(self) :
+        return repr(dict(self.items()))
+
+# Cache of CompactRecord subclasses by tuple of keys.
+_recordTypes = {}
+
+def _recordType(keys) :
+    """Gets the CompactRecord subclass for a tuple of keys.
+
+    Keyword arguments:
+    keys - The tuple of keys.
+    """
+    recordType = _recordTypes.get(keys)
+    if recordType == None :
+        recordType = type(
+            "CompactRecord",
+            (CompactRecord,),
+            { "__slots__" : (), "_index" : { k : i for i, k in enumerate(keys) } }
+            )
+        recordType = _recordTypes.setdefault(keys, recordType)
+    return recordType
+
+def _recordFromPairs(pairs) :
+    """Object pairs hook for Python's json module that
+    creates a CompactRecord.
+
+    Keyword arguments:
+    pairs - A list of key, value pairs.
+    """
+    return _recordType(tuple(k for k, v in pairs))(v for k, v in pairs)
+
+def _compact(obj) :
+    """Recursively converts the dicts of a decoded JSON document
+    into CompactRecords.
+
+    Keyword arguments:
+    obj - The decoded JSON document.
+    """
+    if isinstance(obj, dict) :
+        return _recordType(tuple(obj))(_compact(v) for v in obj.values())
+    elif isinstance(obj, list) :
+        return [ _compact(x) for x in obj ]
+    return obj
+
+def toPlain(obj) :
+    """Recursively converts any CompactRecords within a decoded
+    JSON document back to dicts, such as prior to encoding it as JSON.
+
+    Keyword arguments:
+    obj - The decoded JSON document.
+    """
+    if isinstance(obj, CompactRecord) :
+        return { k : toPlain(v) for k, v in obj.items() }
+    elif isinstance(obj, dict) :
+        return { k : toPlain(v) for k, v in obj.items() }
+    elif isinstance(obj, list) :
+        return [ toPlain(x) for x in obj ]
+    return obj
+
+def decode(data, compact=False) :
+    """Decodes a JSON document from bytes.
+
+    Keyword arguments:
+    data - The bytes to decode.
+    compact - If True, JSON objects are decoded into CompactRecords rather than dicts.
+    """
+    if not compact :
+        return _loads(data)
+    if decoderName == "json" :
+        return json.loads(data, object_pairs_hook=_recordFromPairs)
+    return _compact(_loads(data))
+
+def decodePages(data, compact=False) :
+    """Decodes the concatenated pages of results that the GitHub CLI outputs
+    when paginating a query, and returns a list of the pages. Each page is decoded
+    directly from its slice of the bytes, rather than copying all of them into
+    a JSON array.
+
+    Keyword arguments:
+    data - The bytes to decode.
+    compact - If True, JSON objects are decoded into CompactRecords rather than dicts.
+    """
+    # Python's json module can't decode a memoryview, but others can do
+    # so without copying.
+    view = data if decoderName == "json" else memoryview(data)
+    pages = []
+    start = 0
+    end = data.find(_pageSeparator)
+    while end >= 0 :
+        pages.append(decode(view[start:end+1], compact))
+        start = end + 1
+        end = data.find(_pageSeparator, start)
+    pages.append(decode(view[start:], compact))
+    return pages
@@ -0,0 +1,659 @@
+#
+# user-statistician: Github action for generating a user stats card
+#
+# GENERATED FILE: Do not edit. Generated by util/LabelWidths.py
+# from the labels in StatConfig.py.
+#
+
+# Maps each static label and heading, in all supported locales,
+# to its length in DejaVu Sans 110pt font.
+labelWidths = {'A patrocinar': 676,
+'A seguir': 452,
+'Abonnements': 765,
+'Abonnés': 477,
+'Algemene statistieken en info': 1649,
+'All': 137,
+'Alle': 205,
+'Alles': 262,
+'Allgemeine Statistiken und Informationen': 2297,
+'An alăturat': 613,
+'Anno Scorso': 683,
+'Anno di Iscrizione': 972,
+"Année d'adhésion": 986,
+'Ano de Inscrição': 909,
+'Anul trecut': 610,
+'Archivado': 550,
+'Archived': 484,
+'Archiviato': 554,
+'Archiviert': 533,
+'Archiválva': 576,
+'Archivé': 414,
+'Archyvuota': 627,
+'Arhivat': 396,
+'Arhive': 354,
+'Arhivele mele': 762,
+'Arkivert': 436,
+'Arquivados': 617,
+'Arşivlenmiş': 638,
+'Avaliação de Pull Requests': 1480,
+'Año de ingreso': 828,
+'Año pasado': 645,
+'Beigetragen Zu': 855,
+'Beitrittsdatum': 793,
+'Beiträge': 467,
+'Bendra statistika ir informacija': 1694,
+'Berkontribusi Ke': 911,
+'Bidrag': 358,
+'Bidro til': 428,
+'Bifurcado Por': 738,
+'Bifurcado por': 742,
+'Bifurcat de': 603,
+'Bijdragen': 527,
+'Bijgedragen aan': 904,
+'Ble med i år': 668,
+'Broj forkovanja': 835,
+'Ca urmare a': 683,
+'Cel mai marcat Repo': 1156,
+'Cloné par': 531,
+'Com Estrela De': 855,
+'Commitok': 563,
+'Commits': 489,
+'Commity': 497,
+'Con estrella por': 877,
+'Contribuciones': 826,
+'Contribuciones privadas': 1333,
+'Contribuido a': 743,
+'Contribuit la': 680,
+'Contribuito A': 724,
+'Contribuiu Para': 854,
+'Contribuições': 756,
+'Contribuições Privadas': 1259,
+'Contributed To': 823,
+'Contributi': 547,
+'Contributi Privati': 930,
+'Contributions': 741,
+'Contributions in the Past Year': 1644,
+'Contributions privées': 1180,
+'Contributions ส่วนตัว': 1318.3056214019643,
+'Contribué à': 643,
+'Contribuții': 578,
+'Contribuții private': 1002,
+'Csatlakozás éve': 891,
+'Csillagozta': 599,
+'Depolar': 434,
+'Depozitele': 589,
+'Dernière année': 858,
+'Di-fork oleh': 642,
+'Diarsipkan': 587,
+'Diberikan bintang oleh': 1258,
+'Dilihat oleh': 629,
+'Distribución de lenguajes en repositorios públicos': 2747,
+'Distribuição de Linguagens em Repositórios Públicos': 2910,
+'Distribusi Bahasa dalam Repositori Publik': 2292,
+'Distribuzione del Linguaggio nei Repository Pubblici': 2864,
+'Distribuția limbii în arhivele publice': 1960,
+'Dit jaar': 405,
+'Dodeljenih zvezdica': 1103,
+'Doprinosi': 523,
+'Dépôt en vedette': 966,
+'Dépôt le plus cloné': 1061,
+'Dépôt le plus étoilé': 1073,
+'Dépôts': 390,
+'Dépôts possédés': 939,
+'Eigene Repositories': 1092,
+'Elmúlt év': 520,
+'En Çatallı Repo': 838,
+'En Çok Yıldızlı Repo': 1085,
+'Estadísticas generales e información': 2024,
+'Estatísticas Gerais e Informações': 1831,
+'Featured Repo': 810,
+'Figyeli': 359,
+'Folgt': 274,
+'Follower': 463,
+'Followers': 519,
+'Following': 520,
+'Forgrenet av': 706,
+'Forkato Da': 603,
+'Forked By': 552,
+'Forkolta': 447,
+'Fork가 가장 많이된 저장소': 1041.2500846596681,
+'Fork된 횟수': 506.416694886556,
+'Forrige år': 537,
+'Framhevet kodebase': 1162,
+'Følger': 345,
+'Følgere': 412,
+'Gearchiveerd': 742,
+'Geforkt Von': 658,
+'Geforkt door': 696,
+'Genel Depolarda Dil Dağılımı': 1597,
+'Genel İstatistikler ve Bilgiler': 1555,
+'General Stats and Info': 1234,
+'Generell statistikk og info': 1415,
+'Gesamt': 427,
+'Gesponsord': 656,
+'Gevolgd door': 741,
+'Geçen sene': 649,
+'Godina pristupa': 878,
+'Ikke-forgreninger': 957,
+'Info dan Status Umum': 1235,
+'Issue-k': 388,
+'Issues': 341,
+'Isu': 159,
+'Izabrani repozitorij': 1031,
+'Jaar van aanmelding': 1140,
+'Kalbu pasiskirstymas viešosiose repozitorijose': 2549,
+'Katkıda Bulunanlar': 1046,
+'Katkılar': 421,
+'Katıldığı Yıl': 611,
+'Kiemelt repo': 705,
+'Klonuota': 487,
+'Kodebase med flest forgreninger': 1816,
+'Kodebase med flest stjerner': 1555,
+'Kodebaser': 585,
+'Komiti': 351,
+'Kontribusi': 556,
+'Kontribusi Pribadi': 971,
+'Kontribúciók': 690,
+'Kontribútolt': 652,
+'Kontrybucje': 661,
+'Kontrybuował Do': 945,
+'Követi': 346,
+'Követői': 413,
+'Labiausiai klonuota repozitorija': 1724,
+'Labiausiai pažymėta repozitorija': 1790,
+'Language Distribution in Public Repositories': 2435,
+'Legtöbbet csillagozott repo': 1505,
+'Legtöbbet fork-olt repo': 1277,
+'Letztes Jahr': 648,
+'Lični repozitoriji': 875,
+'Maler': 307,
+'Markiert Von': 705,
+'Meistgeforktes Repo': 1131,
+'Meistmarkiertes Repo': 1205,
+'Mengikuti': 542,
+'Mensponsori': 697,
+'Mijn Repositories': 942,
+'Mind': 266,
+'Mine kodebaser': 876,
+'Modelli': 393,
+'Modelos': 455,
+'Modèles': 456,
+'Most Forked Repo': 990,
+'Most Starred Repo': 1021,
+'My Repositories': 875,
+'Najczęściej Forkowane Repozytoria': 1941,
+'Najviše forkovan repo': 1205,
+'Najviše zvezdica na repou': 1440,
+'Ne-forkovani': 705,
+'Neklonuotos': 686,
+'No bifurcados': 760,
+'Non Fork': 493,
+'Non clonés': 607,
+'Non-Fork': 498,
+'Non-Fork-ok': 670,
+'Non-Forks': 555,
+'Non-bifurcatii': 746,
+'Nyelvek eloszlása nyilvános repository-kban': 2443,
+'Obserwowane przez': 1113,
+'Obserwowani': 742,
+'Obserwujący': 710,
+'Ogólne statystyki i informacje': 1649,
+'Opšta statistika i informacije': 1579,
+'Ostatni rok': 609,
+'Overvåket av': 739,
+'Past Year': 516,
+'Patrocinado': 653,
+'Patrocinadores': 823,
+'Patrocinando': 723,
+'Pažymėta': 541,
+'Pengikut': 482,
+'Plantillas': 494,
+'Polecane repozytorium': 1268,
+'Polubione przez': 874,
+'Posiadane Repozytoria': 1255,
+'Praeitais metais': 883,
+'Prati': 252,
+'Pratilaca': 477,
+'Pregledi': 449,
+'Priklausančios repozitorijos': 1498,
+'Prisidėjo prie': 717,
+'Prisijungimo metai': 1027,
+'Private Beiträge': 887,
+'Private Contributions': 1161,
+'Private bidrag': 773,
+'Privatni doprinosi': 961,
+'Privatūs įnašai': 802,
+'Prive Bijdragen': 837,
+'Privát kontribúciók': 1034,
+'Problemas': 578,
+'Probleme': 522,
+'Problemen': 592,
+'Problemi': 485,
+'Problemos': 578,
+'Problemy': 519,
+'Prošla godina': 743,
+'Prywatne Kontrybucje': 1210,
+'Pul zahtevi': 604,
+'Pull Prašymai': 738,
+'Pull Request Recensies': 1275,
+'Pull Request Reviews': 1175,
+'Pull Request-vurderinger': 1373,
+'Pull Requests': 742,
+'Pull Requesty': 750,
+'Pull prašymų peržiūros': 1260,
+'Pull request review-k': 1160,
+'Pull request-ek': 826,
+'Recenzii Pull Request': 1182,
+'Recenzje Pull Requestów': 1376,
+'Regardé par': 682,
+'Remiama': 523,
+'Remėjai': 450,
+'Repo cel mai bifurcat': 1175,
+'Repo con più Fork': 993,
+'Repo con più Stelle': 1065,
+'Repo in Primo Piano': 1104,
+'Repo recomandate': 1048,
+'Repo ทั้งหมดของฉัน': 1323.1390111750763,
+'Repo ที่ติดดาวมากที่สุด': 1710.500169319337,
+'Repo ที่มีการ Fork มากที่สุด': 1942.027937690485,
+'Repo ที่โดดเด่น': 1090.72231628852,
+'Repositori': 555,
+'Repositori Unggulan': 1119,
+'Repositori dengan Bintang Terbanyak': 2084,
+'Repositori dengan Fork Terbanyak': 1897,
+'Repositori yang Dimiliki': 1308,
+'Repositories': 680,
+'Repositorio con más estrellas': 1622,
+'Repositorio destacado': 1226,
+'Repositorio más bifurcado': 1442,
+'Repositorios': 679,
+'Repositorios propios': 1121,
+'Repository': 589,
+'Repository di Proprietà': 1262,
+'Repository met meeste forks': 1595,
+'Repository met meeste sterren': 1719,
+'Repository-k': 693,
+'Repositório com mais estrelas': 1659,
+'Repositório em Primeiro Plano': 1663,
+'Repositório mais bifurcado': 1473,
+'Repositórios': 679,
+'Repositórios Possuídos': 1256,
+'Repozitoriji': 618,
+'Repozitorijos': 711,
+'Repozytoria': 657,
+'Repozytoria z największą ilością gwiazdek': 2320,
+'Revisiones de Pull Requests': 1540,
+'Revisioni di Richieste di Pull': 1540,
+'Revizije pul zahteva': 1107,
+'Richieste di Pull': 873,
+'Rok Dołączenia': 847,
+'Rozkład języków w Repozytoriach Publicznych': 2545,
+'Répartition des langages dans les dépôts publiques': 2848,
+'Révision de Pull Request': 1358,
+'Sablonlar': 519,
+'Sablonok': 506,
+'Sahip Olunan Depolar': 1207,
+'Saját repository-k': 975,
+'Saker': 315,
+'Seguaci': 436,
+'Seguendo': 553,
+'Seguidores': 616,
+'Seguito Da': 606,
+'Sekama': 443,
+'Sekėjai': 401,
+'Sem Forks': 576,
+'Semua': 382,
+'Sforkowane przez': 981,
+'Siguiendo': 547,
+'Siūloma repozitorija': 1101,
+'Sjablonen': 544,
+'Solicitări de tragere': 1090,
+'Sorunlar': 466,
+'Sponser': 448,
+'Sponsor': 447,
+'Sponsoren': 584,
+'Sponsorer': 560,
+'Sponsori': 477,
+'Sponsoring': 617,
+'Sponsorise': 602,
+'Sponsorizare': 715,
+'Sponsorizza': 660,
+'Sponsorlar': 590,
+'Sponsorluk': 611,
+'Sponsors': 503,
+'Sponsorzy': 569,
+'Sponzori': 478,
+'Sponzoriše': 603,
+'Språkdistribusjon i offentlige kodebaser': 2197,
+'Starred By': 583,
+'Star를 가장 많이 받은 저장소': 1140.7223162885202,
+'Statistiche Generali e Informazioni': 1905,
+'Statistici generale și informații': 1687,
+'Statistiques Générales et Info': 1633,
+'Stebima': 456,
+'Stellato Da': 607,
+'Ster gegeven door': 1025,
+'Stjernemerket av': 957,
+'Svi': 166,
+'Szablony': 498,
+'Szponzorok': 636,
+'Szponzorál': 603,
+'Taahhütler': 600,
+'Tahun Bergabung': 985,
+'Tahun Lalu': 609,
+'Takip etmek': 685,
+'Takipçiler': 536,
+'Talen distributies in Publieke Repositories': 2309,
+'Tarafından yıldız': 917,
+'Tarafından çatallandı': 1168,
+'Template': 522,
+'Templates': 579,
+'Toate': 313,
+'Todos': 329,
+'Top Repositories': 920,
+'Totaal': 343,
+'Total': 276,
+'Totale': 344,
+'Totalt': 319,
+'Tout': 248,
+'Tutti': 255,
+'Tüm': 245,
+'Uitgelichte repository': 1189,
+'Ukupno': 422,
+'Ulasan Pull Request': 1093,
+'Urmaritori': 562,
+'Verfolgt Von': 685,
+'Verteilung der Sprachen in Öffentlichen Repositories': 2906,
+'Viso': 230,
+'Visos': 287,
+'Visto Por': 487,
+'Visto por': 491,
+'Vizionat de': 615,
+'Volgend': 451,
+'Volgers': 413,
+'Vorgestelltes Repo': 1039,
+'Vorlagen': 493,
+'Watched By': 662,
+'Watch된 횟수': 616.416694886556,
+'Wszystkie': 552,
+'Year Joined': 621,
+'Zarchiwizowane': 889,
+'Zastupljenost jezika u javnim repozitorijima': 2410,
+'Általános statisztika és információ': 1883,
+'Çatalsız': 431,
+'Çekme İstekleri': 858,
+'Étoilé par': 528,
+'Înscris de': 526,
+'Öne Çıkan Repo': 885,
+'Összesen': 522,
+'Özel Katkılar': 700,
+'Último ano': 599,
+'Überprüfungen von Pull Requests': 1850,
+'Įnašai': 324,
+'İstek İncelemelerini Çekin': 1424,
+'İzleyen': 392,
+'Šablonai': 473,
+'Šabloni': 406,
+'Șabloane': 510,
+'Без форков': 665,
+'Без форків': 629,
+'Вибрані ререпозиторії': 1298,
+'Використання мов у загальнодоступних репозиторіях': 3146,
+'Власні репозиторії': 1081,
+'Внески': 412,
+'Все': 203,
+'Всего': 328,
+'Всього': 392,
+'Всі': 166,
+'Відмітили': 572,
+'Год начала работы на гитхабе': 1781,
+'За останній рік': 879,
+'За последный год': 1052,
+'Заархивированный': 1118,
+'Заархівовано': 774,
+'Загальна статистика та інформація': 2083,
+'Избранное репо': 936,
+'Использование языков в общедоступных репозиториях': 3242,
+'Клонирован': 699,
+'Клонували': 625,
+'Коммиты': 533,
+'Комміти': 477,
+'Наблюдатели': 797,
+'Найбільш клонований репозиторій': 2023,
+'Найпопулярніший репозиторій': 1793,
+'Общая статистика и информация': 1958,
+'Огляди пулл реквестів': 1332,
+'Отметили': 578,
+'Подписан': 568,
+'Подписчики': 702,
+'Приватна участь': 980,
+'Проблеми': 580,
+'Проблемы': 596,
+'Пулл реквести': 855,
+'Пулл реквесты': 871,
+'Підписки': 530,
+'Підписники': 673,
+'Ревьювы пулл реквестов': 1449,
+'Репозиториев': 807,
+'Репозиторіїв': 732,
+'Рік приєднання': 896,
+'Самое замеченное репо': 1397,
+'Самое клонированное репо': 1603,
+'Собственные репозитории': 1552,
+'Спонсирует': 686,
+'Спонсори': 556,
+'Спонсорство': 741,
+'Спонсоры': 572,
+'Участие': 462,
+'Участие в': 562,
+'Участь в': 488,
+'Частное участие': 968,
+'Шаблони': 533,
+'Шаблоны': 549,
+'अनुगामी': 542.3056214019641,
+'अनुरोध': 464.83338977311206,
+'अनुरोध समीक्षा': 1042.1390111750761,
+'अपना भंडार': 732.2500846596681,
+'आकार पट्ट': 654.7778530308161,
+'किसके द्वारा तारांकित': 1541.9724009481888,
+'किसके द्वारा देखा गया': 1499.5001693193367,
+'किसके द्वारा फोर्क किया गया': 1921.8613274635973,
+'कुल': 232.41669488655606,
+'गुप्त योगदान': 887.1945479173721,
+'गैर-फोर्क': 659.7778530308161,
+'पिछला वर्ष': 732.2500846596681,
+'प्रतिबद्ध': 697.2500846596681,
+'प्रायोजक': 619.7778530308161,
+'प्रायोजन': 619.7778530308161,
+'भंडार': 387.36115814426006,
+'मुद्दे': 464.83338977311206,
+'युक्त होने का वर्ष': 1267.0834744327806,
+'योगदान': 464.83338977311206,
+'विशेष रुप से प्रदर्शित भंडार': 1999.3335590924496,
+'संग्रहीत': 619.7778530308161,
+'सभी': 232.41669488655606,
+'समर्थक': 464.83338977311206,
+'सर्वाधिक तारांकित भंडार': 1696.916864205893,
+'सर्वाधिक फोर्क भंडार': 1464.5001693193367,
+'साधारण सांख्यिकी और सूचना': 1809.3890958347451,
+'सार्वजनिक भंडारों में भाषा वितरण': 2309.222485607858,
+'অ-কাঁটা': 504.83338977311206,
+'অনুরোধ টানার পর্যালোচনাগুলি': 2006.8057907213015,
+'অনুরোধগুলি টানুন': 1197.0834744327803,
+'অনুসরণ করছে': 809.7223162885201,
+'অনুসারী': 542.3056214019641,
+'অবদান': 387.36115814426006,
+'অবদানসমূহ': 697.2500846596681,
+'ইস্যু': 387.36115814426006,
+'কমিট করে': 577.3056214019641,
+'টেমপ্লেট সমুহ': 964.6667795462241,
+'তারকা প্রদান করেছে': 1309.5557060616325,
+'দেখেছেন': 542.3056214019641,
+'পৃষ্ঠপোষক': 697.2500846596681,
+'পৃষ্ঠপোষকতা': 852.1945479173721,
+'প্রকাশ্য ভান্ডারে ভাষা বিতরণ': 2041.8057907213015,
+'ফোর্ক করেছে': 809.7223162885201,
+'বিগত বছর': 577.3056214019641,
+'বৈশিষ্ট্যযুক্ত রেপো': 1429.5001693193367,
+'ব্যক্তিগত অবদান': 1119.6112428039282,
+'ভাণ্ডার মালিকানাধীন': 1429.5001693193367,
+'মোট': 232.41669488655606,
+'যোগদানের বছর': 887.1945479173721,
+'সংগ্রহস্থল': 774.7223162885201,
+'সংরক্ষণাগারভুক্ত': 1239.5557060616325,
+'সব': 154.94446325770403,
+'সর্বাধিক তারকা প্রাপ্ত রেপো': 1964.3335590924494,
+'সর্বাধিক ফর্কড রেপো': 1387.0279376904846,
+'সাধারণ পরিসংখ্যান এবং তথ্য': 1886.8613274635973,
+'ଅଣ-ଫର୍କସ୍': 659.7778530308161,
+'ଅଧିକାଂଶ ଫୋର୍କଡ୍ ରେପୋ': 1464.5001693193367,
+'ଅନୁରୋଧ ଟାଣନ୍ତୁ': 1042.1390111750761,
+'ଅନୁରୋଧ ସମୀକ୍ଷାଗୁଡିକ ଟାଣନ୍ତୁ': 2006.8057907213015,
+'ଅନୁସରଣକାରୀ': 774.7223162885201,
+'ଅବଦାନ': 387.36115814426006,
+'ଟେମ୍ପଲେଟ୍': 697.2500846596681,
+'ଦେଖିଲା': 464.83338977311206,
+'ଦ୍ୱାରା କଣ୍ଟା ହୋଇଛି': 1309.5557060616325,
+'ନିମ୍ନଲିଖିତ': 774.7223162885201,
+'ପ୍ରତିବଦ୍ଧତା': 852.1945479173721,
+'ପ୍ରଯୋଜକ': 542.3056214019641,
+'ପ୍ରାୟୋଜକ': 619.7778530308161,
+'ବର୍ଷ ଯୋଗଦାନ': 809.7223162885201,
+'ବିଗତ ବର୍ଷ': 654.7778530308161,
+'ବୈଶିଷ୍ଟ୍ୟ ରେପୋ': 1042.1390111750761,
+'ବ୍ୟକ୍ତିଗତ ଅବଦାନ': 1119.6112428039282,
+'ମୋଟ': 232.41669488655606,
+'ମୋର ସଂଗ୍ରହାଳୟ': 964.6667795462241,
+'ଯୋଗଦାନ': 464.83338977311206,
+'ଷ୍ଟାର୍ ହୋଇଥିବା': 1042.1390111750761,
+'ସଂଗୃହିତ': 542.3056214019641,
+'ସଂଗ୍ରହାଳୟ': 697.2500846596681,
+'ସମସ୍ତ': 387.36115814426006,
+'ସମସ୍ୟାଗୁଡିକ': 852.1945479173721,
+'ସର୍ବସାଧାରଣ ସଂଗ୍ରହାଳୟରେ ଭାଷା ବଣ୍ଟନ': 2429.166948865562,
+'ସର୍ବାଧିକ ତାରକା ରେପୋ': 1387.0279376904846,
+'ସାଧାରଣ ପରିସଂଖ୍ୟାନ ଏବଂ ସୂଚନା': 1964.3335590924494,
+'กำลังติดตาม': 852.1945479173721,
+'กำลังสนับสนุน': 1007.1390111750761,
+'คอมมิท': 464.83338977311206,
+'ติดดาวทั้งหมด': 1007.1390111750761,
+'ที่ไม่ใช่ Fork': 971.2500846596681,
+'ปัญหา': 387.36115814426006,
+'ปีที่เข้าร่วม': 1007.1390111750761,
+'ปีที่แล้ว': 697.2500846596681,
+'ผู้ติดตาม': 697.2500846596681,
+'ผู้สนับสนุน': 852.1945479173721,
+'ภาษาที่ใช้ใน Repo สาธารณะ': 1822.9724009481888,
+'มีการ Fork ทั้งหมด': 1238.6667795462245,
+'มีการช่วยไปแล้ว': 1162.0834744327803,
+'รวมทั้งหมด': 774.7223162885201,
+'รีวิว Pull Request': 1107.3611581442601,
+'สถิติและข้อมูลทั่วไป': 1549.444632577041,
+'เก็บถาวร': 619.7778530308161,
+'เทมเพลตแม่แบบ': 1007.1390111750761,
+'ᱚᱨ ᱱᱮᱦᱚᱨ ᱧᱮᱞᱯᱚᱨᱚᱠᱷ ᱠᱚ': 1499.5001693193367,
+'ᱚᱨ ᱱᱮᱦᱚᱨᱠᱚ': 732.2500846596681,
+'ᱛᱤᱱᱹᱜ ᱠᱚ ᱧᱮᱞ ᱠᱟᱫᱟ': 1189.6112428039285,
+'ᱜᱟᱵᱟᱱᱮᱱᱟ': 619.7778530308161,
+'ᱜᱩᱫᱟᱢ': 387.36115814426006,
+'ᱡᱟᱹᱥᱛᱤ ᱱᱚᱠᱚᱞ ᱠᱟᱱ ᱜᱚᱫᱟᱢ': 1576.9724009481888,
+'ᱡᱷᱚᱛᱚ ᱠᱷᱚᱱ ᱰᱷᱮᱨ ᱪᱤᱱᱦᱟᱹ ᱦᱟᱜ ᱜᱩᱫᱟᱹᱢ': 2344.222485607858,
+'ᱢᱩᱴ': 232.41669488655606,
+'ᱤᱧᱟᱜ ᱜᱩᱫᱟᱢ ᱠᱚ': 922.1945479173721,
+'ᱥᱟᱫᱷᱟᱨᱚᱬ ᱵᱟᱛᱟᱣ ᱟᱨ ᱵᱤᱵᱨᱚᱬ': 1731.916864205893,
+'ᱥᱟᱱᱟᱢ ᱜᱩᱫᱟᱢ ᱨᱮ ᱯᱟᱹᱨᱥᱤ ᱠᱚᱣᱟᱜ ᱯᱟᱥᱱᱟᱣ': 2421.69471723671,
+'ᱥᱮᱞᱮᱫ ᱥᱮᱨᱢᱟᱸ': 887.1945479173721,
+'ᱨᱚᱠᱚᱢᱚᱜ ᱠᱟᱱᱟ': 887.1945479173721,
+'ᱨᱚᱠᱚᱢᱤᱭᱟᱹ': 697.2500846596681,
+'ᱪᱟᱞᱟᱣᱮᱱ ᱥᱮᱨᱢᱟᱸ': 1042.1390111750761,
+'ᱪᱤᱱᱦᱟᱹᱤᱭᱟᱹ': 774.7223162885201,
+'ᱪᱷᱟᱸᱪᱠᱚ': 542.3056214019641,
+'ᱮᱱᱮᱢ': 309.88892651540806,
+'ᱮᱱᱮᱢᱤᱭᱟᱹᱠᱚ': 774.7223162885201,
+'ᱯᱚᱞᱚᱡᱽᱠᱚ': 619.7778530308161,
+'ᱯᱟᱧᱡᱟ ᱠᱩᱜ': 654.7778530308161,
+'ᱯᱟᱧᱡᱟ ᱮᱫᱟᱢ': 732.2500846596681,
+'ᱰᱟᱞᱟᱣᱠᱚ': 542.3056214019641,
+'ᱱᱚᱠᱚᱞᱤᱭᱟᱹ': 697.2500846596681,
+'ᱱᱤᱡᱚᱨᱟᱜ ᱩᱠᱩ ᱮᱱᱮᱢᱠᱚ': 1309.5557060616325,
+'ᱵᱤᱥᱮᱥ ᱜᱩᱫᱟᱢ': 809.7223162885201,
+'ᱵᱤᱱ ᱯᱷᱚᱨᱠ ᱠᱚ': 844.7223162885201,
+'によって見られた': 619.7778530308161,
+'によるフォーク': 542.3056214019641,
+'に貢献しました': 542.3056214019641,
+'スポンサー': 387.36115814426006,
+'フォロワー': 387.36115814426006,
+'プルリクエスト': 542.3056214019641,
+'プルリクエストレビュー': 852.1945479173721,
+'リポジトリ': 387.36115814426006,
+'レンプレート': 464.83338977311206,
+'一般的な統計と情報': 697.2500846596681,
+'主催': 154.94446325770403,
+'主演': 154.94446325770403,
+'個人的な貢献': 464.83338977311206,
+'入社年': 232.41669488655606,
+'全て': 154.94446325770403,
+'公開リポジトリでの言語配布': 1007.1390111750761,
+'合計': 154.94446325770403,
+'問題': 154.94446325770403,
+'専念': 154.94446325770403,
+'所有リポジトリ': 542.3056214019641,
+'昨年': 154.94446325770403,
+'最もスター付きのリポジトリ': 1007.1390111750761,
+'最もフォークされたリポジトリ': 1084.6112428039282,
+'注目のリポジトリ': 619.7778530308161,
+'続く': 154.94446325770403,
+'記録': 154.94446325770403,
+'貢献': 154.94446325770403,
+'非フォーク': 387.36115814426006,
+'가입 년도': 344.88892651540806,
+'공개 저장소 사용 언어 분포': 992.1945479173721,
+'기여': 154.94446325770403,
+'기여 횟수': 344.88892651540806,
+'리뷰': 154.94446325770403,
+'모두': 154.94446325770403,
+'받은 Star': 415.944463257704,
+'보관 처리된(Archived) 저장소': 1259.7778530308165,
+'보유한 저장소': 499.83338977311206,
+'비공개': 232.41669488655606,
+'이슈': 154.94446325770403,
+'저장소': 232.41669488655606,
+'지난해': 232.41669488655606,
+'직접 만든(Non-Forks)': 985.888926515408,
+'총': 77.47223162885201,
+'추천 저장소': 422.36115814426006,
+'커밋': 154.94446325770403,
+'템플릿': 232.41669488655606,
+'통계 및 정보': 457.36115814426006,
+'팔로워': 232.41669488655606,
+'팔로잉': 232.41669488655606,
+'풀 리퀘스트': 422.36115814426006,
+'후원받은': 309.88892651540806,
+'후원하는': 309.88892651540806}
+
+# Maps each locale to the lengths in DejaVu Sans 110pt font of
+# the parts of its title template before and after the name.
+titleTemplateWidths = {'bn': (0, 1422.0279376904848),
+'de': (0, 971),
+'en': (0, 952),
+'es': (1310, 0),
+'fr': (1041, 0),
+'hi': (0, 1189.6112428039285),
+'hu': (0, 987),
+'id': (915, 0),
+'it': (986, 0),
+'ja': (0, 973.777853030816),
+'ko': (0, 684.416694886556),
+'lt': (0, 1057),
+'nl': (0, 1159),
+'no': (0, 969),
+'or': (0, 1381.6667795462245),
+'pl': (626, 688),
+'pt': (728, 589),
+'ro': (1314, 0),
+'ru': (1339, 0),
+'sat': (0, 1619.444632577041),
+'sr': (0, 1268),
+'th': (809.7223162885201, 606.944463257704),
+'tr': (0, 1024),
+'uk': (0, 1361)}
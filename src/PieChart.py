@@ -26,13 +26,112 @@
 #
 
 import math
+import functools
 
 _headerTemplate = '<svg viewBox="0 0 {0} {0}" width="{0}" height="{0}">'
 _pathTemplate = '<path fill-rule="evenodd" fill="{0}" d="M {1},{2} A {3} {3} 0 {4} {5} {6} {7} L {3},{3} Z"/>'
+_compactPathTemplate = '<path fill="{0}" d="M{1} {2}A{3} {3} 0 {4} {5} {6} {7}L{3} {3}Z"/>'
 _circleTemplate = '<circle fill="{0}" cx="{1}" cy="{1}" r="{1}"/>'
 _animationTemplate = '<animateTransform attributeName="transform" attributeType="XML" type="rotate" from="0 {0} {0}" to="360 {0} {0}" dur="{1}s" repeatCount="indefinite"/>'
+_cssAnimationTemplate = '<style>@keyframes pie-rotate{{to{{transform:rotate(360deg)}}}}.pie-rotate{{transform-box:fill-box;transform-origin:center;animation:pie-rotate {0}s linear infinite}}@media (prefers-reduced-motion:reduce){{.pie-rotate{{animation:none}}}}</style><g class="pie-rotate">'
 
-def svgPieChart(wedges, radius, animate, speed, includeSVGHeader=False) :
+def _formatCoordinate(x, precision) :
+    """Formats a coordinate rounded to a number of digits after the
+    decimal point, without any trailing zeros.
+
+    Keyword arguments:
+    x - The coordinate.
+    precision - The number of digits after the decimal point.
+    """
+    s = "{0:.{1}f}".format(x, precision)
+    if "." in s :
+        s = s.rstrip("0").rstrip(".")
+    return "0" if s == "-0" else s
+
+@functools.lru_cache(maxsize=256)
+def _wedgeGeometry(percentages, radius, precision) :
+    """Computes the formatted endpoints and large arc flags of the
+    wedges of a pie chart, which are cached since the same charts are
+    generally drawn repeatedly, such as in different color themes.
+    Returns a tuple with a tuple (x0, y0, x1, y1, largeArc) for each wedge.
+
+    Keyword arguments:
+    percentages - A tuple of the percentages of the wedges.
+    radius - The radius of the pie chart.
+    precision - If None, the coordinates are formatted in full, and
+        otherwise they are rounded to this number of digits after the
+        decimal point.
+    """
+    # The start and end angles of the wedges.
+    angles = []
+    startPercentage = 0
+    for percentage in percentages :
+        endPercentage = startPercentage + percentage
+        angles.append((startPercentage * 2 * math.pi, endPercentage * 2 * math.pi))
+        startPercentage = endPercentage
+    # Adjustment for any possible rounding error that
+    # may have occurred when initial percentages were computed
+    # (i.e., last edge should complete a full circle).
+    angles[-1] = (angles[-1][0], 2 * math.pi)
+    geometry = []
+    for percentage, (start, end) in zip(percentages, angles) :
+        coordinates = (
+            radius + radius * math.cos(start+math.pi),
+            radius + radius * math.sin(start+math.pi),
+            radius + radius * math.cos(end+math.pi),
+            radius + radius * math.sin(end+math.pi)
+            )
+        if precision == None :
+            coordinates = tuple(str(c) for c in coordinates)
+        else :
+            coordinates = tuple(_formatCoordinate(c, precision) for c in coordinates)
+        geometry.append(coordinates + (1 if percentage >= 0.5 else 0,))
+    return tuple(geometry)
+
+def _mergeSlivers(wedges, radius, minimumArcLength) :
+    """Merges the wedges whose arcs are too short to be visible, for drawing.
+    Each run of consecutive such slivers is merged into a single wedge, which
+    is drawn in the color of the first of them if it is then long enough to
+    be visible, and otherwise is folded into the preceding wedge. Returns a
+    list of (color, percentage) tuples. The wedges are not modified.
+
+    Keyword arguments:
+    wedges - A list of Python dictionaries, with each dictionary
+        containing fields color and percentage.
+    radius - The radius of the pie chart.
+    minimumArcLength - The length, in pixels, of the shortest visible arc.
+    """
+    minimumPercentage = minimumArcLength / (2 * math.pi * radius)
+    merged = []
+    run = None
+    for w in wedges :
+        if w["percentage"] < minimumPercentage :
+            if run == None :
+                run = [w["color"], 0]
+            run[1] += w["percentage"]
+        else :
+            if run != None :
+                _endRun(merged, run, minimumPercentage)
+                run = None
+            merged.append((w["color"], w["percentage"]))
+    if run != None :
+        _endRun(merged, run, minimumPercentage)
+    return merged
+
+def _endRun(merged, run, minimumPercentage) :
+    """Adds a merged run of slivers to the merged wedges.
+
+    Keyword arguments:
+    merged - The list of (color, percentage) tuples of the merged wedges.
+    run - The color of the first sliver of the run, and the run's total percentage.
+    minimumPercentage - The percentage of the shortest visible arc.
+    """
+    if run[1] < minimumPercentage and len(merged) > 0 :
+        merged[-1] = (merged[-1][0], merged[-1][1] + run[1])
+    else :
+        merged.append((run[0], run[1]))
+
+def svgPieChart(wedges, radius, animate, speed, includeSVGHeader=False, precision=None, cssAnimation=False, minimumArcLength=0) :
     """Generates an SVG of a pie chart. The intention is to include
     as part of a larger SVG (e.g., it does not insert xmlns into the
     opening svg tag). If wedges list is empty, it retrurns None.
@@ -43,6 +142,15 @@ def svgPieChart(wedges, radius, animate, speed, includeSVGHeader=False) :
     radius - the radius, in pixels for the pie chart.
     animate - Pass True to animate the pie chart.
     speed - If animate is True, then this input is the number of seconds for one full rotation.
+    includeSVGHeader - If True, the pie chart is wrapped in an svg element.
+    precision - If None, the coordinates are formatted in full, and otherwise
+        the paths are generated in a compact form, with the coordinates
+        rounded to this number of digits after the decimal point.
+    cssAnimation - If True, and animate is True, the pie chart is animated with a
+        CSS transform animation, which browsers can composite without repainting,
+        and which stops if the viewer prefers reduced motion, rather than with SMIL.
+    minimumArcLength - Wedges whose arcs are shorter than this many pixels, which
+        can't be seen, are merged with their neighbors rather than drawn separately.
     """
     if includeSVGHeader :
         components = [_headerTemplate.format(str(2*radius))]
@@ -51,44 +159,47 @@ def svgPieChart(wedges, radius, animate, speed, includeSVGHeader=False) :
 
     if len(wedges) == 0 :
         return None
-    elif len(wedges) == 1 :
-        components.append(_circleTemplate.format(wedges[0]["color"], str(radius)))
+    if minimumArcLength > 0 :
+        wedges = _mergeSlivers(wedges, radius, minimumArcLength)
+    else :
+        wedges = [ (w["color"], w["percentage"]) for w in wedges ]
+    if len(wedges) == 1 :
+        components.append(_circleTemplate.format(wedges[0][0], str(radius)))
     else :
-        startPercentage = 0
-        for w in wedges :
-            endPercentage = startPercentage + w["percentage"]
-            w["start"] = startPercentage * 2 * math.pi
-            w["end"] = endPercentage * 2 * math.pi
-            startPercentage = endPercentage
-        # Adjustment for any possible rounding error that
-        # may have occurred when initial percentages were computed
-        # (i.e., last edge should complete a full circle).
-        wedges[-1]["end"] = 2 * math.pi
-
         if animate :
-            components.append("<g>")
-            
-        for w in wedges :
+            if cssAnimation :
+                components.append(_cssAnimationTemplate.format(speed))
+            else :
+                components.append("<g>")
+
+        # The wedges are the stats, so the geometry is computed from their
+        # percentages rather than stored in them.
+        geometry = _wedgeGeometry(tuple(w[1] for w in wedges), radius, precision)
+        # The wedges don't intersect themselves, so in the compact
+        # form, the default fill-rule is equivalent to evenodd.
+        template = _pathTemplate if precision == None else _compactPathTemplate
+        for w, (x0, y0, x1, y1, largeArc) in zip(wedges, geometry) :
             components.append(
-                _pathTemplate.format(
-                    w["color"],
-                    radius + radius * math.cos(w["start"]+math.pi),
-                    radius + radius * math.sin(w["start"]+math.pi),
+                template.format(
+                    w[0],
+                    x0,
+                    y0,
                     radius,
-                    1 if w["percentage"] >= 0.5 else 0, # large arc flag
+                    largeArc,
                     1, # clockwise=1
-                    radius + radius * math.cos(w["end"]+math.pi),
-                    radius + radius * math.sin(w["end"]+math.pi)
+                    x1,
+                    y1
                     )
                 )
 
         if animate :
-            components.append(
-                _animationTemplate.format(
-                    radius,
-                    speed
+            if not cssAnimation :
+                components.append(
+                    _animationTemplate.format(
+                        radius,
+                        speed
+                        )
                     )
-                )
             components.append("</g>")
 
     if includeSVGHeader :
@@ -0,0 +1,134 @@
+#
+# user-statistician: Github action for generating a user stats card
+# 
+# Copyright (c) 2022 Vincent A Cicirello
+# https://www.cicirello.org/
+#
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+import os
+from JsonDecoder import toPlain
+
+class RepoStore :
+    """A persistent store of the user's owned repositories, as returned
+    by the repository stats query, along with a watermark of the most
+    recent updatedAt timestamp, which enables refreshing only those
+    repositories that changed since the last run.
+    """
+
+    __slots__ = [
+        '_watermark',
+        '_repositories'
+        ]
+
+    def __init__(self, watermark=None, repositories=None) :
+        """Initializes the store.
+
+        Keyword arguments:
+        watermark - The most recent updatedAt timestamp in the store, or None if empty.
+        repositories - A dictionary mapping repository ids to repository nodes.
+        """
+        self._watermark = watermark
+        self._repositories = repositories if repositories != None else {}
+
+    @staticmethod
+    def load(filename) :
+        """Loads a store from a file. If the file doesn't exist
+        or can't be parsed, this returns an empty store (which
+        leads to a full refresh).
+
+        Keyword arguments:
+        filename - The filename of the store, with complete path.
+        """
+        try :
+            with open(filename, "r", encoding="UTF-8") as f :
+                data = json.load(f)
+            return RepoStore(data["watermark"], data["repositories"])
+        except (IOError, ValueError, KeyError, TypeError) :
+            return RepoStore()
+
+    def save(self, filename) :
+        """Saves the store to a file, creating any missing directories from the path.
+        The file is replaced atomically so that an interrupted run can't leave
+        a truncated store behind.
+
+        Keyword arguments:
+        filename - The filename of the store, with complete path.
+        """
+        directoryName = os.path.dirname(filename)
+        if len(directoryName) > 0 :
+            os.makedirs(directoryName, exist_ok=True, mode=0o777)
+        tempFilename = filename + ".tmp"
+        with open(tempFilename, "w", encoding="UTF-8") as f :
+            json.dump(
+                { "watermark" : self._watermark, "repositories" : self._repositories },
+                f,
+                separators=(",", ":")
+                )
+        os.replace(tempFilename, filename)
+
+    def getWatermark(self) :
+        """Gets the most recent updatedAt timestamp in the store, or None if empty."""
+        return self._watermark
+
+    def getRepositories(self) :
+        """Gets a list of the repository nodes in the store."""
+        return list(self._repositories.values())
+
+    def update(self, nodes) :
+        """Merges changed repository nodes into the store, replacing
+        any prior versions of those repositories, and advances the watermark.
+
+        Keyword arguments:
+        nodes - A list of repository nodes, each of which must include id and updatedAt,
+            as either dicts or CompactRecords.
+        """
+        for repo in nodes :
+            self._repositories[repo["id"]] = toPlain(repo)
+            if self._watermark == None or repo["updatedAt"] > self._watermark :
+                self._watermark = repo["updatedAt"]
+
+    def retain(self, ids) :
+        """Removes the repositories that aren't among the ids (e.g., those
+        deleted, transferred, or made private since the last run), and orders
+        the rest in the order of the ids, which is the order in which the
+        repository stats query returns them. Returns True if every one of
+        the ids is in the store, and False if any are missing.
+
+        Keyword arguments:
+        ids - A list of the ids of all of the owned repositories, in the
+            order in which the repository stats query returns them.
+        """
+        repositories = { repoId : self._repositories[repoId] for repoId in ids if repoId in self._repositories }
+        self._repositories = repositories
+        return len(repositories) == len(ids)
+
+    def clear(self) :
+        """Removes all repositories from the store, and resets the watermark."""
+        self._watermark = None
+        self._repositories = {}
+
+    def __len__(self) :
+        """Gets the number of repositories in the store."""
+        return len(self._repositories)
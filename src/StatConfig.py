@@ -63,12 +63,28 @@ statsByCategory = {
         "contribTo",
         "private"
     ],
-    "languages" : []
+    "languages" : [],
+    "calendar" : [],
+    "leaderboard" : []
 }
 
 # The default order for the categories of stats on the SVG
 categoryOrder = ["general", "repositories", "contributions", "languages"]
 
+# Categories that are only on the SVG if they are listed in the
+# category-order input, such as because they require another query.
+# Their labels may be only in English, which is used for any locale
+# that lacks them.
+optionalCategories = ["calendar", "leaderboard"]
+
+# Mapping from the rankings of the repositories that the leaderboard
+# can show to the key of the stat whose icon they use.
+leaderboardRankings = {
+    "stars" : "starredBy",
+    "forks" : "forkedBy",
+    "watchers" : "watchedBy"
+}
+
 
 # Steps to Contributing a New Locale:
 # (0) Check if there are any open issues or pull requests
@@ -92,11 +108,14 @@ categoryOrder = ["general", "repositories", "contributions", "languages"]
 # (4) In the Python dictionary, statLabels, each key "label" maps to
 #     a Python dictionary with the locale code as key. Add a corresponding
 #     key value pair for the new locale.
-# (5) The existing test cases will verify that all of the above
+# (5) Regenerate src/LabelWidths.py, which holds the precomputed
+#     widths of all of the labels, by running util/LabelWidths.py
+#     from the util directory.
+# (6) The existing test cases will verify that all of the above
 #     has been done for each 2 character locale code in the
 #     supportedLocales set. So no new test cases should be necessary when
 #     adding a locale, but existing tests must pass.
-# (6) If you contribute translations for a new locale,
+# (7) If you contribute translations for a new locale,
 #     or if you correct any errors in one, then please
 #     credit yourself here by either adding a list below for
 #     the relevant locale if it is new, or adding your
@@ -156,6 +175,16 @@ categoryLabels = {
             "heading" : "Language Distribution in Public Repositories",
             "column-one" : None,
             "column-two" : None
+        },
+        "calendar" : {
+            "heading" : "Contributions in the Past Year",
+            "column-one" : None,
+            "column-two" : None
+        },
+        "leaderboard" : {
+            "heading" : "Top Repositories",
+            "column-one" : None,
+            "column-two" : None
         }
     },
 
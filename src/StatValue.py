@@ -0,0 +1,119 @@
+#
+# user-statistician: Github action for generating a user stats card
+# 
+# Copyright (c) 2022 Vincent A Cicirello
+# https://www.cicirello.org/
+#
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+class StatValue :
+    """The value of a stat, which is either a number (such as a count)
+    or text (such as the name of a repository), with one column, or two
+    columns if it also has a total. It supports indexing and len, like
+    the lists of columns that stats were previously stored as.
+    """
+
+    __slots__ = [
+        '_kind',
+        '_columns',
+        '_totalIsLowerBound'
+        ]
+
+    NUMBER = 0
+    TEXT = 1
+
+    def __init__(self, kind, columns, totalIsLowerBound=False) :
+        """Initializes the value. Use the static methods number and text
+        rather than this.
+
+        Keyword arguments:
+        kind - StatValue.NUMBER or StatValue.TEXT.
+        columns - A tuple with the value, and its total if it has one.
+        totalIsLowerBound - True if the total is only a lower bound.
+        """
+        self._kind = kind
+        self._columns = columns
+        self._totalIsLowerBound = totalIsLowerBound
+
+    @staticmethod
+    def number(value, total=None, totalIsLowerBound=False) :
+        """Creates a number valued stat.
+
+        Keyword arguments:
+        value - The value.
+        total - The total, or None if the stat has no total.
+        totalIsLowerBound - True if the total is only a lower bound.
+        """
+        columns = (value,) if total == None else (value, total)
+        return StatValue(StatValue.NUMBER, columns, totalIsLowerBound)
+
+    @staticmethod
+    def text(value) :
+        """Creates a text valued stat.
+
+        Keyword arguments:
+        value - The value.
+        """
+        return StatValue(StatValue.TEXT, (value,))
+
+    def isText(self) :
+        """Checks whether this is a text valued stat."""
+        return self._kind == StatValue.TEXT
+
+    def isNonZero(self) :
+        """Checks whether any column of a number valued stat is
+        non-zero. Text valued stats are always considered non-zero.
+        """
+        return self._kind == StatValue.TEXT or any(c > 0 for c in self._columns)
+
+    def totalIsLowerBound(self) :
+        """Checks whether the total is only a lower bound."""
+        return self._totalIsLowerBound
+
+    def toPlain(self) :
+        """Converts to a list of the columns, such as for serializing."""
+        return list(self._columns)
+
+    def __getitem__(self, index) :
+        return self._columns[index]
+
+    def __len__(self) :
+        return len(self._columns)
+
+    def __iter__(self) :
+        return iter(self._columns)
+
+    def __eq__(self, other) :
+        if isinstance(other, StatValue) :
+            return (
+                self._kind == other._kind
+                and self._columns == other._columns
+                and self._totalIsLowerBound == other._totalIsLowerBound
+                )
+        return NotImplemented
+
+    def __hash__(self) :
+        return hash((self._kind, self._columns, self._totalIsLowerBound))
+
+    def __repr__(self) :
+        kind = "text" if self._kind == StatValue.TEXT else "number"
+        return "StatValue.{0}{1}".format(kind, self._columns)
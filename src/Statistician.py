@@ -25,9 +25,13 @@
 # SOFTWARE.
 #
 
-import json
 import subprocess
 import os
+import threading
+from StatsPartial import StatsPartial
+from StatValue import StatValue
+from StatConfig import statLabels
+import JsonDecoder
 
 def set_outputs(names_values) :
     """Sets the GitHub Action outputs.
@@ -53,13 +57,42 @@ class Statistician :
         '_login',
         '_name',
         '_languages',
+        '_calendar',
+        '_leaderboard',
         '_autoLanguages',
         '_maxLanguages',
         '_languageRepoExclusions',
-        '_featuredRepo'
+        '_featuredRepo',
+        '_partial',
+        '_failOnError',
+        '_fetched',
+        '_repoStore',
+        '_watched',
+        '_compactRecords',
+        '_lock'
         ]
 
-    def __init__(self, fail, autoLanguages, maxLanguages, languageRepoExclusions, featuredRepo) :
+    # The attribute in which each category of stats is kept.
+    _categoryAttributes = {
+        "general" : "_user",
+        "repositories" : "_repo",
+        "contributions" : "_contrib",
+        "languages" : "_languages",
+        "calendar" : "_calendar",
+        "leaderboard" : "_leaderboard"
+        }
+
+    # The color level of each of the values of contributionLevel
+    # in the contribution calendar.
+    _contributionLevels = {
+        "NONE" : 0,
+        "FIRST_QUARTILE" : 1,
+        "SECOND_QUARTILE" : 2,
+        "THIRD_QUARTILE" : 3,
+        "FOURTH_QUARTILE" : 4
+        }
+
+    def __init__(self, fail, autoLanguages, maxLanguages, languageRepoExclusions, featuredRepo, lazy=False, repoStore=None, compactRecords=False) :
         """The initializer executes the queries and parses the results.
         Upon completion of the intitializer, the user statistics will
         be available.
@@ -71,16 +104,44 @@ class Statistician :
         maxLanguages - The maximum number of languages to display. Must be at least 1. If less than
             1, it treats it as if it was 1.
         languageRepoExclusions - A set of repositories to exclude from language stats
+        featuredRepo - The name of a repository to feature, or None.
+        lazy - If True, the initializer only executes the basic stats query, and
+            each category of stats is computed (executing only the queries that
+            category needs) upon the first call to getStatsByKey for that category.
+            The optional categories, such as the calendar, are computed upon
+            request even if this is False.
+        repoStore - If not None, a RepoStore of the owned repositories from a prior run,
+            in which case only the repositories updated since the store's watermark
+            are queried, and the store is updated with them.
+        compactRecords - If True, the JSON objects in the query results are decoded
+            into compact tuple-based records rather than dicts.
         """
         self._autoLanguages = autoLanguages
         self._maxLanguages = maxLanguages if maxLanguages >= 1 else 1
         self._languageRepoExclusions = languageRepoExclusions
         self._featuredRepo = featuredRepo
+        self._failOnError = fail
+        self._repoStore = repoStore
+        self._compactRecords = compactRecords
+        self._lock = threading.Lock()
+        self._calendar = None
+        self._watched = None
         self.ghDisableInteractivePrompts()
         basicStatsQuery = self.loadQuery("/queries/basicstats.graphql",
                                          fail)
-        additionalRepoStatsQuery = self.loadQuery("/queries/repostats.graphql",
-                                                  fail)
+        if lazy :
+            self._fetched = set()
+            self._partial = self.parseBasicStats(
+                self.executeQuery(basicStatsQuery,
+                                  failOnError=fail)
+                )
+            self._user = None
+            self._repo = None
+            self._contrib = None
+            self._languages = None
+            self._leaderboard = None
+            return
+        
         oneYearContribTemplate = self.loadQuery("/queries/singleYearQueryFragment.graphql",
                                                 fail)
         watchingAdjustmentQuery = self.loadQuery("/queries/watchingAdjustment.graphql",
@@ -92,9 +153,7 @@ class Statistician :
         self.parseStats(
             self.executeQuery(basicStatsQuery,
                               failOnError=fail),
-            self.executeQuery(additionalRepoStatsQuery,
-                              needsPagination=True,
-                              failOnError=fail),
+            self.executeRepositoryQuery(),
             self.executeQuery(watchingAdjustmentQuery,
                               needsPagination=True,
                               failOnError=fail),
@@ -110,22 +169,169 @@ class Statistician :
             )
 
     def getStatsByKey(self, key) :
-        """Gets a category of stats by key.
+        """Gets a category of stats by key. If in lazy mode,
+        the category is computed upon the first call for it.
+        Safe to call from multiple threads, in which case
+        each category is still computed only once.
+
+        Keyword arguments:
+        key - A category key.
+        """
+        if key not in Statistician._categoryAttributes :
+            return None # passed an invalid key
+        attribute = Statistician._categoryAttributes[key]
+        stats = getattr(self, attribute)
+        if stats == None :
+            with self._lock :
+                stats = getattr(self, attribute)
+                if stats == None :
+                    stats = self.computeStatsByKey(key)
+                    setattr(self, attribute, stats)
+        return stats
+
+    def computeStatsByKey(self, key) :
+        """Computes a category of stats, in lazy mode, executing
+        the queries it needs if they haven't already been executed.
 
         Keyword arguments:
         key - A category key.
         """
         if key == "general" :
-            return self._user
+            self.fetch("repositories")
+            return self.summarizeGeneralStats(self._partial)
         elif key == "repositories" :
-            return self._repo
+            self.fetch("repositories")
+            self.fetch("watching")
+            return self.summarizeRepositoryStats(self._partial)
         elif key == "contributions" :
-            return self._contrib
-        elif key == "languages" :
-            return self._languages
+            self.fetch("priorYears")
+            return self.summarizeContributionStats(self._partial)
+        elif key == "leaderboard" :
+            self.fetch("repositories")
+            return self.summarizeLeaderboard(self._partial)
+        elif key == "calendar" :
+            return self.summarizeCalendar(
+                self.executeQuery(
+                    self.loadQuery("/queries/contributionCalendar.graphql", self._failOnError),
+                    failOnError=self._failOnError
+                    )
+                )
         else :
-            return None # passed an invalid key 
+            self.fetch("repositories")
+            return self.organizeLanguageStats(*self._partial.getLanguageData())
+
+    def fetch(self, queryKey) :
+        """Executes one of the queries, in lazy mode, and adds its results
+        to the partial aggregate, unless it was already executed.
+
+        Keyword arguments:
+        queryKey - One of "repositories", "watching", or "priorYears". The
+            repositories query also executes the watching query, if it
+            wasn't already executed.
+        """
+        if queryKey in self._fetched :
+            return
+        fail = self._failOnError
+        if queryKey == "repositories" :
+            # The repositories the user is watching are needed to rank
+            # the repositories by their watchers other than the user.
+            self.fetch("watching")
+            self.addRepositoryStats(
+                self._partial,
+                self.executeRepositoryQuery()
+                )
+        elif queryKey == "watching" :
+            self.addWatchingStats(
+                self._partial,
+                self.executeQuery(self.loadQuery("/queries/watchingAdjustment.graphql", fail),
+                                  needsPagination=True,
+                                  failOnError=fail)
+                )
+        elif queryKey == "priorYears" :
+            oneYearContribTemplate = self.loadQuery("/queries/singleYearQueryFragment.graphql", fail)
+            self._partial.addPriorYearStats(
+                self.executeQuery(
+                    self.createPriorYearStatsQuery(self._contributionYears, oneYearContribTemplate),
+                    failOnError=fail
+                    )["data"]["user"]
+                )
+        self._fetched.add(queryKey)
         
+    def executeRepositoryQuery(self) :
+        """Executes the repo stats query, and returns the results. If there is
+        a RepoStore, then this pages through the repositories from most to least
+        recently updated, stopping at the store's watermark, merges those into
+        the store, and returns the store's repositories as a single page of results.
+        The ids of all of the repositories are also queried, so that those
+        removed since the last run are removed from the store, and so that the
+        store is in the same order as the results of the repo stats query.
+        """
+        if self._repoStore == None :
+            return self.executeQuery(
+                self.loadQuery("/queries/repostats.graphql", self._failOnError),
+                needsPagination=True,
+                failOnError=self._failOnError
+                )
+        query = self.loadQuery("/queries/repostatsUpdated.graphql", self._failOnError)
+        self.refreshRepoStore(query, self._repoStore.getWatermark())
+        ids = self.queryRepositoryIds()
+        if not self._repoStore.retain(ids) :
+            # Repositories that weren't updated since the last run are
+            # missing from the store (e.g., made visible to the token),
+            # so all of them are queried.
+            self._repoStore.clear()
+            self.refreshRepoStore(query, None)
+            self._repoStore.retain(ids)
+        return [ { "data" : { "user" : { "repositories" : {
+            "totalCount" : len(self._repoStore),
+            "nodes" : self._repoStore.getRepositories()
+            } } } } ]
+
+    def queryRepositoryIds(self) :
+        """Queries the ids of all of the owned repositories, which is
+        much cheaper than querying their stats, and returns them as a
+        list in the order in which the repo stats query returns them.
+        """
+        pages = self.executeQuery(
+            self.loadQuery("/queries/repostatsIds.graphql", self._failOnError),
+            needsPagination=True,
+            failOnError=self._failOnError
+            )
+        ids = []
+        for page in pages :
+            nodes = page["data"]["user"]["repositories"]["nodes"]
+            if nodes != None :
+                ids.extend(repo["id"] for repo in nodes)
+        return ids
+
+    def refreshRepoStore(self, query, watermark) :
+        """Queries the repositories one page at a time, in order from
+        most to least recently updated, merging them into the RepoStore
+        until reaching a repository older than the watermark. Returns the
+        total count of owned repositories.
+
+        Keyword arguments:
+        query - The repo stats query ordered by updatedAt.
+        watermark - The updatedAt timestamp at which to stop, or None
+            to query all repositories.
+        """
+        cursor = None
+        while True :
+            page = self.executeQuery(
+                query,
+                failOnError=self._failOnError,
+                variables=None if cursor == None else { "endCursor" : cursor }
+                )["data"]["user"]["repositories"]
+            nodes = page["nodes"] if page["nodes"] != None else []
+            # Timestamps are ISO 8601 in UTC, so compare correctly as strings.
+            # Those equal to the watermark are refreshed too, in case others
+            # were updated in the same second after the last run.
+            changed = [ repo for repo in nodes if watermark == None or repo["updatedAt"] >= watermark ]
+            self._repoStore.update(changed)
+            if len(changed) < len(nodes) or not page["pageInfo"]["hasNextPage"] :
+                return page["totalCount"]
+            cursor = page["pageInfo"]["endCursor"]
+
     def loadQuery(self, queryFilepath, failOnError=True) :
         """Loads a graphql query.
 
@@ -150,6 +356,30 @@ class Statistician :
         basicStats - The results of the basic stats query.
         repoStats - The results of the repo stats query.
         watchingStats - The results of the query of repositories the user is watching.
+        reposContributedToStats - The results of the query of repositories contributed to.
+        """
+        partial = self.parseBasicStats(basicStats)
+        self.addWatchingStats(partial, watchingStats)
+        self.addRepositoryStats(partial, repoStats)
+
+        # Count num repos owned by someone else that the user has contributed to
+        # NOTE: It doesn't appear that it is currently possible through any query
+        # or combination of queries to actually compute this other than for the most recent
+        # year's data. Keeping the query in, but changing to leave that stat blank in
+        # the SVG.
+        for page in reposContributedToStats :
+            page = page["data"]["user"]["topRepositories"]
+            if page["nodes"] != None :
+                partial.addReposContributedTo(page["nodes"], self._login)
+
+        self.parsePartial(partial)
+
+    def parseBasicStats(self, basicStats) :
+        """Parses the user's login, name, and contribution years, and returns
+        a new partial aggregate with the rest of the basic stats.
+
+        Keyword arguments:
+        basicStats - The results of the basic stats query.
         """
         # Extract username (i.e., login) and fullname.
         # Name needed for title of statistics card, and username
@@ -161,149 +391,194 @@ class Statistician :
         # user's public name is null.
         if self._name == None :
             self._name = self._login
-        
-        # Extract most recent year data from query results
-        pastYearData = basicStats["data"]["user"]["contributionsCollection"]
-        
-        # Extract repositories contributes to (owned by others) in past year
-        pastYearData["repositoriesContributedTo"] = basicStats["data"]["user"]["repositoriesContributedTo"]["totalCount"]
 
         # Extract list of contribution years
-        self._contributionYears = pastYearData["contributionYears"]
-        # Just reorganizing data for clarity
-        del pastYearData["contributionYears"]
+        self._contributionYears = basicStats["data"]["user"]["contributionsCollection"]["contributionYears"]
 
-        # Extract followed and following counts
-        self._user = {}
-        self._user["followers"] = [ basicStats["data"]["user"]["followers"]["totalCount"] ]
-        self._user["following"] = [ basicStats["data"]["user"]["following"]["totalCount"] ]
-        self._user["joined"] = [ min(self._contributionYears) ]
+        partial = StatsPartial()
+        partial.addBasicStats(basicStats["data"]["user"])
+        return partial
 
-        # Extract sponsors and sponsoring counts
-        self._user["sponsors"] = [ basicStats["data"]["user"]["sponsorshipsAsMaintainer"]["totalCount"] ]
-        self._user["sponsoring"] = [ basicStats["data"]["user"]["sponsorshipsAsSponsor"]["totalCount"] ]
+    def addRepositoryStats(self, partial, repoStats) :
+        """Adds the results of the repo stats query to a partial aggregate.
+        The results of the query of repositories the user is watching must
+        already have been added.
 
-        #
-        if self._featuredRepo != None :
-            self._user["featured"] = [ self._featuredRepo ]
+        Keyword arguments:
+        partial - The StatsPartial.
+        repoStats - The results of the repo stats query.
+        """
+        repoStats = list(map(lambda x : x["data"]["user"]["repositories"], repoStats))
+        # This is the count of owned repos, including all public,
+        # but may or may not include all private depending upon token used to authenticate.
+        partial.addCount("ownedRepositories", repoStats[0]["totalCount"])
+        # Note that the explicit checks of, if page["nodes"] != None, are precautionary
+        # since the "nodes" field is nullable.
+        for page in repoStats :
+            if page["nodes"] != None :
+                partial.addRepositories(page["nodes"], self._languageRepoExclusions, self._watched)
 
-        # Extract all time counts of issues and pull requests
-        issues = basicStats["data"]["user"]["issues"]["totalCount"]
-        pullRequests = basicStats["data"]["user"]["pullRequests"]["totalCount"]
+    def addWatchingStats(self, partial, watchingStats) :
+        """Adds the results of the query of repositories the user is watching
+        to a partial aggregate, and collects the names of those repositories.
 
-        # Reorganize for simplicity
-        repoStats = list(map(lambda x : x["data"]["user"]["repositories"], repoStats))
+        Keyword arguments:
+        partial - The StatsPartial.
+        watchingStats - The results of the query of repositories the user is watching.
+        """
         watchingStats = list(map(lambda x : x["data"]["user"]["watching"], watchingStats))
-        reposContributedToStats = list(map(lambda x : x["data"]["user"]["topRepositories"], reposContributedToStats))
+        partial.addCount("watching", watchingStats[0]["totalCount"])
+        self._watched = set()
+        if watchingStats[0]["totalCount"] > 0 :
+            for page in watchingStats :
+                if page["nodes"] != None :
+                    partial.addWatching(page["nodes"])
+                    self._watched.update(repo["name"] for repo in page["nodes"])
+
+    def parsePartial(self, partial) :
+        """Computes the user statistics from a partial aggregate
+        of the query results, such as one that has been merged from
+        partials computed elsewhere.
 
-        # This is the count of owned repos, including all public,
-        # but may or may not include all private depending upon token used to authenticate.
-        ownedRepositories = repoStats[0]["totalCount"]
-        
-        # Count num repos owned by someone else that the user has contributed to
-        # NOTE: It doesn't appear that it is currently possible through any query
-        # or combination of queries to actually compute this other than for the most recent
-        # year's data. Keeping the query in, but changing to leave that stat blank in
-        # the SVG.
-        repositoriesContributedTo = sum(1 for page in reposContributedToStats if page["nodes"] != None for repo in page["nodes"] if repo["owner"]["login"] != self._login)
-        
-        self._contrib = {
-            "commits" : [pastYearData["totalCommitContributions"], 0],
-            "issues" : [pastYearData["totalIssueContributions"], issues],
-            "prs" : [pastYearData["totalPullRequestContributions"], pullRequests],
-            "reviews" : [pastYearData["totalPullRequestReviewContributions"], 0],
-            # See comment above for reason for this change.
-            #"contribTo" : [pastYearData["repositoriesContributedTo"], repositoriesContributedTo],
-            "contribTo" : [pastYearData["repositoriesContributedTo"]],
-            "private" : [pastYearData["restrictedContributionsCount"], 0]
-            }
+        Keyword arguments:
+        partial - A StatsPartial with the aggregated query results.
+        """
+        self._partial = partial
+        self._user = self.summarizeGeneralStats(partial)
+        self._contrib = self.summarizeContributionStats(partial)
+        self._repo = self.summarizeRepositoryStats(partial)
+        self._languages = self.organizeLanguageStats(*partial.getLanguageData())
+        self._leaderboard = self.summarizeLeaderboard(partial)
 
-        # The "nodes" field is nullable so make sure the user owns at least 1 repo. 
-        if repoStats[0]["totalCount"] > 0 :
-            # Note that the explicit checks of, if page["nodes"] != None, are precautionary
-            # since the above check of totalCount should be sufficient to protect against a null list of repos.
-            
-            # Count stargazers, forks of my repos, and watchers excluding me
-            stargazers = sum(repo["stargazerCount"] for page in repoStats if page["nodes"] != None for repo in page["nodes"] if not repo["isPrivate"] and not repo["isFork"])
-            forksOfMyRepos = sum(repo["forkCount"] for page in repoStats if page["nodes"] != None for repo in page["nodes"] if not repo["isPrivate"] and not repo["isFork"])
-            stargazersAll = sum(repo["stargazerCount"] for page in repoStats if page["nodes"] != None for repo in page["nodes"] if not repo["isPrivate"])
-            forksOfMyReposAll = sum(repo["forkCount"] for page in repoStats if page["nodes"] != None for repo in page["nodes"] if not repo["isPrivate"])
-
-            # Find repos with most stars and most forks
-            try :
-                mostStars = max( (repo for page in repoStats if page["nodes"] != None for repo in page["nodes"] if not repo["isPrivate"] and not repo["isFork"]), key=lambda x : x["stargazerCount"])["name"]
-                self._user["mostStarred"] = [ mostStars ]
-            except ValueError:
-                pass
-
-            try :
-                mostForks = max( (repo for page in repoStats if page["nodes"] != None for repo in page["nodes"] if not repo["isPrivate"] and not repo["isFork"]), key=lambda x : x["forkCount"])["name"]
-                self._user["mostForked"] = [ mostForks ]
-            except ValueError:
-                pass
-            
-            # Compute number of watchers excluding cases where user is watching their own repos.
-            watchers = sum(repo["watchers"]["totalCount"] for page in repoStats if page["nodes"] != None for repo in page["nodes"] if not repo["isPrivate"])
-            watchers -= watchingStats[0]["totalCount"]
-
-            if watchingStats[0]["totalCount"] > 0 :
-                watchingMyOwnNonForks = sum(1 for page in watchingStats if page["nodes"] != None for repo in page["nodes"] if not repo["isFork"])
-            else :
-                watchingMyOwnNonForks = 0
-            watchersNonForks = sum(repo["watchers"]["totalCount"] for page in repoStats if page["nodes"] != None for repo in page["nodes"] if not repo["isPrivate"] and not repo["isFork"])
-            watchersNonForks -= watchingMyOwnNonForks
-        
-            # Count of private repos (which is not accurate since depends on token used to authenticate query,
-            # however, all those here are included in count of owned repos.
-            privateCount = sum(1 for page in repoStats if page["nodes"] != None for repo in page["nodes"] if repo["isPrivate"])
+    def summarizeGeneralStats(self, partial) :
+        """Computes the general stats and info.
 
-            publicAll = ownedRepositories - privateCount
+        Keyword arguments:
+        partial - A StatsPartial with the aggregated query results.
+        """
+        user = {}
+        user["followers"] = self.numberStat("followers", partial.getCount("followers"))
+        user["following"] = self.numberStat("following", partial.getCount("following"))
+        user["joined"] = self.numberStat("joined", partial.getMin("joined"))
+        user["sponsors"] = self.numberStat("sponsors", partial.getCount("sponsorshipsAsMaintainer"))
+        user["sponsoring"] = self.numberStat("sponsoring", partial.getCount("sponsorshipsAsSponsor"))
+        if self._featuredRepo != None :
+            user["featured"] = StatValue.text(self._featuredRepo)
+        # Repos with most stars and most forks
+        if partial.getCount("ownedRepositories") > 0 :
+            mostStars = partial.getMax("mostStarred")
+            if mostStars != None :
+                user["mostStarred"] = StatValue.text(mostStars)
+            mostForks = partial.getMax("mostForked")
+            if mostForks != None :
+                user["mostForked"] = StatValue.text(mostForks)
+        return user
+
+    def numberStat(self, key, value, total=None) :
+        """Creates the value of a number valued stat.
 
-            # Counts of archived repos
-            publicNonForksArchivedCount = sum(1 for page in repoStats if page["nodes"] != None for repo in page["nodes"] if repo["isArchived"] and not repo["isPrivate"] and not repo["isFork"])
-            publicArchivedCount = sum(1 for page in repoStats if page["nodes"] != None for repo in page["nodes"] if repo["isArchived"] and not repo["isPrivate"])
+        Keyword arguments:
+        key - The key of the stat.
+        value - The value.
+        total - The total, or None if the stat has no total.
+        """
+        return StatValue.number(
+            value,
+            total,
+            key in statLabels and statLabels[key].get("totalIsLowerBound", False)
+            )
 
-            # Counts of template repos
-            publicNonForksTemplatesCount = sum(1 for page in repoStats if page["nodes"] != None for repo in page["nodes"] if repo["isTemplate"] and not repo["isPrivate"] and not repo["isFork"])
-            publicTemplatesCount = sum(1 for page in repoStats if page["nodes"] != None for repo in page["nodes"] if repo["isTemplate"] and not repo["isPrivate"])
-            
-            # Count of public non forks owned by user
-            publicNonForksCount = ownedRepositories - sum(1 for page in repoStats if page["nodes"] != None for repo in page["nodes"] if repo["isPrivate"] or repo["isFork"])
+    def summarizeContributionStats(self, partial) :
+        """Computes the contribution stats. The totals remain 0 until the
+        prior year stats have been added to the partial.
 
-            # Compute language distribution
-            totalSize, languageData = self.summarizeLanguageStats(repoStats)
-        else :
-            # if no owned repos then set all repo related stats to 0
-            stargazers = 0
-            forksOfMyRepos = 0
-            stargazersAll = 0
-            forksOfMyReposAll = 0
-            watchers = 0
-            watchingMyOwnNonForks = 0
-            watchersNonForks = 0
-            privateCount = 0
-            publicAll = 0
-            publicNonForksArchivedCount = 0
-            publicArchivedCount = 0
-            publicNonForksCount = 0
-            publicNonForksTemplatesCount = 0
-            publicTemplatesCount = 0
-            totalSize, languageData = 0, {}
-
-        self._repo = {
-            "public" : [publicNonForksCount, publicAll],
-            "starredBy" : [stargazers, stargazersAll],
-            "forkedBy" : [forksOfMyRepos, forksOfMyReposAll],
-            "watchedBy" : [watchersNonForks, watchers],
-            "archived" : [publicNonForksArchivedCount, publicArchivedCount],
-            "templates" : [publicNonForksTemplatesCount, publicTemplatesCount]
+        Keyword arguments:
+        partial - A StatsPartial with the aggregated query results.
+        """
+        return {
+            "commits" : self.numberStat("commits", partial.getCount("totalCommitContributions"), partial.getCount("allYearsCommitContributions")),
+            "issues" : self.numberStat("issues", partial.getCount("totalIssueContributions"), partial.getCount("issues")),
+            "prs" : self.numberStat("prs", partial.getCount("totalPullRequestContributions"), partial.getCount("pullRequests")),
+            "reviews" : self.numberStat("reviews", partial.getCount("totalPullRequestReviewContributions"), partial.getCount("allYearsPullRequestReviewContributions")),
+            # See comment in parseStats for reason for this change.
+            #"contribTo" : self.numberStat("contribTo", partial.getCount("repositoriesContributedTo"), partial.getCount("contributedToOwnedByOthers")),
+            "contribTo" : self.numberStat("contribTo", partial.getCount("repositoriesContributedTo")),
+            "private" : self.numberStat("private", partial.getCount("restrictedContributionsCount"), partial.getCount("allYearsRestrictedContributionsCount"))
             }
 
-        self._languages = self.organizeLanguageStats(totalSize, languageData)
+    def summarizeRepositoryStats(self, partial) :
+        """Computes the repository stats.
+
+        Keyword arguments:
+        partial - A StatsPartial with the aggregated query results.
+        """
+        ownedRepositories = partial.getCount("ownedRepositories")
+        # If no owned repos then all repo related stats are 0
+        if ownedRepositories == 0 :
+            return {
+                "public" : self.numberStat("public", 0, 0),
+                "starredBy" : self.numberStat("starredBy", 0, 0),
+                "forkedBy" : self.numberStat("forkedBy", 0, 0),
+                "watchedBy" : self.numberStat("watchedBy", 0, 0),
+                "archived" : self.numberStat("archived", 0, 0),
+                "templates" : self.numberStat("templates", 0, 0)
+                }
+        # Number of watchers excluding cases where user is watching their own repos.
+        watchers = partial.getCount("watchersAll") - partial.getCount("watching")
+        watchersNonForks = partial.getCount("watchers") - partial.getCount("watchingNonForks")
+        # Count of private repos is not accurate since it depends on token used to authenticate query,
+        # however, all those here are included in count of owned repos.
+        publicAll = ownedRepositories - partial.getCount("privateRepositories")
+        publicNonForksCount = ownedRepositories - partial.getCount("privateOrForkRepositories")
+        return {
+            "public" : self.numberStat("public", publicNonForksCount, publicAll),
+            "starredBy" : self.numberStat("starredBy", partial.getCount("stargazers"), partial.getCount("stargazersAll")),
+            "forkedBy" : self.numberStat("forkedBy", partial.getCount("forks"), partial.getCount("forksAll")),
+            "watchedBy" : self.numberStat("watchedBy", watchersNonForks, watchers),
+            "archived" : self.numberStat("archived", partial.getCount("archived"), partial.getCount("archivedAll")),
+            "templates" : self.numberStat("templates", partial.getCount("templates"), partial.getCount("templatesAll"))
+            }
+
+    def summarizeLeaderboard(self, partial) :
+        """Computes the rankings of the top public non-fork repositories
+        by stars, forks, and watchers, as lists of (name, count) tuples from
+        highest to lowest count, which were all ranked in the same pass
+        over the repositories that computed the other stats.
+
+        Keyword arguments:
+        partial - A StatsPartial with the aggregated query results.
+        """
+        return {
+            "stars" : partial.getTop("stars"),
+            "forks" : partial.getTop("forks"),
+            "watchers" : partial.getTop("watchers")
+            }
+
+    def summarizeCalendar(self, queryResults) :
+        """Summarizes the contribution calendar of the past year, in a
+        single pass over its days, as the weekday of its first day and
+        a list of the color level (0 through 4) of each day, in order.
+
+        Keyword arguments:
+        queryResults - The results of the contribution calendar query.
+        """
+        calendar = queryResults["data"]["user"]["contributionsCollection"]["contributionCalendar"]
+        firstWeekday = None
+        levels = []
+        for week in calendar["weeks"] :
+            for day in week["contributionDays"] :
+                if firstWeekday == None :
+                    firstWeekday = day["weekday"]
+                levels.append(Statistician._contributionLevels.get(day["contributionLevel"], 0))
+        return {
+            "totalContributions" : calendar["totalContributions"],
+            "firstWeekday" : firstWeekday if firstWeekday != None else 0,
+            "levels" : levels
+            }
 
     def organizeLanguageStats(self, totalSize, languageData) :
         """Computes a list of languages and percentages in decreasing order
-        by percentage.
+        by percentage. Neither languageData nor the Statistician is modified.
 
         Keyword arguments:
         totalSize - total size of all code with language detection data
@@ -314,15 +589,15 @@ class Statistician :
         else :
             languages = [ (name, data) for name, data in languageData.items() ]
             languages.sort(key = lambda L : L[1]["size"], reverse=True)
+            maxLanguages = self._maxLanguages
             if self._autoLanguages :
                 for i, L in enumerate(languages) :
                     if L[1]["percentage"] < 0.01 :
-                        self._maxLanguages = i
+                        maxLanguages = i
                         break
-            if len(languages) > self._maxLanguages :
-                self.combineLanguages(languages, self._maxLanguages, totalSize)
-            self.checkColors(languages)
-            return { "totalSize" : totalSize, "languages" : languages }
+            if len(languages) > maxLanguages :
+                self.combineLanguages(languages, maxLanguages, totalSize)
+            return { "totalSize" : totalSize, "languages" : self.checkColors(languages) }
 
     def combineLanguages(self, languages, maxLanguages, totalSize) :
         """Combines lowest percentage languages into an Other.
@@ -331,7 +606,7 @@ class Statistician :
         languages - Sorted list of languages (sorted by size).
         maxLanguages - The maximum number of languages to keep as is.
         """
-        if len(languages) > self._maxLanguages :
+        if len(languages) > maxLanguages :
             combinedSize = sum(L[1]["size"] for L in languages[maxLanguages:])
             languages[maxLanguages] = (
                 "Other",
@@ -343,8 +618,9 @@ class Statistician :
             del languages[maxLanguages+1:]
         
     def checkColors(self, languages) :
-        """Make sure all languages have colors, and assign shades of gray to
-        those that don't.
+        """Returns a list of the languages in which all languages have colors,
+        assigning shades of gray to those that don't. The languages passed
+        in are not modified.
 
         Keyword arguments:
         languages - Sorted list of languages (sorted by size).
@@ -353,37 +629,13 @@ class Statistician :
         # In such cases, we alternate between these two shades of gray.
         colorsForLanguagesWithoutColors = [ "#959da5", "#d1d5da" ]
         index = 0
-        for L in languages :
-            if L[1]["color"] == None :
-                L[1]["color"] = colorsForLanguagesWithoutColors[index]
+        colored = []
+        for name, data in languages :
+            if data["color"] == None :
+                data = dict(data, color=colorsForLanguagesWithoutColors[index])
                 index = (index + 1) % 2
-
-    def summarizeLanguageStats(self, repoStats) :
-        """Summarizes the language distibution of the user's owned repositories.
-
-        Keyword arguments:
-        repoStats - The results of the repo stats query.
-        """
-        totalSize = 0
-        languageData = {}
-        for page in repoStats :
-            if page["nodes"] != None :
-                for repo in page["nodes"] :
-                    if not repo["isPrivate"] and not repo["isFork"] and (repo["name"].lower() not in self._languageRepoExclusions) :
-                        totalSize += repo["languages"]["totalSize"]
-                        if repo["languages"]["edges"] != None :
-                            for L in repo["languages"]["edges"] :
-                                name = L["node"]["name"]
-                                if name in languageData :
-                                    languageData[name]["size"] += L["size"]
-                                else :
-                                    languageData[name] = {
-                                        "color" : L["node"]["color"],
-                                        "size" : L["size"]
-                                        }
-        for L in languageData :
-            languageData[L]["percentage"] = languageData[L]["size"] / totalSize
-        return totalSize, languageData
+            colored.append((name, data))
+        return colored
 
     def createPriorYearStatsQuery(self, yearList, oneYearContribTemplate) :
         """Generates the query for prior year stats.
@@ -404,12 +656,10 @@ class Statistician :
         Keyword arguments:
         queryResults - The results of the query.
         """
-        queryResults = queryResults["data"]["user"]
-        self._contrib["commits"][1] = sum(stats["totalCommitContributions"] for k, stats in queryResults.items())
-        self._contrib["reviews"][1] = sum(stats["totalPullRequestReviewContributions"] for k, stats in queryResults.items())
-        self._contrib["private"][1] = sum(stats["restrictedContributionsCount"] for k, stats in queryResults.items())
+        self._partial.addPriorYearStats(queryResults["data"]["user"])
+        self._contrib = self.summarizeContributionStats(self._partial)
         
-    def executeQuery(self, query, needsPagination=False, failOnError=True) :
+    def executeQuery(self, query, needsPagination=False, failOnError=True, variables=None) :
         """Executes a GitHub GraphQl query using the GitHub CLI (gh).
 
         Keyword arguments:
@@ -418,6 +668,7 @@ class Statistician :
         failOnError - If True, the workflow will fail if there is an error executing the
             query; and if False, this action will quietly exit with no error code. In
             either case, an error message will be logged to the console.
+        variables - A dictionary of additional string variables for the query, or None.
         """
         arguments = [
             'gh', 'api', 'graphql',
@@ -427,15 +678,18 @@ class Statistician :
             ]
         if needsPagination :
             arguments.insert(5, '--paginate')
+        if variables != None :
+            for name, value in variables.items() :
+                arguments.extend(['-f', name + '=' + value])
+        # Decoded directly from the bytes of gh's output.
         result = subprocess.run(
             arguments,
-            stdout=subprocess.PIPE,
-            universal_newlines=True
-            ).stdout.strip()
-        numPages = result.count('"data"')
+            stdout=subprocess.PIPE
+            ).stdout
+        numPages = result.count(b'"data"')
         if numPages == 0 :
             # Check if any error details
-            result = json.loads(result) if len(result) > 0 else ""
+            result = JsonDecoder.decode(result) if len(result.strip()) > 0 else ""
             if "errors" in result :
                 print("Error (2): GitHub api Query failed with error:")
                 print(result["errors"])
@@ -446,10 +700,9 @@ class Statistician :
             set_outputs({"exit-code" : code})
             exit(code if failOnError else 0)
         elif needsPagination :
-            if (numPages > 1) :
-                result = result.replace('}{"data"', '},{"data"')
-            result = "[" + result + "]"
-        result = json.loads(result)
+            result = JsonDecoder.decodePages(result, self._compactRecords)
+        else :
+            result = JsonDecoder.decode(result, self._compactRecords)
         failed = False
         errorMessage = None
         if (not needsPagination) and (("data" not in result) or result["data"] == None) :
@@ -0,0 +1,160 @@
+#
+# user-statistician: Github action for generating a user stats card
+# 
+# Copyright (c) 2022 Vincent A Cicirello
+# https://www.cicirello.org/
+#
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import os
+import struct
+from StatConfig import statsByCategory
+
+class StatsHistory :
+    """An append-only history of some of the stats from past runs,
+    stored in a binary file of fixed-size records (one per day),
+    so that the last n records can be read by seeking directly to
+    them, without reading the rest of the history, no matter how
+    many years of runs it covers.
+    """
+
+    # The keys of the stats in the history, in the order of
+    # their fields in the records.
+    keys = ("starredBy", "followers", "commits")
+
+    _magic = b"USHIST01"
+    # A record is the day (a proleptic Gregorian ordinal), followed
+    # by the first value of each of the stats.
+    _record = struct.Struct("<i3q")
+
+    __slots__ = [
+        '_filename'
+        ]
+
+    def __init__(self, filename) :
+        """Initializes the history.
+
+        Keyword arguments:
+        filename - The filename of the history, with complete path,
+            which is created upon the first append if it doesn't exist.
+        """
+        self._filename = filename
+
+    def __len__(self) :
+        """Gets the number of records in the history."""
+        try :
+            with open(self._filename, "rb") as f :
+                return self.countRecords(f)
+        except IOError :
+            return 0
+
+    def countRecords(self, f) :
+        """Gets the number of complete records in the history, which
+        is 0 if the file isn't a history.
+
+        Keyword arguments:
+        f - The history file, opened for binary reading.
+        """
+        f.seek(0)
+        if f.read(len(StatsHistory._magic)) != StatsHistory._magic :
+            return 0
+        size = f.seek(0, os.SEEK_END)
+        return (size - len(StatsHistory._magic)) // StatsHistory._record.size
+
+    def recordOffset(self, index) :
+        """Gets the position in the file of one of the records.
+
+        Keyword arguments:
+        index - The index of the record.
+        """
+        return len(StatsHistory._magic) + index * StatsHistory._record.size
+
+    def append(self, day, values) :
+        """Appends a record to the history, or replaces the last record
+        if it is for the same day, such as when there are several runs
+        in a day. A partially written record at the end, such as from an
+        interrupted run, is overwritten. Creates the file, along with any
+        missing directories from the path, if it doesn't exist, and starts
+        the history over if the file isn't a history.
+
+        Keyword arguments:
+        day - The day, as a proleptic Gregorian ordinal (e.g., date.today().toordinal()).
+        values - The values of the stats, in the order of StatsHistory.keys.
+        """
+        directoryName = os.path.dirname(self._filename)
+        if len(directoryName) > 0 :
+            os.makedirs(directoryName, exist_ok=True, mode=0o777)
+        mode = "r+b" if os.path.exists(self._filename) else "w+b"
+        with open(self._filename, mode) as f :
+            count = self.countRecords(f)
+            if count == 0 :
+                f.seek(0)
+                f.write(StatsHistory._magic)
+            else :
+                f.seek(self.recordOffset(count - 1))
+                if StatsHistory._record.unpack(f.read(StatsHistory._record.size))[0] == day :
+                    count -= 1
+            f.seek(self.recordOffset(count))
+            f.write(StatsHistory._record.pack(day, *values))
+            f.truncate()
+
+    def appendStats(self, day, stats) :
+        """Appends a record with the stats of a Statistician.
+
+        Keyword arguments:
+        day - The day, as a proleptic Gregorian ordinal (e.g., date.today().toordinal()).
+        stats - The Statistician.
+        """
+        values = []
+        for key in StatsHistory.keys :
+            category = next(c for c, keys in statsByCategory.items() if key in keys)
+            values.append(stats.getStatsByKey(category)[key][0])
+        self.append(day, values)
+
+    def readLast(self, n) :
+        """Reads the last n records (or all of them if there are fewer),
+        in order from oldest to newest, as a list of tuples of the day
+        followed by the values, seeking directly to the first of them.
+
+        Keyword arguments:
+        n - The number of records.
+        """
+        try :
+            with open(self._filename, "rb") as f :
+                count = self.countRecords(f)
+                first = max(0, count - n)
+                f.seek(self.recordOffset(first))
+                data = f.read((count - first) * StatsHistory._record.size)
+        except IOError :
+            return []
+        return list(StatsHistory._record.iter_unpack(data))
+
+    def readTrends(self, n) :
+        """Reads the trends of the stats over the last n records, as a
+        dictionary mapping the key of each stat to the list of its values
+        from oldest to newest.
+
+        Keyword arguments:
+        n - The number of records.
+        """
+        records = self.readLast(n)
+        return { key : [ r[i + 1] for r in records ] for i, key in enumerate(StatsHistory.keys) }
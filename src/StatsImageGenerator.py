@@ -29,13 +29,72 @@ from StatConfig import *
 from PieChart import svgPieChart
 from Colors import iconTemplates
 from ColorUtil import highContrastingColor
-from TextLength import calculateTextLength, calculateTextLength110Weighted
+from ImageLayout import ImageLayout
+from ImageSkeleton import ImageSkeleton
+from StatValue import StatValue
+from TextLength import TextMetricsCache, calculateConcatenatedTextLength110, widthsFile
+from LabelWidths import labelWidths, titleTemplateWidths
+import hashlib
+import json
 import math
+import re
+import sys
+
+def _compileTemplate(template, compact=False) :
+    """Compiles a multi-line template into a function that formats it
+    with the newlines removed, so the generated image needs no final
+    pass to remove them.
+
+    Keyword arguments:
+    template - The template.
+    compact - If True, the template is also stripped of attributes that
+        have their default values and of optional whitespace.
+    """
+    template = template.replace("\n", "")
+    if compact :
+        template = re.sub(r"translate\(([^,()]+), ", r"translate(\1 ", template)
+        template = template.replace(' stroke-width="1"', "")
+        template = template.replace('<text x="0" ', "<text ")
+    return template.format
+
+# The modules that determine how an image is rendered, whose
+# source is included in the fingerprints of images.
+_renderingModules = (
+    "StatsImageGenerator",
+    "PieChart",
+    "Colors",
+    "ColorUtil",
+    "StatConfig",
+    "TextLength",
+    "LabelWidths"
+    )
+# The data files that determine how an image is rendered, whose
+# contents are also included in the fingerprints of images.
+_renderingDataFiles = (
+    widthsFile,
+    )
+_sourceDigest = None
+
+def _calculateSourceDigest() :
+    """Calculates a digest of the source of the modules, and of the
+    data files, that determine how an image is rendered, such that fingerprints
+    change when the rendering changes. It is only calculated once.
+    """
+    global _sourceDigest
+    if _sourceDigest == None :
+        digest = hashlib.sha256()
+        filenames = [sys.modules[name].__file__ for name in _renderingModules]
+        for filename in filenames + list(_renderingDataFiles) :
+            with open(filename, "rb") as f :
+                digest.update(f.read())
+        _sourceDigest = digest.hexdigest()
+    return _sourceDigest
 
 class StatsImageGenerator :
     """Generates an svg image from the collected stats."""
 
     headerTemplate = '<svg width="{1}" height="{0}" viewBox="0 0 {1} {0}" xmlns="http://www.w3.org/2000/svg" lang="{2}" xml:lang="{2}">'
+    fingerprintTemplate = '<metadata>user-statistician:{0}</metadata>'
     backgroundTemplate = '<rect x="2" y="2" stroke-width="4" rx="{4}" width="{3}" height="{0}" stroke="{1}" fill="{2}"/>'
     fontGroup = '<g font-weight="600" font-size="110pt" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision">'
     titleTemplate = '<text x="{3}" y="{4}" lengthAdjust="spacingAndGlyphs" textLength="{5}" transform="scale({2})" fill="{1}">{0}</text>'
@@ -79,14 +138,57 @@ class StatsImageGenerator :
 <text transform="scale({4})" x="{11}" y="{6}" textLength="{12}" lengthAdjust="spacingAndGlyphs">{10}</text>
 </g>"""
     languageStringTemplate = "{0} {1:.2f}%"
+    # The length, in pixels, of the shortest arc of a wedge of the language
+    # chart that is drawn on its own, since shorter wedges can't be seen.
+    minimumWedgeArcLength = 1
+    closingTags = "</g></svg>"
+    defTemplate = '<g id="{0}">{1}</g>'
+    useTemplate = '<use href="#{0}"/>'
+    usePositionedTemplate = '<use href="#{0}" x="{1}" y="{2}"/>'
+    titleIconId = "ti"
     pieTransform = """<g transform="translate({2}, {1})">{0}</g>"""
     pieContrast = """<g transform="translate({3}, {1})"><circle cx="{0}" cy="{0}" r="{0}" fill="{2}"/></g>"""
+    calendarTransform = """<g transform="translate({0}, {1}) scale({2})">"""
+    calendarCellTemplate = '<rect id="{0}" width="{1}" height="{1}" rx="2" fill="{2}" fill-opacity="{3}"/>'
+    # The cells of the calendar are uses of one of these, by color level, and
+    # the opacities of the levels, the first of which is in the text color
+    # and the others in the icon color.
+    calendarCellIds = ("c0", "c1", "c2", "c3", "c4")
+    calendarOpacities = ("0.15", "0.4", "0.6", "0.8", "1")
+    calendarCellSize = 10
+    calendarCellPitch = 12
+    sparklineTemplate = '<g transform="translate({0}, {1})"><polyline fill="none" stroke="{2}" stroke-width="1.5" stroke-linejoin="round" points="{3}"/></g>'
+    # The sparklines are right aligned before the second column, and
+    # sparklinePoints values span their full width.
+    sparklineWidth = 40
+    sparklineHeight = 12
+    sparklinePoints = 30
+
+    # The templates above, compiled once into renderers that produce
+    # them without the newlines, in both the normal and compact modes.
+    _templates = (
+        ("groupHeader", groupHeaderTemplate),
+        ("tableEntry", tableEntryTemplate),
+        ("tableEntryOneColumn", tableEntryTemplateOneColumn),
+        ("tableHeader", tableHeaderTemplate),
+        ("tableHeaderOneColumn", tableHeaderTemplateOneColumn),
+        ("tableHeaderNoColumns", tableHeaderTemplateNoColumns),
+        ("languageEntry", languageEntryTemplate),
+        ("languageEntryTwoLangs", languageEntryTemplateTwoLangs),
+        ("pieTransform", pieTransform),
+        ("pieContrast", pieContrast),
+        ("calendarTransform", calendarTransform),
+        ("sparkline", sparklineTemplate)
+        )
+    renderers = { name : _compileTemplate(template) for name, template in _templates }
+    compactRenderers = { name : _compileTemplate(template, True) for name, template in _templates }
     
     __slots__ = [
         '_stats',
         '_colors',
         '_height',
         '_width',
+        '_minimumWidth',
         '_rows',
         '_lineHeight',
         '_margin',
@@ -98,12 +200,24 @@ class StatsImageGenerator :
         '_categoryOrder',
         '_animateLanguageChart',
         '_animationSpeed',
+        '_cssAnimation',
+        '_leaderboardRanking',
+        '_leaderboardSize',
+        '_trends',
         '_firstColX',
         '_secondColX',
         '_title',
         '_includeTitle',
         '_exclude',
-        '_topIconSize'
+        '_useDefs',
+        '_iconIds',
+        '_render',
+        '_precision',
+        '_skeletonCache',
+        '_slotValues',
+        '_embedFingerprint',
+        '_topIconSize',
+        '_metrics'
         ]
 
     def __init__(self,
@@ -118,7 +232,16 @@ class StatsImageGenerator :
                  width,
                  customTitle,
                  includeTitle,
-                 exclude) :
+                 exclude,
+                 useDefs=False,
+                 compact=False,
+                 precision=2,
+                 skeletonCache=None,
+                 embedFingerprint=False,
+                 cssAnimation=False,
+                 leaderboardRanking="stars",
+                 leaderboardSize=5,
+                 trends=None) :
         """Initializes the StatsImageGenerator.
 
         Keyword arguments:
@@ -135,39 +258,115 @@ class StatsImageGenerator :
             from user's name.
         includeTitle - If True inserts a title.
         exclude - A set of keys to exclude.
+        useDefs - If True, icons that appear more than once are defined once in
+            a defs element, and referenced where they appear with use elements.
+        compact - If True, the SVG is generated in a compact form, without attributes
+            that have their default values or optional whitespace, and with the
+            coordinates of the language chart rounded.
+        precision - The number of digits after the decimal point of the coordinates
+            of the language chart in the compact form.
+        skeletonCache - If not None, a SkeletonCache from which to get the skeleton
+            of the image (i.e., everything other than the values of the stats and the
+            other dynamic strings), such that only the values are generated, and to
+            which the skeleton is added if it isn't already cached.
+        embedFingerprint - If True, the fingerprint of the stats and the configuration
+            (see calculateFingerprint) is embedded in the image within a metadata element.
+        cssAnimation - If True, and animateLanguageChart is True, the language chart is
+            animated with a CSS transform animation, which honors the viewer's preference
+            for reduced motion, rather than with SMIL.
+        leaderboardRanking - The ranking of the repositories that the leaderboard shows,
+            which is one of the keys of leaderboardRankings ("stars", "forks", or "watchers").
+        leaderboardSize - The number of repositories that the leaderboard shows, which
+            is at most StatsPartial.topSize.
+        trends - If not None, a dictionary mapping the keys of stats to lists of their
+            values in past runs, from oldest to newest (see StatsHistory.readTrends), in
+            which case those with at least two values have a sparkline of up to the last
+            sparklinePoints values.
         """
         self._stats = stats
+        self._metrics = TextMetricsCache(labelWidths)
         self._colors = colors
         self._highContrast = highContrastingColor(self._colors["bg"])
         self._locale = locale
         self._radius = radius
         self._titleSize = titleSize
         if customTitle != None :
-            self._title = customTitle
+            # Newlines can't be displayed within the title.
+            self._title = customTitle.replace("\n", "")
         else :
             self._title = titleTemplates[self._locale].format(self._stats._name)
+            if self._locale in titleTemplateWidths :
+                self._metrics.setTextLength110(self._title, self.calculateDefaultTitleLength110())
         self._includeTitle = includeTitle
         self._topIconSize = 25
         self._categoryOrder = categories
         self._exclude = exclude
+        self._useDefs = useDefs
+        self._render = StatsImageGenerator.compactRenderers if compact else StatsImageGenerator.renderers
+        self._precision = precision if compact else None
+        self._skeletonCache = skeletonCache
+        self._slotValues = None
+        self._embedFingerprint = embedFingerprint
         self._animateLanguageChart = animateLanguageChart
         self._animationSpeed = animationSpeed
+        self._cssAnimation = cssAnimation
+        self._leaderboardRanking = leaderboardRanking
+        self._leaderboardSize = leaderboardSize
+        self._trends = {
+            k : values[-StatsImageGenerator.sparklinePoints:] for k, values in trends.items() if len(values) > 1
+            } if trends != None else {}
         self._margin = 15 # CAUTION: Some templates currently have margin hardcoded to 15 (refactor before changing here)
-        self._height = 0
-        self._width = max(
-            width,
-            self.calculateMinimumFeasibleWidth()
-            )
+        self._lineHeight = 21
+        self._minimumWidth = self.calculateMinimumFeasibleWidth()
+        self.setWidth(width)
+        self.resetImage()
+
+    def setWidth(self, width) :
+        """Sets the width of the image, and the positions that
+        depend upon it.
+
+        Keyword arguments:
+        width - The minimum width of the SVG, but will autosize larger as needed.
+        """
+        self._width = max(width, self._minimumWidth)
         self._firstColX = (self._width // 2)
         self._secondColX = self._firstColX + (self._width // 4) 
-        self._lineHeight = 21
         self._pieRadius = (((self._width // 2 - 2*self._margin) // self._lineHeight * self._lineHeight) - (self._lineHeight - 16)) // 2 
+
+    def resetImage(self) :
+        """Discards any image that was generated, so that
+        another can be generated."""
+        self._height = 0
+        self._iconIds = {}
         self._rows = [
             StatsImageGenerator.headerTemplate,
             StatsImageGenerator.backgroundTemplate,
             StatsImageGenerator.fontGroup
             ]
 
+    def getTextMetrics(self) :
+        """Gets the cache of text lengths, which is shared by the width
+        calculation and the generation of the image, such as to
+        check its statistics.
+        """
+        return self._metrics
+
+    def calculateDefaultTitleLength110(self) :
+        """Calculates the 110pt length of the default title for the locale
+        from the precomputed lengths of the parts of its template, only
+        measuring the user's name.
+        """
+        prefix, sep, suffix = titleTemplates[self._locale].partition("{0}")
+        prefixLength, suffixLength = titleTemplateWidths[self._locale]
+        if sep == "" :
+            return prefixLength
+        name = self._stats._name
+        return calculateConcatenatedTextLength110([
+            (prefix, prefixLength),
+            (name, self._metrics.calculateTextLength110(name)),
+            (suffix, suffixLength)
+            ])
+
     def calculateMinimumFeasibleWidth(self) :
         """Calculates the minimum feasible width for the
         SVG based on the lengths of the labels of the
@@ -176,7 +375,7 @@ class StatsImageGenerator :
         """
         length = 0
         if self._includeTitle :
-            length = calculateTextLength(self._title, self._titleSize, True, 600) + 2 * self._margin
+            length = self._metrics.calculateTextLength(self._title, self._titleSize, True, 600) + 2 * self._margin
             if "title-icon" in self._colors :
                 length += 2 * (self._topIconSize + self._margin)
         for category in self._categoryOrder :
@@ -184,8 +383,8 @@ class StatsImageGenerator :
                 if category == "languages" :
                     languageData = self._stats.getStatsByKey(category)
                     if languageData["totalSize"] > 0 :
-                        headingRowLength = calculateTextLength(
-                            categoryLabels[self._locale][category]["heading"],
+                        headingRowLength = self._metrics.calculateTextLength(
+                            self.getCategoryLabels(category)["heading"],
                             14,
                             True,
                             600)
@@ -196,7 +395,7 @@ class StatsImageGenerator :
                                 lang[0],
                                 100 * lang[1]["percentage"]
                                 )
-                            langRowLength = calculateTextLength(
+                            langRowLength = self._metrics.calculateTextLength(
                                 langStr,
                                 14,
                                 True,
@@ -206,14 +405,47 @@ class StatsImageGenerator :
                                 length,
                                 (langRowLength + 25 + (2 * self._margin)) * 2
                                 )
+                elif category == "calendar" :
+                    calendarData = self._stats.getStatsByKey(category)
+                    if len(calendarData["levels"]) > 0 :
+                        headingRowLength = self._metrics.calculateTextLength(
+                            self.getCategoryLabels(category)["heading"],
+                            14,
+                            True,
+                            600)
+                        length = max(length, headingRowLength + 2 * self._margin)
+                        # The cells are at least half of their full size.
+                        length = max(
+                            length,
+                            self.calculateCalendarWidth(calendarData) / 2 + 2 * self._margin
+                            )
+                elif category == "leaderboard" :
+                    entries = self.getLeaderboardEntries(self._stats.getStatsByKey(category))
+                    if len(entries) > 0 :
+                        headingRowLength = self._metrics.calculateTextLength(
+                            self.getCategoryLabels(category)["heading"],
+                            14,
+                            True,
+                            600)
+                        length = max(length, headingRowLength + 2 * self._margin)
+                        for name, count in entries :
+                            labelLength = self._metrics.calculateTextLength(
+                                name,
+                                14,
+                                True,
+                                600)
+                            length = max(
+                                length,
+                                (labelLength + 25 + (2 * self._margin)) * 2
+                                )
                 else :
                     keys = self.filterKeys(
                         self._stats.getStatsByKey(category),
                         statsByCategory[category]
                         )
                     if len(keys) > 0 :
-                        headerRow = categoryLabels[self._locale][category]
-                        headingRowLength = calculateTextLength(
+                        headerRow = self.getCategoryLabels(category)
+                        headingRowLength = self._metrics.calculateTextLength(
                             headerRow["heading"],
                             14,
                             True,
@@ -225,7 +457,7 @@ class StatsImageGenerator :
                         if headerRow["column-one"] != None :
                             length = max(
                                 length,
-                                4*(self._margin + calculateTextLength(
+                                4*(self._margin + self._metrics.calculateTextLength(
                                     headerRow["column-one"],
                                     14,
                                     True,
@@ -234,7 +466,7 @@ class StatsImageGenerator :
                         if headerRow["column-two"] != None :
                             length = max(
                                 length,
-                                4*(self._margin + calculateTextLength(
+                                4*(self._margin + self._metrics.calculateTextLength(
                                     headerRow["column-two"],
                                     14,
                                     True,
@@ -242,7 +474,7 @@ class StatsImageGenerator :
                                 )
                         data = self._stats.getStatsByKey(category)
                         for k in keys :
-                            labelLength = calculateTextLength(
+                            labelLength = self._metrics.calculateTextLength(
                                 statLabels[k]["label"][self._locale],
                                 14,
                                 True,
@@ -251,8 +483,8 @@ class StatsImageGenerator :
                                 length,
                                 (labelLength + 25 + (2 * self._margin)) * 2
                                 )
-                            if len(data[k]) == 1 and not self.isInt(data[k][0]) :
-                                dataLength = calculateTextLength(
+                            if data[k].isText() :
+                                dataLength = self._metrics.calculateTextLength(
                                     data[k][0],
                                     14,
                                     True,
@@ -261,85 +493,489 @@ class StatsImageGenerator :
                                     length,
                                     2*(dataLength + (2 * self._margin))
                                     )
+                            elif k in self._trends :
+                                # The value and the sparkline share the first column.
+                                dataLength = self._metrics.calculateTextLength(
+                                    str(self.formatCount(data[k][0])),
+                                    14,
+                                    True,
+                                    600)
+                                length = max(
+                                    length,
+                                    4*(dataLength + StatsImageGenerator.sparklineWidth + 3 * self._margin)
+                                    )
         return math.ceil(length)
 
     def generateImage(self) :
         """Generates and returns the image."""
+        if self._skeletonCache != None :
+            return self.generateImageFromSkeleton()
+        for section in self.insertSections() :
+            pass
+        self.finalizeImageData()
+        return "".join(self._rows)
+
+    def generateImagesForWidths(self, widths) :
+        """Generates and returns a list of images, one for each of a list
+        of widths, such as to publish the same card in several sizes. The
+        minimum feasible width and the lengths of the text are calculated
+        once and shared by all of the images, so only the positions that
+        depend on the width are calculated for each.
+
+        Keyword arguments:
+        widths - A list of the minimum widths of the images, each of which
+            will autosize larger as needed.
+        """
+        # The generator is restored to its own width afterwards, with
+        # no image generated, so it can still generate its own image.
+        originalWidth = self._width
+        images = []
+        try :
+            for width in widths :
+                self.setWidth(width)
+                self.resetImage()
+                images.append(self.generateImage())
+        finally :
+            self.setWidth(originalWidth)
+            self.resetImage()
+        return images
+
+    def generateImageFromSkeleton(self) :
+        """Generates and returns the image by filling the values into its
+        skeleton from the skeleton cache. If the skeleton isn't cached, then
+        it is generated along with the values, and added to the cache.
+        """
+        key = self.calculateSkeletonKey()
+        skeleton = self._skeletonCache.get(key)
+        if skeleton == None :
+            self._slotValues = []
+            for section in self.insertSections() :
+                pass
+            self.finalizeImageData()
+            skeleton = ImageSkeleton.fromImage("".join(self._rows))
+            self._skeletonCache.put(key, skeleton)
+            values = self._slotValues
+            self._slotValues = None
+        else :
+            values = self.generateValues()
+        return skeleton.fill(values)
+
+    def patchImage(self, image) :
+        """Updates an existing image, replacing only the values of the stats
+        (and the other dynamic strings) that changed, which produces the same
+        image as generateImage. This requires the skeleton of the image to be
+        in the skeleton cache, and the existing image to have been filled from
+        that skeleton, otherwise (e.g., if anything that would shift the layout
+        changed) this falls back to generating the image.
+
+        Keyword arguments:
+        image - The existing image, as a string.
+        """
+        if self._skeletonCache != None :
+            skeleton = self._skeletonCache.get(self.calculateSkeletonKey())
+            if skeleton != None :
+                patched = skeleton.patch(image, self.generateValues())
+                if patched != None :
+                    return patched
+        return self.generateImage()
+
+    def calculateSkeletonKey(self) :
+        """Calculates the key of the skeleton of the image, from everything
+        that determines the static parts of the image: the locale, the colors,
+        the width, the border radius, the options, and which stats are included
+        (along with how many columns each has and how many languages there are),
+        as well as the source of the rendering modules, so that skeletons cached
+        by a prior version aren't reused once the rendering changes.
+        """
+        included = []
+        for category in self._categoryOrder :
+            if category not in self._exclude :
+                data = self._stats.getStatsByKey(category)
+                if category == "languages" :
+                    included.append([
+                        category,
+                        len(data["languages"]) if data["totalSize"] > 0 else 0
+                        ])
+                elif category == "calendar" :
+                    included.append([
+                        category,
+                        self.calculateCalendarWeeks(data) if len(data["levels"]) > 0 else 0
+                        ])
+                elif category == "leaderboard" :
+                    included.append([category, len(self.getLeaderboardEntries(data))])
+                else :
+                    keys = self.filterKeys(data, statsByCategory[category])
+                    included.append([category, [ [k, len(data[k])] for k in keys ]])
+        key = json.dumps(
+            [
+                _calculateSourceDigest(),
+                self._locale,
+                self._colors,
+                self._width,
+                self._radius,
+                self._includeTitle,
+                self._useDefs,
+                self._render is StatsImageGenerator.compactRenderers,
+                self._embedFingerprint,
+                self._leaderboardRanking,
+                sorted(self._trends),
+                included
+            ],
+            sort_keys=True
+            )
+        return hashlib.sha256(key.encode(encoding="UTF-8")).hexdigest()
+
+    def generateValues(self) :
+        """Generates the values that fill the slots of the skeleton of
+        the image, in the same order in which generating the skeleton
+        inserts their slots.
+        """
+        values = []
+        if self._includeTitle :
+            values.append(self.formatTitle())
+        for category in self._categoryOrder :
+            if category not in self._exclude :
+                data = self._stats.getStatsByKey(category)
+                if category == "languages" :
+                    if data["totalSize"] > 0 :
+                        values.append(self.formatLanguagesChart(data))
+                elif category == "calendar" :
+                    if len(data["levels"]) > 0 :
+                        values.append(self.formatCalendarCells(data))
+                elif category == "leaderboard" :
+                    for name, count in self.getLeaderboardEntries(data) :
+                        label, labelLength, data1, data1Length = self.formatLeaderboardEntry(name, count)
+                        values.extend([label, data1, labelLength, data1Length])
+                else :
+                    for k in self.filterKeys(data, statsByCategory[category]) :
+                        values.extend(self.formatStatValues(data, k))
+                        if k in self._trends :
+                            values.append(self.formatSparklinePoints(self._trends[k]))
+        if self._embedFingerprint :
+            values.append(self.formatFingerprint())
+        return [ str(v) for v in values ]
+
+    def valueSlot(self, value) :
+        """Returns the value, or if generating a skeleton, a slot for the
+        value. This must only be called for the values that generateValues
+        generates.
+
+        Keyword arguments:
+        value - The value.
+        """
+        if self._slotValues == None :
+            return value
+        self._slotValues.append(str(value))
+        return ImageSkeleton.slot(len(self._slotValues) - 1)
+
+    def generateLayout(self) :
+        """Generates the layout of the image, which can then be painted
+        with any color theme that agrees with this generator's theme
+        on whether the title has icons. Like generateImage, this may
+        only be called once per StatsImageGenerator. The layout doesn't
+        include a fingerprint, since fingerprints depend on the colors.
+        """
+        colors = self._colors
+        highContrast = self._highContrast
+        embedFingerprint = self._embedFingerprint
+        self._colors = ImageLayout.slotColors("title-icon" in colors)
+        self._highContrast = ImageLayout.slot("contrast")
+        self._embedFingerprint = False
+        try :
+            image = self.generateImage()
+        finally :
+            self._colors = colors
+            self._highContrast = highContrast
+            self._embedFingerprint = embedFingerprint
+        return ImageLayout(image, "title-icon" in colors)
+
+    def generateImageChunks(self) :
+        """Generates the image one section at a time, yielding each
+        as UTF-8 encoded bytes, so that the whole image is never held in memory.
+        The height of the image is calculated before any sections are
+        generated, so that the header can be yielded first. If the generator
+        has a skeleton cache, then the image is filled into its skeleton,
+        and yielded as a single chunk.
+        """
+        if self._skeletonCache != None :
+            yield self.generateImage().encode(encoding="UTF-8")
+            return
+        height = self.calculateHeight()
+        self._rows[0] = self.formatHeader(height)
+        self._rows[1] = self.formatBackground(height)
+        yield "".join(self._rows).encode(encoding="UTF-8")
+        self._rows.clear()
+        for section in self.insertSections() :
+            if len(self._rows) > 0 :
+                yield "".join(self._rows).encode(encoding="UTF-8")
+                self._rows.clear()
+        yield StatsImageGenerator.closingTags.encode(encoding="UTF-8")
+
+    def insertSections(self) :
+        """Inserts the title and the sections for the categories, one
+        at a time, yielding after each (i.e., this is a generator).
+        """
+        if self._useDefs :
+            self.insertDefs()
         self.insertTitle()
+        yield "title"
         for category in self._categoryOrder :
             if category not in self._exclude :
                 if category == "languages" :
                     self.insertLanguagesChart(
                         self._stats.getStatsByKey(category),
-                        categoryLabels[self._locale][category]["heading"]
+                        self.getCategoryLabels(category)["heading"]
+                        )
+                elif category == "calendar" :
+                    self.insertCalendar(
+                        self._stats.getStatsByKey(category),
+                        self.getCategoryLabels(category)["heading"]
+                        )
+                elif category == "leaderboard" :
+                    self.insertLeaderboard(
+                        self.getLeaderboardEntries(self._stats.getStatsByKey(category)),
+                        self.getCategoryLabels(category)["heading"]
                         )
                 else :
                     self.insertGroup(
                         self._stats.getStatsByKey(category),
-                        categoryLabels[self._locale][category],
+                        self.getCategoryLabels(category),
                         self.filterKeys(
                             self._stats.getStatsByKey(category),
                             statsByCategory[category]
                             )
                         )
-        self.finalizeImageData()
-        return "".join(self._rows).replace("\n", "")
+                yield category
 
-    def filterKeys(self, data, keys) :
-        """Returns a list of the keys that have non-zero data and which are not excluded.
+    def calculateHeight(self) :
+        """Calculates the height of the image without generating it,
+        based on the stats that are to be included. This must mirror
+        the heights added by insertTitle, insertGroup, insertLanguagesChart,
+        insertCalendar, and insertLeaderboard.
+        """
+        height = 39 if self._includeTitle else 0
+        for category in self._categoryOrder :
+            if category not in self._exclude :
+                if category == "languages" :
+                    languageData = self._stats.getStatsByKey(category)
+                    if languageData["totalSize"] > 0 :
+                        height += self._lineHeight + self.calculateLanguagesChartHeight(
+                            len(languageData["languages"])
+                            )
+                elif category == "calendar" :
+                    calendarData = self._stats.getStatsByKey(category)
+                    if len(calendarData["levels"]) > 0 :
+                        height += self._lineHeight + self.calculateCalendarHeight(calendarData)
+                elif category == "leaderboard" :
+                    entries = self.getLeaderboardEntries(self._stats.getStatsByKey(category))
+                    if len(entries) > 0 :
+                        height += self._lineHeight * (2 + len(entries))
+                else :
+                    keys = self.filterKeys(
+                        self._stats.getStatsByKey(category),
+                        statsByCategory[category]
+                        )
+                    if len(keys) > 0 :
+                        height += self._lineHeight * (2 + len(keys))
+        return height + self._lineHeight
+
+    def calculateLanguagesChartHeight(self, numLanguages) :
+        """Calculates the height of the language distribution chart,
+        excluding the line preceding its heading.
 
         Keyword arguments:
-        data - The data (either contrib or repo data)
-        keys - The list of keys relevant for the table.
+        numLanguages - The number of languages in the chart.
+        """
+        diameter = self._pieRadius * 2
+        numRowsToLeft = round(diameter / self._lineHeight)
+        numRows = min(numLanguages, numRowsToLeft)
+        if numLanguages > numRowsToLeft :
+            numRows += (numLanguages - numRowsToLeft + 1) // 2
+        offset = self._lineHeight * (1 + numRows)
+        return max(offset, diameter + self._lineHeight + self._lineHeight - self._margin - 1)
+
+    def calculateCalendarWeeks(self, calendarData) :
+        """Calculates the number of weeks, and thus the number of
+        columns of cells, of the contribution calendar.
+
+        Keyword arguments:
+        calendarData - The contribution calendar data.
+        """
+        return (calendarData["firstWeekday"] + len(calendarData["levels"]) + 6) // 7
+
+    def calculateCalendarWidth(self, calendarData) :
+        """Calculates the unscaled width of the cells of the
+        contribution calendar.
+
+        Keyword arguments:
+        calendarData - The contribution calendar data.
+        """
+        pitch = StatsImageGenerator.calendarCellPitch
+        return self.calculateCalendarWeeks(calendarData) * pitch - (pitch - StatsImageGenerator.calendarCellSize)
+
+    def calculateCalendarScale(self, calendarData) :
+        """Calculates the scale of the cells of the contribution calendar,
+        such that they span the width of the image.
+
+        Keyword arguments:
+        calendarData - The contribution calendar data.
+        """
+        available = self._width - 2 * self._margin
+        return math.floor(1000 * available / self.calculateCalendarWidth(calendarData)) / 1000
+
+    def calculateCalendarHeight(self, calendarData) :
+        """Calculates the height of the contribution calendar,
+        excluding the line preceding its heading.
+
+        Keyword arguments:
+        calendarData - The contribution calendar data.
+        """
+        pitch = StatsImageGenerator.calendarCellPitch
+        unscaled = 7 * pitch - (pitch - StatsImageGenerator.calendarCellSize)
+        return self._lineHeight + math.ceil(unscaled * self.calculateCalendarScale(calendarData))
+
+    def getCategoryLabels(self, category) :
+        """Gets the heading and column labels of a category in the
+        locale, or in English if the locale doesn't have them,
+        which may be the case for the optional categories.
+
+        Keyword arguments:
+        category - A category key.
+        """
+        labels = categoryLabels[self._locale]
+        return labels[category] if category in labels else categoryLabels["en"][category]
+
+    def getLeaderboardEntries(self, leaderboardData) :
+        """Gets the list of (name, count) tuples of the repositories on
+        the leaderboard, excluding those with a count of 0.
+
+        Keyword arguments:
+        leaderboardData - The leaderboard data.
         """
-        return [ k for k in keys if (k not in self._exclude) and (k in data) and ((not self.isInt(data[k][0])) or data[k][0] > 0 or (len(data[k]) > 1 and data[k][1] > 0)) ]
+        entries = leaderboardData[self._leaderboardRanking][:self._leaderboardSize]
+        return [ entry for entry in entries if entry[1] > 0 ]
 
-    def isInt(self, value) :
-        """Checks if a value is an int.
+    def filterKeys(self, data, keys) :
+        """Returns a list of the keys that have non-zero data and which are not excluded.
 
         Keyword arguments:
-        value - The value to check.
+        data - The data (either contrib or repo data)
+        keys - The list of keys relevant for the table.
         """
-        try:
-            int(value)
-        except:
-            return False
-        return True
+        return [ k for k in keys if (k not in self._exclude) and (k in data) and data[k].isNonZero() ]
 
     def insertTitle(self) :
         """Generates, formats, and inserts title."""
         if self._includeTitle :
-            scale = round(0.75 * self._titleSize / 110, 3)
-            titleTextLength = round(calculateTextLength110Weighted(self._title, 600))
-            self._rows.append(
-                StatsImageGenerator.titleTemplate.format(
-                    self._title,
-                    self._colors["title"],
-                    "{0:.3f}".format(scale),
-                    round(self._firstColX/scale - titleTextLength/2), #str(round(self._margin/scale)),
-                    str(round(37/scale)),
-                    titleTextLength
-                )
-            )
+            self._rows.append(self.valueSlot(self.formatTitle()))
             if "title-icon" in self._colors :
-                icon = iconTemplates[self._colors["title-icon"]]
-                self._rows.append(
-                    icon.format(
-                        self._topIconSize,
-                        self._margin,
-                        self._margin,
-                        self._highContrast
+                self.insertTitleIcon(self._margin, self._margin)
+                self.insertTitleIcon(
+                    self._width - self._margin - self._topIconSize,
+                    self._margin
+                )
+            self._height += 39
+
+    def formatTitle(self) :
+        """Formats the title."""
+        scale = round(0.75 * self._titleSize / 110, 3)
+        titleTextLength = round(self._metrics.calculateTextLength110Weighted(self._title, 600))
+        return StatsImageGenerator.titleTemplate.format(
+            self._title,
+            self._colors["title"],
+            "{0:.3f}".format(scale),
+            round(self._firstColX/scale - titleTextLength/2), #str(round(self._margin/scale)),
+            str(round(37/scale)),
+            titleTextLength
+        )
+
+    def insertDefs(self) :
+        """Inserts a defs element with the icons that appear more than once,
+        which are the title icons and any stat icons that are shared by
+        more than one of the stats that are to be included.
+        """
+        counts = {}
+        for category in self._categoryOrder :
+            if category == "leaderboard" and category not in self._exclude :
+                entries = self.getLeaderboardEntries(self._stats.getStatsByKey(category))
+                if len(entries) > 0 :
+                    icon = statLabels[leaderboardRankings[self._leaderboardRanking]]["icon"]
+                    counts[icon] = counts.get(icon, 0) + len(entries)
+            elif category not in self._exclude and category != "languages" :
+                keys = self.filterKeys(
+                    self._stats.getStatsByKey(category),
+                    statsByCategory[category]
+                    )
+                for k in keys :
+                    icon = statLabels[k]["icon"]
+                    counts[icon] = counts.get(icon, 0) + 1
+        defs = []
+        if self._includeTitle and "title-icon" in self._colors :
+            defs.append(
+                StatsImageGenerator.defTemplate.format(
+                    StatsImageGenerator.titleIconId,
+                    self.formatTitleIcon(0, 0)
                     )
                 )
-                self._rows.append(
-                    icon.format(
-                        self._topIconSize,
-                        self._width - self._margin - self._topIconSize,
-                        self._margin,
-                        self._highContrast
+        for icon, count in counts.items() :
+            if count > 1 :
+                iconId = "i" + str(len(self._iconIds))
+                self._iconIds[icon] = iconId
+                defs.append(
+                    StatsImageGenerator.defTemplate.format(
+                        iconId,
+                        icon.format(self._colors["icons"])
+                        )
+                    )
+        if len(defs) > 0 :
+            self._rows.append("<defs>" + "".join(defs) + "</defs>")
+
+    def insertTitleIcon(self, x, y) :
+        """Inserts one of the icons of the title.
+
+        Keyword arguments:
+        x - The x coordinate of the icon.
+        y - The y coordinate of the icon.
+        """
+        if self._useDefs :
+            self._rows.append(
+                StatsImageGenerator.usePositionedTemplate.format(
+                    StatsImageGenerator.titleIconId,
+                    x,
+                    y
                     )
                 )
-            self._height += 39
+        else :
+            self._rows.append(self.formatTitleIcon(x, y))
+
+    def formatTitleIcon(self, x, y) :
+        """Formats one of the icons of the title, or its slot
+        if generating a layout.
+
+        Keyword arguments:
+        x - The x coordinate of the icon.
+        y - The y coordinate of the icon.
+        """
+        if self._colors["title-icon"] in iconTemplates :
+            return iconTemplates[self._colors["title-icon"]].format(
+                self._topIconSize,
+                x,
+                y,
+                self._highContrast
+                )
+        return ImageLayout.titleIconSlot(self._topIconSize, x, y)
+
+    def formatStatIcon(self, key) :
+        """Formats the icon of a stat, or a reference to its
+        definition if it has one.
+
+        Keyword arguments:
+        key - The key of the stat.
+        """
+        icon = statLabels[key]["icon"]
+        if icon in self._iconIds :
+            return StatsImageGenerator.useTemplate.format(self._iconIds[icon])
+        return icon.format(self._colors["icons"])
 
     def insertGroup(self, data, headerRow, keys) :
         """Generates the portion of the image for a group
@@ -355,55 +991,100 @@ class StatsImageGenerator :
         if len(keys) > 0 :
             scale = round(0.75 * 14 / 110, 3)
             self._height += self._lineHeight
-            self._rows.append(StatsImageGenerator.groupHeaderTemplate.format(self._height, self._colors["text"]))
+            self._rows.append(self._render["groupHeader"](self._height, self._colors["text"]))
             if headerRow != None :
                 if headerRow["column-one"] == None :
-                    template = StatsImageGenerator.tableHeaderTemplateNoColumns
+                    render = self._render["tableHeaderNoColumns"]
                 elif headerRow["column-two"] == None :
-                    template = StatsImageGenerator.tableHeaderTemplateOneColumn
+                    render = self._render["tableHeaderOneColumn"]
                 else :
-                    template = StatsImageGenerator.tableHeaderTemplate
-                self._rows.append(template.format(
+                    render = self._render["tableHeader"]
+                self._rows.append(render(
                     "{0:.3f}".format(scale),
                     str(round(12.5/scale)),
                     headerRow["heading"],
-                    round(calculateTextLength110Weighted(headerRow["heading"], 600)),
+                    round(self._metrics.calculateTextLength110Weighted(headerRow["heading"], 600)),
                     headerRow["column-one"],
                     str(round(self._firstColX/scale)),
-                    round(calculateTextLength110Weighted(headerRow["column-one"], 600)),
+                    round(self._metrics.calculateTextLength110Weighted(headerRow["column-one"], 600)),
                     headerRow["column-two"],
                     str(round(self._secondColX/scale)),
-                    round(calculateTextLength110Weighted(headerRow["column-two"], 600))
+                    round(self._metrics.calculateTextLength110Weighted(headerRow["column-two"], 600))
                     ))
                 offset = self._lineHeight
             else :
                 offset = 0
             for k in keys :
-                template = StatsImageGenerator.tableEntryTemplate if len(data[k]) > 1 else StatsImageGenerator.tableEntryTemplateOneColumn   
+                render = self._render["tableEntry"] if len(data[k]) > 1 else self._render["tableEntryOneColumn"]
                 label = statLabels[k]["label"][self._locale]
-                data1 = str(self.formatCount(data[k][0]))
-                data2 = str(self.formatCount(data[k][1])) if len(data[k]) > 1 else ""
-                if "totalIsLowerBound" in statLabels[k] and statLabels[k]["totalIsLowerBound"] :
-                    data2 = "≥" + data2
-                self._rows.append(template.format(
+                data1, data1Length, data2, data2Length = self.formatStatValues(data, k)
+                self._rows.append(render(
                     str(offset),
-                    statLabels[k]["icon"].format(self._colors["icons"]),
+                    self.formatStatIcon(k),
                     "{0:.3f}".format(scale),
                     str(round(12.5/scale)),
                     label,
                     str(round(25/scale)),
-                    data1,
+                    self.valueSlot(data1),
                     str(round(self._firstColX/scale)),
-                    round(calculateTextLength110Weighted(label, 600)),
-                    round(calculateTextLength110Weighted(data1, 600)),
-                    data2,
+                    round(self._metrics.calculateTextLength110Weighted(label, 600)),
+                    self.valueSlot(data1Length),
+                    self.valueSlot(data2),
                     str(round(self._secondColX/scale)),
-                    round(calculateTextLength110Weighted(data2, 600))
+                    self.valueSlot(data2Length)
                     ))
+                if k in self._trends :
+                    self._rows.append(self._render["sparkline"](
+                        self._secondColX - self._margin - StatsImageGenerator.sparklineWidth,
+                        offset + 2,
+                        self._colors["icons"],
+                        self.valueSlot(self.formatSparklinePoints(self._trends[k]))
+                        ))
                 offset += self._lineHeight
             self._rows.append("</g>")
             self._height += offset
 
+    def formatSparklinePoints(self, values) :
+        """Formats the points of a sparkline, scaled to its height, with
+        the last value at its right end and consecutive values spaced so that
+        sparklinePoints values would span its full width.
+
+        Keyword arguments:
+        values - The list of values, from oldest to newest.
+        """
+        width = StatsImageGenerator.sparklineWidth
+        height = StatsImageGenerator.sparklineHeight
+        spacing = width / (StatsImageGenerator.sparklinePoints - 1)
+        low = min(values)
+        high = max(values)
+        points = []
+        for i, value in enumerate(values) :
+            x = width - (len(values) - 1 - i) * spacing
+            y = height - height * (value - low) / (high - low) if high > low else height / 2
+            points.append("{0:g},{1:g}".format(round(x, 1), round(y, 1)))
+        return " ".join(points)
+
+    def formatStatValues(self, data, key) :
+        """Formats the values of a stat, returning a tuple with the
+        value, its length, the total (or the empty string if it has none),
+        and its length.
+
+        Keyword arguments:
+        data - A dictionary with the data.
+        key - The key of the stat.
+        """
+        value = data[key]
+        data1 = value[0] if value.isText() else str(self.formatCount(value[0]))
+        data2 = str(self.formatCount(value[1])) if len(value) > 1 else ""
+        if value.totalIsLowerBound() :
+            data2 = "≥" + data2
+        return (
+            data1,
+            round(self._metrics.calculateTextLength110Weighted(data1, 600)),
+            data2,
+            round(self._metrics.calculateTextLength110Weighted(data2, 600))
+            )
+
     def insertLanguagesChart(self, languageData, categoryHeading) :
         """Generates and returns the SVG section for the language
         distribution summary and pie chart.
@@ -416,112 +1097,246 @@ class StatsImageGenerator :
             scale = round(0.75 * 14 / 110, 3)
             self._height += self._lineHeight
             self._rows.append(
-                StatsImageGenerator.groupHeaderTemplate.format(
+                self._render["groupHeader"](
                     self._height,
                     self._colors["text"]
                     )
                 )
             self._rows.append(
-                StatsImageGenerator.tableHeaderTemplateNoColumns.format(
+                self._render["tableHeaderNoColumns"](
                     "{0:.3f}".format(scale),
                     str(round(12.5/scale)),
                     categoryHeading,
-                    round(calculateTextLength110Weighted(categoryHeading, 600))
+                    round(self._metrics.calculateTextLength110Weighted(categoryHeading, 600))
                     )
                 )
             offset = self._lineHeight
             self._rows.append(
-                StatsImageGenerator.pieContrast.format(
+                self._render["pieContrast"](
                     self._pieRadius,
                     str(offset),
                     self._highContrast,
                     self._firstColX + self._margin
                     )
                 )
+            self._rows.append(self.valueSlot(self.formatLanguagesChart(languageData)))
+            self._rows.append("</g>")
+            self._height += self.calculateLanguagesChartHeight(len(languageData["languages"]))
+
+    def insertLeaderboard(self, entries, categoryHeading) :
+        """Generates and inserts the SVG section for the leaderboard
+        of repositories. If there are no entries, then this does nothing.
+
+        Keyword arguments:
+        entries - The list of (name, count) tuples of the repositories.
+        categoryHeading - The heading for the section
+        """
+        if len(entries) > 0 :
+            scale = round(0.75 * 14 / 110, 3)
+            self._height += self._lineHeight
+            self._rows.append(self._render["groupHeader"](self._height, self._colors["text"]))
             self._rows.append(
-                StatsImageGenerator.pieTransform.format(
-                    svgPieChart(
-                        [L[1] for L in languageData["languages"]],
-                        self._pieRadius - 1,
-                        self._animateLanguageChart,
-                        self._animationSpeed
-                        ),
-                    str(offset+1),
-                    self._firstColX + self._margin + 1
+                self._render["tableHeaderNoColumns"](
+                    "{0:.3f}".format(scale),
+                    str(round(12.5/scale)),
+                    categoryHeading,
+                    round(self._metrics.calculateTextLength110Weighted(categoryHeading, 600))
                     )
                 )
-            diameter = self._pieRadius * 2
-            numRowsToLeft = round(diameter / self._lineHeight)
-            for i, L in enumerate(languageData["languages"]) :
-                if i < numRowsToLeft :
-                    lang = StatsImageGenerator.languageStringTemplate.format(
-                        L[0],
-                        100 * L[1]["percentage"]
-                        )
-                    self._rows.append(
-                        StatsImageGenerator.languageEntryTemplate.format(
-                            str(offset),
-                            L[1]["color"],
-                            self._highContrast,
-                            lang,
-                            "{0:.3f}".format(scale),
-                            str(round(25/scale)),
-                            str(round(12.5/scale)),
-                            round(calculateTextLength110Weighted(lang, 600))
-                            )
+            offset = self._lineHeight
+            icon = self.formatStatIcon(leaderboardRankings[self._leaderboardRanking])
+            for name, count in entries :
+                label, labelLength, data1, data1Length = self.formatLeaderboardEntry(name, count)
+                self._rows.append(self._render["tableEntryOneColumn"](
+                    str(offset),
+                    icon,
+                    "{0:.3f}".format(scale),
+                    str(round(12.5/scale)),
+                    self.valueSlot(label),
+                    str(round(25/scale)),
+                    self.valueSlot(data1),
+                    str(round(self._firstColX/scale)),
+                    self.valueSlot(labelLength),
+                    self.valueSlot(data1Length)
+                    ))
+                offset += self._lineHeight
+            self._rows.append("</g>")
+            self._height += offset
+
+    def formatLeaderboardEntry(self, name, count) :
+        """Formats an entry of the leaderboard, returning a tuple with
+        the name of the repository, its length, the count, and its length.
+
+        Keyword arguments:
+        name - The name of the repository.
+        count - The count of stars, forks, or watchers.
+        """
+        data1 = str(self.formatCount(count))
+        return (
+            name,
+            round(self._metrics.calculateTextLength110Weighted(name, 600)),
+            data1,
+            round(self._metrics.calculateTextLength110Weighted(data1, 600))
+            )
+
+    def insertCalendar(self, calendarData, categoryHeading) :
+        """Generates and inserts the SVG section for the contribution
+        calendar, whose cells are uses of shared definitions of a cell
+        of each color level.
+
+        Keyword arguments:
+        calendarData - The contribution calendar data
+        categoryHeading - The heading for the section
+        """
+        if len(calendarData["levels"]) > 0 :
+            scale = round(0.75 * 14 / 110, 3)
+            self._height += self._lineHeight
+            self._rows.append(
+                self._render["groupHeader"](
+                    self._height,
+                    self._colors["text"]
+                    )
+                )
+            self._rows.append(
+                self._render["tableHeaderNoColumns"](
+                    "{0:.3f}".format(scale),
+                    str(round(12.5/scale)),
+                    categoryHeading,
+                    round(self._metrics.calculateTextLength110Weighted(categoryHeading, 600))
+                    )
+                )
+            self._rows.append(
+                self._render["calendarTransform"](
+                    self._margin,
+                    self._lineHeight,
+                    self.calculateCalendarScale(calendarData)
+                    )
+                )
+            cells = []
+            for level, opacity in enumerate(StatsImageGenerator.calendarOpacities) :
+                cells.append(
+                    StatsImageGenerator.calendarCellTemplate.format(
+                        StatsImageGenerator.calendarCellIds[level],
+                        StatsImageGenerator.calendarCellSize,
+                        self._colors["text"] if level == 0 else self._colors["icons"],
+                        opacity
                         )
-                    offset += self._lineHeight
-                else :
-                    break
-            for j in range(numRowsToLeft, len(languageData["languages"]), 2) :
-                L = languageData["languages"][j]
+                    )
+            self._rows.append("<defs>" + "".join(cells) + "</defs>")
+            self._rows.append(self.valueSlot(self.formatCalendarCells(calendarData)))
+            self._rows.append("</g></g>")
+            self._height += self.calculateCalendarHeight(calendarData)
+
+    def formatCalendarCells(self, calendarData) :
+        """Formats the cells of the contribution calendar, one
+        column per week, in a single pass over the days.
+
+        Keyword arguments:
+        calendarData - The contribution calendar data
+        """
+        pitch = StatsImageGenerator.calendarCellPitch
+        ids = StatsImageGenerator.calendarCellIds
+        template = StatsImageGenerator.usePositionedTemplate
+        day = calendarData["firstWeekday"]
+        cells = []
+        for level in calendarData["levels"] :
+            cells.append(template.format(ids[level], pitch * (day // 7), pitch * (day % 7)))
+            day += 1
+        return "".join(cells)
+
+    def formatLanguagesChart(self, languageData) :
+        """Formats the pie chart and the list of languages of the
+        language distribution chart.
+
+        Keyword arguments:
+        languageData - The language stats data
+        """
+        scale = round(0.75 * 14 / 110, 3)
+        offset = self._lineHeight
+        rows = []
+        rows.append(
+            self._render["pieTransform"](
+                svgPieChart(
+                    [L[1] for L in languageData["languages"]],
+                    self._pieRadius - 1,
+                    self._animateLanguageChart,
+                    self._animationSpeed,
+                    precision=self._precision,
+                    cssAnimation=self._cssAnimation,
+                    minimumArcLength=StatsImageGenerator.minimumWedgeArcLength
+                    ),
+                str(offset+1),
+                self._firstColX + self._margin + 1
+                )
+            )
+        diameter = self._pieRadius * 2
+        numRowsToLeft = round(diameter / self._lineHeight)
+        for i, L in enumerate(languageData["languages"]) :
+            if i < numRowsToLeft :
                 lang = StatsImageGenerator.languageStringTemplate.format(
                     L[0],
                     100 * L[1]["percentage"]
                     )
-                if j+1 < len(languageData["languages"]) :
-                    L2 = languageData["languages"][j+1]
-                    lang2 = StatsImageGenerator.languageStringTemplate.format(
-                        L2[0],
-                        100 * L2[1]["percentage"]
-                        )
-                    self._rows.append(
-                        StatsImageGenerator.languageEntryTemplateTwoLangs.format(
-                            str(offset),
-                            L[1]["color"],
-                            self._highContrast,
-                            lang,
-                            "{0:.3f}".format(scale),
-                            str(round(25/scale)),
-                            str(round(12.5/scale)),
-                            round(calculateTextLength110Weighted(lang, 600)),
-                            L2[1]["color"], 
-                            self._firstColX + 0.5,
-                            lang2,
-                            str(round((self._firstColX + 25)/scale)),
-                            round(calculateTextLength110Weighted(lang2, 600))
-                            )
+                rows.append(
+                    self._render["languageEntry"](
+                        str(offset),
+                        L[1]["color"],
+                        self._highContrast,
+                        lang,
+                        "{0:.3f}".format(scale),
+                        str(round(25/scale)),
+                        str(round(12.5/scale)),
+                        round(self._metrics.calculateTextLength110Weighted(lang, 600))
                         )
-                    offset += self._lineHeight
-                else :
-                    self._rows.append(
-                        StatsImageGenerator.languageEntryTemplate.format(
-                            str(offset),
-                            L[1]["color"],
-                            self._highContrast,
-                            lang,
-                            "{0:.3f}".format(scale),
-                            str(round(25/scale)),
-                            str(round(12.5/scale)),
-                            round(calculateTextLength110Weighted(lang, 600))
-                            )
+                    )
+                offset += self._lineHeight
+            else :
+                break
+        for j in range(numRowsToLeft, len(languageData["languages"]), 2) :
+            L = languageData["languages"][j]
+            lang = StatsImageGenerator.languageStringTemplate.format(
+                L[0],
+                100 * L[1]["percentage"]
+                )
+            if j+1 < len(languageData["languages"]) :
+                L2 = languageData["languages"][j+1]
+                lang2 = StatsImageGenerator.languageStringTemplate.format(
+                    L2[0],
+                    100 * L2[1]["percentage"]
+                    )
+                rows.append(
+                    self._render["languageEntryTwoLangs"](
+                        str(offset),
+                        L[1]["color"],
+                        self._highContrast,
+                        lang,
+                        "{0:.3f}".format(scale),
+                        str(round(25/scale)),
+                        str(round(12.5/scale)),
+                        round(self._metrics.calculateTextLength110Weighted(lang, 600)),
+                        L2[1]["color"], 
+                        self._firstColX + 0.5,
+                        lang2,
+                        str(round((self._firstColX + 25)/scale)),
+                        round(self._metrics.calculateTextLength110Weighted(lang2, 600))
                         )
-                    offset += self._lineHeight
-            self._rows.append("</g>")
-            if diameter + self._lineHeight + self._lineHeight - self._margin - 1 <= offset :
-                self._height += offset
+                    )
+                offset += self._lineHeight
             else :
-                self._height += diameter + self._lineHeight + self._lineHeight - self._margin - 1
+                rows.append(
+                    self._render["languageEntry"](
+                        str(offset),
+                        L[1]["color"],
+                        self._highContrast,
+                        lang,
+                        "{0:.3f}".format(scale),
+                        str(round(25/scale)),
+                        str(round(12.5/scale)),
+                        round(self._metrics.calculateTextLength110Weighted(lang, 600))
+                        )
+                    )
+                offset += self._lineHeight
+        return "".join(rows)
 
     def formatCount(self, count) :
         """Formats the count.
@@ -529,7 +1344,7 @@ class StatsImageGenerator :
         Keyword arguments:
         count - The count to format.
         """
-        if (not self.isInt(count)) or count < 100000 :
+        if count < 100000 :
             return count
         elif count < 1000000 :
             return "{0:.1f}K".format(count // 100 * 100 / 1000)
@@ -544,13 +1359,75 @@ class StatsImageGenerator :
         height until the end.  Also inserts closing tags.
         """
         self._height += self._lineHeight
-        self._rows[0] = self._rows[0].format(str(self._height), str(self._width), self._locale)
-        self._rows[1] = self._rows[1].format(
-            str(self._height - 4),
+        self._rows[0] = self.formatHeader(self._height)
+        self._rows[1] = self.formatBackground(self._height)
+        self._rows.append(StatsImageGenerator.closingTags)
+
+    def formatHeader(self, height) :
+        """Formats the svg opening tag, followed by the fingerprint
+        if it is to be embedded.
+
+        Keyword arguments:
+        height - The height of the image.
+        """
+        header = StatsImageGenerator.headerTemplate.format(str(height), str(self._width), self._locale)
+        if self._embedFingerprint :
+            header += self.valueSlot(self.formatFingerprint())
+        return header
+
+    def formatFingerprint(self) :
+        """Formats the metadata element with the fingerprint."""
+        return StatsImageGenerator.fingerprintTemplate.format(self.calculateFingerprint())
+
+    def calculateFingerprint(self) :
+        """Calculates a fingerprint of the image, which is a sha256 digest of a
+        canonical form of the stats that are to be included, the complete
+        configuration of the image, and the source of the modules that render it.
+        Two images with the same fingerprint are identical, so if an existing image
+        has the fingerprint, then there is no need to generate it again.
+        """
+        stats = {
+            category : self._stats.getStatsByKey(category)
+            for category in self._categoryOrder if category not in self._exclude
+            }
+        configuration = [
+            self._colors,
+            self._locale,
+            self._radius,
+            self._titleSize,
+            self._categoryOrder,
+            self._animateLanguageChart,
+            self._animationSpeed,
+            self._cssAnimation,
+            self._leaderboardRanking,
+            self._leaderboardSize,
+            self._trends,
+            self._width,
+            self._title,
+            self._includeTitle,
+            sorted(self._exclude),
+            self._useDefs,
+            self._render is StatsImageGenerator.compactRenderers,
+            self._precision
+            ]
+        canonical = json.dumps(
+            [_calculateSourceDigest(), configuration, stats],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=StatValue.toPlain
+            )
+        return hashlib.sha256(canonical.encode(encoding="UTF-8")).hexdigest()
+
+    def formatBackground(self, height) :
+        """Formats the rect for the background.
+
+        Keyword arguments:
+        height - The height of the image.
+        """
+        return StatsImageGenerator.backgroundTemplate.format(
+            str(height - 4),
             self._colors["border"],
             self._colors["bg"],
             str(self._width - 4),
             self._radius
             )
-        self._rows.append("</g>\n</svg>\n")
-        
@@ -0,0 +1,386 @@
+#
+# user-statistician: Github action for generating a user stats card
+# 
+# Copyright (c) 2021-2022 Vincent A Cicirello
+# https://www.cicirello.org/
+#
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+from InternTable import sharedInternTable
+import heapq
+
+def _pushBounded(heap, entry) :
+    """Pushes an entry onto a min-heap of the top entries, replacing
+    the lowest if the heap already has StatsPartial.topSize entries.
+
+    Keyword arguments:
+    heap - The heap.
+    entry - The entry.
+    """
+    if len(heap) < StatsPartial.topSize :
+        heapq.heappush(heap, entry)
+    elif entry > heap[0] :
+        heapq.heapreplace(heap, entry)
+
+class StatsPartial :
+    """A partial aggregate of a user's statistics. All of the
+    statistics are kept as associative aggregates (sums and counts,
+    maximum and minimum candidates, bounded heaps of the top candidates,
+    and language size maps), so partials
+    computed from different page ranges of query results, in different
+    processes, or even for different users, can be merged exactly
+    without reparsing the query results.
+
+    Merging is associative, but for ties among the maximum and top
+    candidates the left operand wins (just like Python's max), so merge
+    partials in the same order as the pages they were computed from.
+    """
+
+    # The number of top candidates kept for each ranking.
+    topSize = 10
+
+    __slots__ = [
+        '_counts',
+        '_maxima',
+        '_minima',
+        '_tops',
+        '_languages',
+        '_internTable'
+        ]
+
+    def __init__(self, internTable=None) :
+        """Initializes an empty partial aggregate.
+
+        Keyword arguments:
+        internTable - The InternTable for the language names and colors. If None,
+            the table shared by the whole process is used.
+        """
+        self._counts = {}
+        self._maxima = {}
+        self._minima = {}
+        self._tops = {}
+        self._languages = {}
+        self._internTable = internTable if internTable != None else sharedInternTable
+
+    def addCount(self, key, amount) :
+        """Adds an amount to one of the sums or counts.
+
+        Keyword arguments:
+        key - The key of the count.
+        amount - The amount to add.
+        """
+        self._counts[key] = self._counts.get(key, 0) + amount
+
+    def getCount(self, key) :
+        """Gets one of the sums or counts, which is 0 if
+        nothing has been added to it.
+
+        Keyword arguments:
+        key - The key of the count.
+        """
+        return self._counts.get(key, 0)
+
+    def addMaxCandidate(self, key, value, label) :
+        """Offers a candidate for one of the maximums. The first
+        candidate offered wins in the case of ties.
+
+        Keyword arguments:
+        key - The key of the maximum.
+        value - The value to compare.
+        label - The label associated with the value (e.g., a repository name).
+        """
+        current = self._maxima.get(key)
+        if current == None or value > current[0] :
+            self._maxima[key] = (value, label)
+
+    def getMax(self, key) :
+        """Gets the label of one of the maximums, or None
+        if there were no candidates.
+
+        Keyword arguments:
+        key - The key of the maximum.
+        """
+        current = self._maxima.get(key)
+        return current[1] if current != None else None
+
+    def addMinCandidate(self, key, value) :
+        """Offers a candidate for one of the minimums.
+
+        Keyword arguments:
+        key - The key of the minimum.
+        value - The value to compare.
+        """
+        current = self._minima.get(key)
+        if current == None or value < current :
+            self._minima[key] = value
+
+    def getMin(self, key) :
+        """Gets one of the minimums, or None if there were no candidates.
+
+        Keyword arguments:
+        key - The key of the minimum.
+        """
+        return self._minima.get(key)
+
+    def addTopCandidate(self, key, value, label) :
+        """Offers a candidate for one of the rankings, which keeps the
+        top candidates in a min-heap bounded by topSize, so that ranking
+        n candidates costs O(n log topSize). Candidates offered earlier
+        win in the case of ties.
+
+        Keyword arguments:
+        key - The key of the ranking.
+        value - The value to compare.
+        label - The label associated with the value (e.g., a repository name).
+        """
+        top = self._tops.get(key)
+        if top == None :
+            top = self._tops[key] = [0, []]
+        # The heap entries are (value, -order, label), so the first
+        # entry is the lowest value, offered latest among ties.
+        _pushBounded(top[1], (value, -top[0], label))
+        top[0] += 1
+
+    def getTop(self, key) :
+        """Gets a list of (label, value) tuples of the top candidates
+        of one of the rankings, from highest to lowest, which is empty
+        if there were no candidates.
+
+        Keyword arguments:
+        key - The key of the ranking.
+        """
+        top = self._tops.get(key)
+        if top == None :
+            return []
+        return [ (label, value) for value, order, label in sorted(top[1], reverse=True) ]
+
+    def addLanguage(self, name, color, size) :
+        """Adds to the size of a language.
+
+        Keyword arguments:
+        name - The name of the language.
+        color - The color of the language, which may be None.
+        size - The size to add.
+        """
+        if name in self._languages :
+            self._languages[name][1] += size
+        else :
+            self._languages[self._internTable.intern(name)] = [self._internTable.intern(color), size]
+
+    def getLanguageIds(self) :
+        """Gets a dictionary mapping the integer ids of the languages, from
+        the partial's InternTable, to their sizes.
+        """
+        return { self._internTable.getId(name) : L[1] for name, L in self._languages.items() }
+
+    def getLanguageData(self) :
+        """Gets the total size of code with language detection data,
+        and a dictionary mapping language names to dictionaries of color,
+        size, and percentage, in the order the languages were first
+        encountered.
+        """
+        totalSize = self.getCount("languageTotalSize")
+        languageData = {}
+        if totalSize > 0 :
+            for name, L in self._languages.items() :
+                languageData[name] = {
+                    "color" : L[0],
+                    "size" : L[1],
+                    "percentage" : L[1] / totalSize
+                    }
+        return totalSize, languageData
+
+    def addBasicStats(self, user) :
+        """Adds the results of the basic stats query.
+
+        Keyword arguments:
+        user - The user object from the results of the basic stats query.
+        """
+        pastYearData = user["contributionsCollection"]
+        for key in [
+            "totalCommitContributions",
+            "totalIssueContributions",
+            "totalPullRequestContributions",
+            "totalPullRequestReviewContributions",
+            "restrictedContributionsCount"
+            ] :
+            self.addCount(key, pastYearData[key])
+        for year in pastYearData["contributionYears"] :
+            self.addMinCandidate("joined", year)
+        for key in [
+            "followers",
+            "following",
+            "sponsorshipsAsMaintainer",
+            "sponsorshipsAsSponsor",
+            "issues",
+            "pullRequests",
+            "repositoriesContributedTo"
+            ] :
+            self.addCount(key, user[key]["totalCount"])
+
+    def addPriorYearStats(self, years) :
+        """Adds the results of the prior year stats query.
+
+        Keyword arguments:
+        years - The user object from the results of the prior year stats query,
+            which maps one key per year to that year's contributions.
+        """
+        for stats in years.values() :
+            self.addCount("allYearsCommitContributions", stats["totalCommitContributions"])
+            self.addCount("allYearsPullRequestReviewContributions", stats["totalPullRequestReviewContributions"])
+            self.addCount("allYearsRestrictedContributionsCount", stats["restrictedContributionsCount"])
+
+    def addRepositories(self, nodes, languageRepoExclusions, watched=None) :
+        """Adds the owned repositories from one page of the repo stats query.
+
+        Keyword arguments:
+        nodes - The list of repository nodes.
+        languageRepoExclusions - A set of repositories (lowercase) to exclude from language stats.
+        watched - A set of the names of the owned repositories that the user is watching,
+            which are ranked by their watchers other than the user, or None.
+        """
+        for repo in nodes :
+            if repo["isPrivate"] :
+                self.addCount("privateRepositories", 1)
+                self.addCount("privateOrForkRepositories", 1)
+                continue
+            stars = repo["stargazerCount"]
+            forks = repo["forkCount"]
+            watchers = repo["watchers"]["totalCount"]
+            self.addCount("stargazersAll", stars)
+            self.addCount("forksAll", forks)
+            self.addCount("watchersAll", watchers)
+            if repo["isArchived"] :
+                self.addCount("archivedAll", 1)
+            if repo["isTemplate"] :
+                self.addCount("templatesAll", 1)
+            if repo["isFork"] :
+                self.addCount("privateOrForkRepositories", 1)
+                continue
+            self.addCount("stargazers", stars)
+            self.addCount("forks", forks)
+            self.addCount("watchers", watchers)
+            if repo["isArchived"] :
+                self.addCount("archived", 1)
+            if repo["isTemplate"] :
+                self.addCount("templates", 1)
+            self.addMaxCandidate("mostStarred", stars, repo["name"])
+            self.addMaxCandidate("mostForked", forks, repo["name"])
+            self.addTopCandidate("stars", stars, repo["name"])
+            self.addTopCandidate("forks", forks, repo["name"])
+            # Excludes the user watching their own repository, as the watchedBy stat does.
+            if watched != None and repo["name"] in watched :
+                watchers -= 1
+            self.addTopCandidate("watchers", watchers, repo["name"])
+            if repo["name"].lower() not in languageRepoExclusions :
+                self.addCount("languageTotalSize", repo["languages"]["totalSize"])
+                if repo["languages"]["edges"] != None :
+                    for L in repo["languages"]["edges"] :
+                        self.addLanguage(L["node"]["name"], L["node"]["color"], L["size"])
+
+    def addWatching(self, nodes) :
+        """Adds one page of the results of the query of the owned
+        repositories the user is watching.
+
+        Keyword arguments:
+        nodes - The list of repository nodes.
+        """
+        self.addCount("watchingNonForks", sum(1 for repo in nodes if not repo["isFork"]))
+
+    def addReposContributedTo(self, nodes, login) :
+        """Adds one page of the results of the query of repositories
+        contributed to.
+
+        Keyword arguments:
+        nodes - The list of repository nodes.
+        login - The user's login, used to exclude the user's own repositories.
+        """
+        self.addCount("contributedToOwnedByOthers", sum(1 for repo in nodes if repo["owner"]["login"] != login))
+
+    def merge(self, other) :
+        """Merges another partial aggregate into this one, and returns
+        this one. The other partial should cover pages that follow those
+        of this one.
+
+        Keyword arguments:
+        other - The other StatsPartial.
+        """
+        for key, amount in other._counts.items() :
+            self.addCount(key, amount)
+        for key, (value, label) in other._maxima.items() :
+            self.addMaxCandidate(key, value, label)
+        for key, value in other._minima.items() :
+            self.addMinCandidate(key, value)
+        for key, (offered, heap) in other._tops.items() :
+            top = self._tops.get(key)
+            if top == None :
+                top = self._tops[key] = [0, []]
+            # The other's candidates were offered after all of this one's.
+            for value, order, label in heap :
+                _pushBounded(top[1], (value, order - top[0], label))
+            top[0] += offered
+        for name, L in other._languages.items() :
+            self.addLanguage(name, L[0], L[1])
+        return self
+
+    def toDict(self) :
+        """Returns a JSON serializable dictionary with the contents
+        of this partial, such as for sending to another process.
+        """
+        return {
+            "counts" : dict(self._counts),
+            "maxima" : { k : list(v) for k, v in self._maxima.items() },
+            "minima" : dict(self._minima),
+            "tops" : { k : [v[0], [ list(e) for e in v[1] ]] for k, v in self._tops.items() },
+            "languages" : { k : list(v) for k, v in self._languages.items() }
+            }
+
+    @staticmethod
+    def fromDict(d, internTable=None) :
+        """Creates a partial from a dictionary produced by toDict.
+
+        Keyword arguments:
+        d - The dictionary.
+        internTable - The InternTable for the language names and colors. If None,
+            the table shared by the whole process is used.
+        """
+        partial = StatsPartial(internTable)
+        partial._counts = dict(d["counts"])
+        partial._maxima = { k : tuple(v) for k, v in d["maxima"].items() }
+        partial._minima = dict(d["minima"])
+        partial._tops = { k : [v[0], [ tuple(e) for e in v[1] ]] for k, v in d.get("tops", {}).items() }
+        for name, L in d["languages"].items() :
+            partial.addLanguage(name, L[0], L[1])
+        return partial
+
+def mergePartials(partials) :
+    """Merges a sequence of partial aggregates, in order, into a new
+    partial aggregate.
+
+    Keyword arguments:
+    partials - An iterable of StatsPartial objects.
+    """
+    result = StatsPartial()
+    for p in partials :
+        result.merge(p)
+    return result
@@ -27,12 +27,72 @@
 #
 
 from Statistician import Statistician, set_outputs
+from RepoStore import RepoStore
 from Colors import colorMapping, iconTemplates
 from StatsImageGenerator import StatsImageGenerator
-from StatConfig import supportedLocales, categoryOrder
+from StatConfig import supportedLocales, categoryOrder, optionalCategories, leaderboardRankings
+from StatsPartial import StatsPartial
+from StatsHistory import StatsHistory
 import sys
 import os
+import re
 import subprocess
+import gzip
+import datetime
+
+# Brotli sidecars are only supported if the brotli module is installed,
+# which it isn't in the action's container, so they are only available
+# when calling writeImageChunksToFile directly.
+try :
+    import brotli
+except ImportError :
+    brotli = None
+
+class BrotliWriter :
+    """Compresses bytes written to it with Brotli, writing
+    the compressed bytes to a file object."""
+
+    __slots__ = [
+        '_file',
+        '_compressor'
+        ]
+
+    def __init__(self, file) :
+        """Initializes the writer.
+
+        Keyword arguments:
+        file - A binary file object for the compressed bytes.
+        """
+        self._file = file
+        self._compressor = brotli.Compressor()
+
+    def write(self, data) :
+        """Compresses and writes bytes.
+
+        Keyword arguments:
+        data - The bytes.
+        """
+        self._file.write(self._compressor.process(data))
+
+    def close(self) :
+        """Finishes the compressed stream, without closing the file."""
+        self._file.write(self._compressor.finish())
+
+def openImageWriter(file, encoding) :
+    """Opens a writer that encodes an image into a file.
+
+    Keyword arguments:
+    file - A binary file object.
+    encoding - None to write the image as is, "gz" to compress it
+        with gzip, or "br" to compress it with Brotli.
+    """
+    if encoding == "gz" :
+        # A fixed mtime, so that the compressed image only changes
+        # if the image changes.
+        return gzip.GzipFile(filename="", mode="wb", fileobj=file, mtime=0)
+    elif encoding == "br" :
+        return BrotliWriter(file)
+    return file
 
 def writeImageToFile(filename, image, failOnError) :
     """Writes the image to a file, creating any
@@ -46,6 +106,28 @@ def writeImageToFile(filename, image, failOnError) :
         exit with no error code. In either case, an error message will be
         logged to the console.
     """
+    writeImageChunksToFile(filename, [image.encode(encoding="UTF-8")], failOnError)
+
+def writeImageChunksToFile(filename, chunks, failOnError, sidecars=()) :
+    """Writes the image to a file as it is generated, creating any
+    missing directories from the path. The chunks are written to a
+    temporary file in the same directory, which then replaces the
+    image, so that a partially written image is never committed.
+    If the filename ends with .svgz, then the image is compressed
+    with gzip. Any precompressed sidecars are written from the
+    same chunks, alongside the image.
+
+    Keyword arguments:
+    filename - The filename for the image, with complete path.
+    chunks - An iterable of bytes objects that together form the image.
+    failOnError - If True, the workflow will fail if there is an error
+        writing the image to a file; and if False, this action will quietly
+        exit with no error code. In either case, an error message will be
+        logged to the console.
+    sidecars - An iterable of the extensions of precompressed copies of the
+        image to write, "gz" for gzip and "br" for Brotli, such that the
+        sidecar of image.svg with extension "gz" is image.svg.gz.
+    """
     # Since we're running in a docker container, everything runs
     # as root. We need this umask call so we'll have write permissions
     # once the action finished and we're outside the container again.
@@ -54,15 +136,57 @@ def writeImageToFile(filename, image, failOnError) :
     directoryName = os.path.dirname(filename)
     if len(directoryName) > 0 :
         os.makedirs(directoryName, exist_ok=True, mode=0o777)
+    targets = [ (filename, "gz" if filename.lower().endswith(".svgz") else None) ]
+    targets.extend( (filename + "." + extension, extension) for extension in sidecars )
+    files = []
+    replaced = set()
     try:
-        # Write the image to a file
-        with open(filename, "wb") as file:
-            image = image.encode(encoding="UTF-8")
-            file.write(image)
+        # Write the image and sidecars to files
+        for targetFilename, encoding in targets :
+            file = open(targetFilename + ".tmp", "wb")
+            files.append( (targetFilename, file, openImageWriter(file, encoding)) )
+        for chunk in chunks :
+            for targetFilename, file, writer in files :
+                writer.write(chunk)
+        for targetFilename, file, writer in files :
+            if writer is not file :
+                writer.close()
+            file.close()
+        for targetFilename, file, writer in files :
+            os.replace(targetFilename + ".tmp", targetFilename)
+            replaced.add(targetFilename)
     except IOError:
         print("Error (4): An error occurred while writing the image to a file.")
         set_outputs({"exit-code" : 4})
         exit(4 if failOnError else 0)
+    finally:
+        # Whether writing succeeded, failed, or was interrupted by an
+        # exception from generating the chunks or compressing them,
+        # close all of the files and remove any temporary files.
+        for targetFilename, file, writer in files :
+            file.close()
+            if targetFilename not in replaced and os.path.exists(targetFilename + ".tmp") :
+                os.remove(targetFilename + ".tmp")
+
+def readImageFingerprint(filename) :
+    """Reads the fingerprint embedded in an existing image, which
+    immediately follows the svg opening tag. Returns None if the
+    image doesn't exist or doesn't have a fingerprint.
+
+    Keyword arguments:
+    filename - The filename for the image, with complete path.
+    """
+    try :
+        if filename.lower().endswith(".svgz") :
+            with gzip.open(filename, "rb") as file :
+                start = file.read(1024)
+        else :
+            with open(filename, "rb") as file :
+                start = file.read(1024)
+    except (IOError, EOFError) :
+        return None
+    match = re.search(rb"<metadata>user-statistician:([0-9a-f]{64})</metadata>", start)
+    return match.group(1).decode() if match != None else None
 
 def executeCommand(arguments) :
     """Execute a subprocess and return result and exit code.
@@ -77,11 +201,11 @@ def executeCommand(arguments) :
         )
     return result.stdout.strip(), result.returncode
 
-def commitAndPush(filename, name, login, failOnError) :
-    """Commits and pushes the image.
+def commitAndPush(filenames, name, login, failOnError) :
+    """Commits and pushes the image, and its sidecars if any.
 
     Keyword arguments:
-    filename - The path to the image.
+    filenames - A list of the paths to the image and its sidecars.
     name - The user's name.
     login - The user's login id.
     """
@@ -89,16 +213,16 @@ def commitAndPush(filename, name, login, failOnError) :
     result = executeCommand(["git", "symbolic-ref", "-q", "HEAD"])
     if result[1] == 0 :
         # Check if the image changed
-        result = executeCommand(["git", "status", "--porcelain", filename])
+        result = executeCommand(["git", "status", "--porcelain"] + filenames)
         if len(result[0]) > 0 :
             # Commit and push
             executeCommand(["git", "config", "--global", "user.name", name])
             executeCommand(["git", "config", "--global",
                             "user.email", login + '@users.noreply.github.com'])
-            executeCommand(["git", "add", filename])
+            executeCommand(["git", "add"] + filenames)
             executeCommand(["git", "commit", "-m",
-                            "Automated change by https://github.com/cicirello/user-statistician",
-                           filename])
+                            "Automated change by https://github.com/cicirello/user-statistician"]
+                           + filenames)
             r = executeCommand(["git", "push"])
             if r[1] != 0 :
                 print("Error (5): push failed.")
@@ -164,7 +288,7 @@ if __name__ == "__main__" :
         maxLanguages = 1000 # doesn't really matter, but should be an int
 
     categories = sys.argv[13].strip().replace(",", " ").lower().split()
-    validCategoryKeys = set(categoryOrder)
+    validCategoryKeys = set(categoryOrder) | set(optionalCategories)
     categories = [ c for c in categories if c in validCategoryKeys]
     if len(categories) == 0 :
         categories = categoryOrder
@@ -185,14 +309,51 @@ if __name__ == "__main__" :
         colors.pop("title-icon", None)
     elif topIcon != "default" and topIcon in iconTemplates :
         colors["title-icon"] = topIcon
+
+    repoStoreFilename = sys.argv[20].strip()
+    repoStore = RepoStore.load(repoStoreFilename) if len(repoStoreFilename) > 0 else None
+
+    useDefs = sys.argv[21].strip().lower() == "true"
+
+    compact = sys.argv[22].strip().lower() == "true"
+
+    sidecars = []
+    for sidecar in sys.argv[23].strip().replace(",", " ").lower().split() :
+        if sidecar in {"gzip", "gz"} :
+            if "gz" not in sidecars :
+                sidecars.append("gz")
+        else :
+            print("Warning: Skipping the unsupported sidecar " + sidecar + ", since only gzip is supported.")
+
+    cssAnimation = sys.argv[24].strip().lower() == "true"
+
+    leaderboardRanking = sys.argv[25].strip().lower()
+    if leaderboardRanking not in leaderboardRankings :
+        leaderboardRanking = "stars"
+
+    leaderboardSize = min(max(int(sys.argv[26].strip()), 1), StatsPartial.topSize)
+
+    historyFilename = sys.argv[27].strip()
         
     stats = Statistician(
         failOnError,
         autoLanguages,
         maxLanguages,
         languageRepoExclusions,
-        featuredRepo
+        featuredRepo,
+        lazy=True,
+        repoStore=repoStore
         )
+    trends = None
+    if len(historyFilename) > 0 :
+        history = StatsHistory(historyFilename)
+        try :
+            history.appendStats(datetime.date.today().toordinal(), stats)
+        except IOError :
+            # Not fatal, the sparklines just won't include this run.
+            print("Warning: Failed to update the stats history:", historyFilename)
+        trends = history.readTrends(StatsImageGenerator.sparklinePoints)
+
     generator = StatsImageGenerator(
         stats,
         colors,
@@ -205,13 +366,38 @@ if __name__ == "__main__" :
         width,
         customTitle,
         includeTitle,
-        exclude
+        exclude,
+        useDefs=useDefs,
+        compact=compact,
+        embedFingerprint=True,
+        cssAnimation=cssAnimation,
+        leaderboardRanking=leaderboardRanking,
+        leaderboardSize=leaderboardSize,
+        trends=trends
         )
-    image = generator.generateImage()
-    writeImageToFile(imageFilenameWithPath, image, failOnError)
 
-    if commit :
-        commitAndPush(imageFilenameWithPath, "github-actions", "41898282+github-actions[bot]", failOnError)
+    # If the existing image has the same fingerprint, then it is identical to the
+    # image that would be generated. Since the workflow runs in a fresh checkout,
+    # the existing image was committed, so there is nothing to write or commit.
+    filenames = [imageFilenameWithPath] + [ imageFilenameWithPath + "." + extension for extension in sidecars ]
+    upToDate = (
+        readImageFingerprint(imageFilenameWithPath) == generator.calculateFingerprint()
+        and all(os.path.exists(f) for f in filenames)
+        )
+    if upToDate :
+        print("The stats and configuration are unchanged, so the image is already up to date.")
+    else :
+        writeImageChunksToFile(imageFilenameWithPath, generator.generateImageChunks(), failOnError, sidecars)
+
+    if repoStore != None :
+        try :
+            repoStore.save(repoStoreFilename)
+        except IOError :
+            # Not fatal, the next run will just do a full refresh.
+            print("Warning: Failed to save the repository store:", repoStoreFilename)
+
+    if commit and not upToDate :
+        commitAndPush(filenames, "github-actions", "41898282+github-actions[bot]", failOnError)
     
     set_outputs({"exit-code" : 0})
     
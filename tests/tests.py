@@ -30,12 +30,28 @@ import sys
 sys.path.insert(0,'src')
 from Statistician import *
 from StatsImageGenerator import StatsImageGenerator
-from UserStatistician import writeImageToFile
+from PieChart import svgPieChart, _wedgeGeometry
+from StatsPartial import StatsPartial, mergePartials
+from RepoStore import RepoStore
+from ImageSkeleton import ImageSkeleton, SkeletonCache
+from StatsHistory import StatsHistory
+from StatValue import StatValue
+import JsonDecoder
+from InternTable import InternTable
+from UserStatistician import writeImageToFile, writeImageChunksToFile, readImageFingerprint, brotli
 from Colors import *
 from StatConfig import *
 from ColorUtil import isValidColor, _namedColors, highContrastingColor, contrastRatio
 from TextLength import *
+from TextLength import _loadWidths, _characterLength, _kerning
+from LabelWidths import labelWidths, titleTemplateWidths
 import copy
+import gzip
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Set to True to cause tests to generate a sample SVG, or False not to.
 outputSampleSVG = False
@@ -46,7 +62,7 @@ executedQueryResultsOriginal = [
 
     [{'data': {'user': {'repositories': {'totalCount': 31, 'nodes': [{'stargazerCount': 0, 'forkCount': 0, 'isArchived': True, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo1', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 7139, 'edges': [{'size': 7139, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo2', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 4, 'totalSize': 1479512, 'edges': [{'size': 1309108, 'node': {'color': '#e34c26', 'name': 'HTML'}}, {'size': 168479, 'node': {'color': '#3D6117', 'name': 'TeX'}}, {'size': 1721, 'node': {'color': '#563d7c', 'name': 'CSS'}}, {'size': 204, 'node': {'color': '#f1e05a', 'name': 'JavaScript'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo3', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 5842, 'edges': [{'size': 5842, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 3, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo4', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 45961, 'edges': [{'size': 44035, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 1926, 'node': {'color': '#89e051', 'name': 'Shell'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': True, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo5', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 7717, 'edges': [{'size': 7717, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo6', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 8491, 'edges': [{'size': 8491, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 0, 'forkCount': 3, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo7', 'watchers': {'totalCount': 2}, 'languages': {'totalCount': 1, 'totalSize': 74003, 'edges': [{'size': 74003, 'node': {'color': '#3572A5', 'name': 'Python'}}]}}, {'stargazerCount': 3, 'forkCount': 2, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo8', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 739339, 'edges': [{'size': 739339, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 2, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo9', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 52285, 'edges': [{'size': 52285, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 7, 'forkCount': 4, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo10', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 2100055, 'edges': [{'size': 2100055, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 3, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo11', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 3, 'totalSize': 266774, 'edges': [{'size': 198236, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 34345, 'node': {'color': '#3D6117', 'name': 'TeX'}}, {'size': 34193, 'node': {'color': '#e34c26', 'name': 'HTML'}}]}}, {'stargazerCount': 3, 'forkCount': 2, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo12', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 39091, 'edges': [{'size': 38882, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 209, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo13', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 0, 'forkCount': 1, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo14', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 852, 'edges': [{'size': 852, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo15', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 787, 'edges': [{'size': 787, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 1, 'forkCount': 2, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo16', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 1412, 'edges': [{'size': 1412, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo17', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 2, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo18', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 31866, 'edges': [{'size': 31656, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 210, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo19', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 692, 'edges': [{'size': 692, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 2, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo20', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 4, 'totalSize': 36101, 'edges': [{'size': 26436, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 7807, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 1758, 'node': {'color': '#427819', 'name': 'Makefile'}}, {'size': 100, 'node': {'color': '#C1F12E', 'name': 'Batchfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo21', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 107241, 'edges': [{'size': 106048, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 1193, 'node': {'color': '#427819', 'name': 'Makefile'}}]}}, {'stargazerCount': 1, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': True, 'name': 'repo22', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 1943, 'edges': [{'size': 1469, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 474, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 9, 'forkCount': 14, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo23', 'watchers': {'totalCount': 2}, 'languages': {'totalCount': 2, 'totalSize': 46228, 'edges': [{'size': 45994, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 234, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo24', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 91844, 'edges': [{'size': 90353, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 1491, 'node': {'color': '#427819', 'name': 'Makefile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo25', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo26', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 1984, 'edges': [{'size': 1763, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 221, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo27', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo28', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo29', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 3, 'totalSize': 75220, 'edges': [{'size': 72961, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 1902, 'node': {'color': '#e10098', 'name': 'GraphQL'}}, {'size': 357, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': True, 'isPrivate': False, 'isTemplate': False, 'name': 'repo30', 'watchers': {'totalCount': 0}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': True, 'isPrivate': False, 'isTemplate': False, 'name': 'repo31', 'watchers': {'totalCount': 0}, 'languages': {'totalCount': 7, 'totalSize': 1415534, 'edges': [{'size': 998990, 'node': {'color': '#f1e05a', 'name': 'JavaScript'}}, {'size': 247728, 'node': {'color': '#2b7489', 'name': 'TypeScript'}}, {'size': 127643, 'node': {'color': '#e34c26', 'name': 'HTML'}}, {'size': 26509, 'node': {'color': '#c6538c', 'name': 'SCSS'}}, {'size': 5854, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 5303, 'node': {'color': '#89e051', 'name': 'Shell'}}, {'size': 3507, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}], 'pageInfo': {'hasNextPage': False, 'endCursor': 'Y3Vyc29yOnYyOpHOFwfoDg=='}}}}}],
 
-    [{'data': {'user': {'watching': {'totalCount': 28, 'nodes': [{'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}], 'pageInfo': {'hasNextPage': False, 'endCursor': 'Mjg'}}}}}],
+    [{'data': {'user': {'watching': {'totalCount': 28, 'nodes': [{'isFork': False, 'name': 'repo1'}, {'isFork': False, 'name': 'repo2'}, {'isFork': False, 'name': 'repo3'}, {'isFork': False, 'name': 'repo4'}, {'isFork': False, 'name': 'repo5'}, {'isFork': False, 'name': 'repo6'}, {'isFork': False, 'name': 'repo8'}, {'isFork': False, 'name': 'repo9'}, {'isFork': False, 'name': 'repo10'}, {'isFork': False, 'name': 'repo11'}, {'isFork': False, 'name': 'repo12'}, {'isFork': False, 'name': 'repo13'}, {'isFork': False, 'name': 'repo14'}, {'isFork': False, 'name': 'repo15'}, {'isFork': False, 'name': 'repo16'}, {'isFork': False, 'name': 'repo17'}, {'isFork': False, 'name': 'repo18'}, {'isFork': False, 'name': 'repo19'}, {'isFork': False, 'name': 'repo20'}, {'isFork': False, 'name': 'repo21'}, {'isFork': False, 'name': 'repo22'}, {'isFork': False, 'name': 'repo23'}, {'isFork': False, 'name': 'repo24'}, {'isFork': False, 'name': 'repo25'}, {'isFork': False, 'name': 'repo26'}, {'isFork': False, 'name': 'repo27'}, {'isFork': False, 'name': 'repo28'}, {'isFork': False, 'name': 'repo29'}], 'pageInfo': {'hasNextPage': False, 'endCursor': 'Mjg'}}}}}],
 
     {'data': {'user': {'year2021': {'totalCommitContributions': 1850, 'totalPullRequestReviewContributions': 223, 'restrictedContributionsCount': 105}, 'year2020': {'totalCommitContributions': 1845, 'totalPullRequestReviewContributions': 92, 'restrictedContributionsCount': 0}, 'year2019': {'totalCommitContributions': 194, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2018': {'totalCommitContributions': 198, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2017': {'totalCommitContributions': 177, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2016': {'totalCommitContributions': 138, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2015': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2014': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2013': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2012': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2011': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}}}},
 
@@ -58,13 +74,53 @@ executedQueryResultsMultiPage = [
 
     [{'data': {'user': {'repositories': {'totalCount': 31, 'nodes': [{'stargazerCount': 0, 'forkCount': 0, 'isArchived': True, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo1', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 7139, 'edges': [{'size': 7139, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo2', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 4, 'totalSize': 1479512, 'edges': [{'size': 1309108, 'node': {'color': '#e34c26', 'name': 'HTML'}}, {'size': 168479, 'node': {'color': '#3D6117', 'name': 'TeX'}}, {'size': 1721, 'node': {'color': '#563d7c', 'name': 'CSS'}}, {'size': 204, 'node': {'color': '#f1e05a', 'name': 'JavaScript'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo3', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 5842, 'edges': [{'size': 5842, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 3, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo4', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 45961, 'edges': [{'size': 44035, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 1926, 'node': {'color': '#89e051', 'name': 'Shell'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': True, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo5', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 7717, 'edges': [{'size': 7717, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo6', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 8491, 'edges': [{'size': 8491, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 0, 'forkCount': 3, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo7', 'watchers': {'totalCount': 2}, 'languages': {'totalCount': 1, 'totalSize': 74003, 'edges': [{'size': 74003, 'node': {'color': '#3572A5', 'name': 'Python'}}]}}, {'stargazerCount': 3, 'forkCount': 2, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo8', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 739339, 'edges': [{'size': 739339, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 2, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo9', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 52285, 'edges': [{'size': 52285, 'node': {'color': '#b07219', 'name': 'Java'}}]}}, {'stargazerCount': 7, 'forkCount': 4, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo10', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 2100055, 'edges': [{'size': 2100055, 'node': {'color': '#b07219', 'name': 'Java'}}]}}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'Y3Vyc29yOnYyOpHOEEbJCQ=='}}}}}, {'data': {'user': {'repositories': {'totalCount': 31, 'nodes': [{'stargazerCount': 3, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo11', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 3, 'totalSize': 266774, 'edges': [{'size': 198236, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 34345, 'node': {'color': '#3D6117', 'name': 'TeX'}}, {'size': 34193, 'node': {'color': '#e34c26', 'name': 'HTML'}}]}}, {'stargazerCount': 3, 'forkCount': 2, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo12', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 39091, 'edges': [{'size': 38882, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 209, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo13', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 0, 'forkCount': 1, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo14', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 852, 'edges': [{'size': 852, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo15', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 787, 'edges': [{'size': 787, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 1, 'forkCount': 2, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo16', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 1412, 'edges': [{'size': 1412, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo17', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 2, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo18', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 31866, 'edges': [{'size': 31656, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 210, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo19', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 1, 'totalSize': 692, 'edges': [{'size': 692, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 2, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo20', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 4, 'totalSize': 36101, 'edges': [{'size': 26436, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 7807, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 1758, 'node': {'color': '#427819', 'name': 'Makefile'}}, {'size': 100, 'node': {'color': '#C1F12E', 'name': 'Batchfile'}}]}}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'Y3Vyc29yOnYyOpHOEcjkCw=='}}}}}, {'data': {'user': {'repositories': {'totalCount': 31, 'nodes': [{'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo21', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 107241, 'edges': [{'size': 106048, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 1193, 'node': {'color': '#427819', 'name': 'Makefile'}}]}}, {'stargazerCount': 1, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': True, 'name': 'repo22', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 1943, 'edges': [{'size': 1469, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 474, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 9, 'forkCount': 14, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo23', 'watchers': {'totalCount': 2}, 'languages': {'totalCount': 2, 'totalSize': 46228, 'edges': [{'size': 45994, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 234, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo24', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 91844, 'edges': [{'size': 90353, 'node': {'color': '#b07219', 'name': 'Java'}}, {'size': 1491, 'node': {'color': '#427819', 'name': 'Makefile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo25', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo26', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 2, 'totalSize': 1984, 'edges': [{'size': 1763, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 221, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo27', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo28', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': False, 'isPrivate': False, 'isTemplate': False, 'name': 'repo29', 'watchers': {'totalCount': 1}, 'languages': {'totalCount': 3, 'totalSize': 75220, 'edges': [{'size': 72961, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 1902, 'node': {'color': '#e10098', 'name': 'GraphQL'}}, {'size': 357, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}, {'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': True, 'isPrivate': False, 'isTemplate': False, 'name': 'repo30', 'watchers': {'totalCount': 0}, 'languages': {'totalCount': 0, 'totalSize': 0, 'edges': []}}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'Y3Vyc29yOnYyOpHOFvwXeA=='}}}}}, {'data': {'user': {'repositories': {'totalCount': 31, 'nodes': [{'stargazerCount': 0, 'forkCount': 0, 'isArchived': False, 'isFork': True, 'isPrivate': False, 'isTemplate': False, 'name': 'repo31', 'watchers': {'totalCount': 0}, 'languages': {'totalCount': 7, 'totalSize': 1415534, 'edges': [{'size': 998990, 'node': {'color': '#f1e05a', 'name': 'JavaScript'}}, {'size': 247728, 'node': {'color': '#2b7489', 'name': 'TypeScript'}}, {'size': 127643, 'node': {'color': '#e34c26', 'name': 'HTML'}}, {'size': 26509, 'node': {'color': '#c6538c', 'name': 'SCSS'}}, {'size': 5854, 'node': {'color': '#3572A5', 'name': 'Python'}}, {'size': 5303, 'node': {'color': '#89e051', 'name': 'Shell'}}, {'size': 3507, 'node': {'color': '#384d54', 'name': 'Dockerfile'}}]}}], 'pageInfo': {'hasNextPage': False, 'endCursor': 'Y3Vyc29yOnYyOpHOFwfoDg=='}}}}}],
 
-    [{'data': {'user': {'watching': {'totalCount': 28, 'nodes': [{'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'MTA'}}}}}, {'data': {'user': {'watching': {'totalCount': 28, 'nodes': [{'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'MjA'}}}}}, {'data': {'user': {'watching': {'totalCount': 28, 'nodes': [{'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}, {'isFork': False}], 'pageInfo': {'hasNextPage': False, 'endCursor': 'Mjg'}}}}}],
+    [{'data': {'user': {'watching': {'totalCount': 28, 'nodes': [{'isFork': False, 'name': 'repo1'}, {'isFork': False, 'name': 'repo2'}, {'isFork': False, 'name': 'repo3'}, {'isFork': False, 'name': 'repo4'}, {'isFork': False, 'name': 'repo5'}, {'isFork': False, 'name': 'repo6'}, {'isFork': False, 'name': 'repo8'}, {'isFork': False, 'name': 'repo9'}, {'isFork': False, 'name': 'repo10'}, {'isFork': False, 'name': 'repo11'}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'MTA'}}}}}, {'data': {'user': {'watching': {'totalCount': 28, 'nodes': [{'isFork': False, 'name': 'repo12'}, {'isFork': False, 'name': 'repo13'}, {'isFork': False, 'name': 'repo14'}, {'isFork': False, 'name': 'repo15'}, {'isFork': False, 'name': 'repo16'}, {'isFork': False, 'name': 'repo17'}, {'isFork': False, 'name': 'repo18'}, {'isFork': False, 'name': 'repo19'}, {'isFork': False, 'name': 'repo20'}, {'isFork': False, 'name': 'repo21'}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'MjA'}}}}}, {'data': {'user': {'watching': {'totalCount': 28, 'nodes': [{'isFork': False, 'name': 'repo22'}, {'isFork': False, 'name': 'repo23'}, {'isFork': False, 'name': 'repo24'}, {'isFork': False, 'name': 'repo25'}, {'isFork': False, 'name': 'repo26'}, {'isFork': False, 'name': 'repo27'}, {'isFork': False, 'name': 'repo28'}, {'isFork': False, 'name': 'repo29'}], 'pageInfo': {'hasNextPage': False, 'endCursor': 'Mjg'}}}}}],
     
     {'data': {'user': {'year2021': {'totalCommitContributions': 1850, 'totalPullRequestReviewContributions': 223, 'restrictedContributionsCount': 105}, 'year2020': {'totalCommitContributions': 1845, 'totalPullRequestReviewContributions': 92, 'restrictedContributionsCount': 0}, 'year2019': {'totalCommitContributions': 194, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2018': {'totalCommitContributions': 198, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2017': {'totalCommitContributions': 177, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2016': {'totalCommitContributions': 138, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2015': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2014': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2013': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2012': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}, 'year2011': {'totalCommitContributions': 0, 'totalPullRequestReviewContributions': 0, 'restrictedContributionsCount': 0}}}},
 
     [{'data': {'user': {'topRepositories': {'totalCount': 34, 'nodes': [{'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'MTA'}}}}}, {'data': {'user': {'topRepositories': {'totalCount': 34, 'nodes': [{'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someUserA'}}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'MjA'}}}}}, {'data': {'user': {'topRepositories': {'totalCount': 34, 'nodes': [{'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someUserA'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someUserB'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someUserC'}}, {'owner': {'login': 'someUserD'}}, {'owner': {'login': 'someUserE'}}], 'pageInfo': {'hasNextPage': True, 'endCursor': 'MzA'}}}}}, {'data': {'user': {'topRepositories': {'totalCount': 34, 'nodes': [{'owner': {'login': 'someuser'}}, {'owner': {'login': 'someuser'}}, {'owner': {'login': 'someUserA'}}, {'owner': {'login': 'someUserF'}}], 'pageInfo': {'hasNextPage': False, 'endCursor': 'MzQ'}}}}}]
     ]
 
+class NoQueries(Statistician) :
+    """A Statistician that parses query results (by default, a copy of
+    executedQueryResultsOriginal) rather than executing the queries."""
+
+    def __init__(self, fail, autoLanguages, maxLanguages, languageRepoExclusions, featuredRepo, queryResults=None) :
+        if queryResults == None :
+            queryResults = copy.deepcopy(executedQueryResultsOriginal)
+        self._autoLanguages = autoLanguages
+        self._maxLanguages = maxLanguages if maxLanguages >= 1 else 1
+        self._languageRepoExclusions = languageRepoExclusions
+        self._featuredRepo = featuredRepo
+        self.parseStats(
+            queryResults[0],
+            queryResults[1],
+            queryResults[2],
+            queryResults[4]
+            )
+        self.parsePriorYearStats(queryResults[3])
+
+def makeGenerator(stats, **overrides) :
+    """Creates a StatsImageGenerator of the stats, with the options that
+    the tests use unless overridden by keyword. The colors are copied."""
+    options = {
+        "colors" : colorMapping["halloween"],
+        "locale" : "en",
+        "radius" : 6,
+        "titleSize" : 18,
+        "categories" : categoryOrder,
+        "animateLanguageChart" : True,
+        "animationSpeed" : 10,
+        "width" : 0,
+        "customTitle" : None,
+        "includeTitle" : True,
+        "exclude" : set()
+        }
+    options.update(overrides)
+    options["colors"] = copy.deepcopy(options["colors"])
+    options["categories"] = options["categories"][:]
+    return StatsImageGenerator(stats, **options)
+
 class TestSomething(unittest.TestCase) :
 
     def test_parseQueryResults(self) :
@@ -159,6 +215,222 @@ class TestSomething(unittest.TestCase) :
         stats = NoQueries(True, False, 1000, set(), None)
         self._validateAllForks(stats)
 
+    def test_mergePartials(self) :
+        executedQueryResults = copy.deepcopy(executedQueryResultsMultiPage)
+        class NoQueries(Statistician) :
+            def __init__(self, fail, autoLanguages, maxLanguages, languageRepoExclusions, featuredRepo) :
+                self._autoLanguages = autoLanguages
+                self._maxLanguages = maxLanguages if maxLanguages >= 1 else 1
+                self._languageRepoExclusions = languageRepoExclusions
+                self._featuredRepo = featuredRepo
+                self._login = "someuser"
+                # One partial per page, as if computed by separate workers.
+                partials = [ StatsPartial() for page in executedQueryResults[1] ]
+                partials[0].addBasicStats(executedQueryResults[0]["data"]["user"])
+                partials[0].addCount("ownedRepositories", executedQueryResults[1][0]["data"]["user"]["repositories"]["totalCount"])
+                partials[0].addCount("watching", executedQueryResults[2][0]["data"]["user"]["watching"]["totalCount"])
+                for p, page in zip(partials, executedQueryResults[1]) :
+                    p.addRepositories(page["data"]["user"]["repositories"]["nodes"], languageRepoExclusions)
+                for page in executedQueryResults[2] :
+                    partials[-1].addWatching(page["data"]["user"]["watching"]["nodes"])
+                partials[-1].addPriorYearStats(executedQueryResults[3]["data"]["user"])
+                serialized = [ json.dumps(p.toDict()) for p in partials ]
+                self.parsePartial(mergePartials(StatsPartial.fromDict(json.loads(p)) for p in serialized))
+        self.assertTrue(len(executedQueryResults[1]) > 1)
+        stats = NoQueries(True, False, 1000, set(), None)
+        self._validate(stats)
+        stats = NoQueries(True, False, 1000, {"repo29", "repoDoesntExist"}, None)
+        self._validate(stats, True)
+
+    def test_lazyEvaluation(self) :
+        executedQueryResults = copy.deepcopy(executedQueryResultsOriginal)
+        queryFiles = {
+            "basicstats" : 0,
+            "repostats" : 1,
+            "watchingAdjustment" : 2,
+            "singleYearQueryFragment" : 3,
+            "reposContributedTo" : 4
+            }
+        class FakeQueries(Statistician) :
+            __slots__ = [ 'executed' ]
+            def __init__(self, fail, autoLanguages, maxLanguages, languageRepoExclusions, featuredRepo, lazy=False) :
+                self.executed = []
+                Statistician.__init__(self, fail, autoLanguages, maxLanguages, languageRepoExclusions, featuredRepo, lazy)
+            def ghDisableInteractivePrompts(self) :
+                pass
+            def loadQuery(self, queryFilepath, failOnError=True) :
+                return queryFilepath
+            def executeQuery(self, query, needsPagination=False, failOnError=True) :
+                name = next(k for k in queryFiles if query.find(k) >= 0)
+                self.executed.append(name)
+                return copy.deepcopy(executedQueryResults[queryFiles[name]])
+        eager = FakeQueries(True, False, 1000, set(), None)
+        self.assertEqual(5, len(eager.executed))
+        self._validate(eager)
+        
+        stats = FakeQueries(True, False, 1000, set(), None, True)
+        self.assertEqual(["basicstats"], stats.executed)
+        self.assertEqual(eager._name, stats._name)
+        stats.getStatsByKey("languages")
+        self.assertEqual(["basicstats", "watchingAdjustment", "repostats"], stats.executed)
+        self._validateLanguages(stats)
+
+        stats = FakeQueries(True, False, 1000, set(), None, True)
+        stats.getStatsByKey("contributions")
+        stats.getStatsByKey("contributions")
+        self.assertEqual(["basicstats", "singleYearQueryFragment"], stats.executed)
+        self.assertEqual(eager._contrib, stats._contrib)
+
+        stats = FakeQueries(True, False, 1000, set(), None, True)
+        for category in categoryOrder :
+            stats.getStatsByKey(category)
+        self.assertEqual(["basicstats", "watchingAdjustment", "repostats", "singleYearQueryFragment"], stats.executed)
+        self._validate(stats)
+
+    def test_repoStoreRefresh(self) :
+        executedQueryResults = copy.deepcopy(executedQueryResultsOriginal)
+        repositories = executedQueryResults[1][0]["data"]["user"]["repositories"]["nodes"]
+        for i, repo in enumerate(repositories) :
+            repo["id"] = "R" + str(i)
+            repo["updatedAt"] = "2022-10-{0:02d}T12:00:00Z".format(i + 1)
+        class FakeQueries(Statistician) :
+            __slots__ = [ 'executed' ]
+            def __init__(self, repoStore) :
+                self.executed = 0
+                Statistician.__init__(self, True, False, 1000, set(), None, False, repoStore)
+            def ghDisableInteractivePrompts(self) :
+                pass
+            def loadQuery(self, queryFilepath, failOnError=True) :
+                return queryFilepath
+            def executeQuery(self, query, needsPagination=False, failOnError=True, variables=None) :
+                if query.find("repostatsIds") >= 0 :
+                    # The ids, in the default order of the repo stats query.
+                    return [ { "data" : { "user" : { "repositories" : {
+                        "totalCount" : len(repositories),
+                        "nodes" : [ { "id" : repo["id"] } for repo in repositories[start:start+10] ],
+                        "pageInfo" : {
+                            "hasNextPage" : start + 10 < len(repositories),
+                            "endCursor" : str(start + 10)
+                            }
+                        } } } } for start in range(0, len(repositories), 10) ]
+                if query.find("repostatsUpdated") >= 0 :
+                    self.executed += 1
+                    ordered = sorted(repositories, key=lambda repo : repo["updatedAt"], reverse=True)
+                    start = 0 if variables == None else int(variables["endCursor"])
+                    return { "data" : { "user" : { "repositories" : {
+                        "totalCount" : len(repositories),
+                        "nodes" : copy.deepcopy(ordered[start:start+10]),
+                        "pageInfo" : {
+                            "hasNextPage" : start + 10 < len(ordered),
+                            "endCursor" : str(start + 10)
+                            }
+                        } } } }
+                for name, i in [("basicstats", 0), ("watchingAdjustment", 2), ("singleYear", 3), ("reposContributedTo", 4)] :
+                    if query.find(name) >= 0 :
+                        return copy.deepcopy(executedQueryResults[i])
+        store = RepoStore()
+        stats = FakeQueries(store)
+        self.assertEqual(4, stats.executed)
+        self.assertEqual(31, len(store))
+        self._validate(stats)
+        # The store is in the same order as the repo stats query, such
+        # that ties (e.g., for most starred) are broken in the same way.
+        self.assertEqual([repo["id"] for repo in repositories], [repo["id"] for repo in store.getRepositories()])
+        # Round trip through a file as if from a prior run.
+        with tempfile.TemporaryDirectory() as directory :
+            filename = os.path.join(directory, "cache", "repos.json")
+            store.save(filename)
+            store = RepoStore.load(filename)
+        self.assertEqual("2022-10-31T12:00:00Z", store.getWatermark())
+        # Nothing changed, so only the first page is needed.
+        stats = FakeQueries(store)
+        self.assertEqual(1, stats.executed)
+        self._validate(stats)
+        # One repository changed.
+        repositories[22]["stargazerCount"] += 5
+        repositories[22]["updatedAt"] = "2022-11-01T12:00:00Z"
+        stats = FakeQueries(store)
+        self.assertEqual(1, stats.executed)
+        self.assertEqual(41, stats._repo["starredBy"][0])
+        self.assertEqual("2022-11-01T12:00:00Z", store.getWatermark())
+        # A deleted repository is removed from the store.
+        del repositories[0]
+        stats = FakeQueries(store)
+        self.assertEqual(1, stats.executed)
+        self.assertEqual(30, len(store))
+        self.assertEqual(30, stats._repo["public"][1])
+        # A repository deleted while another is created, which leaves
+        # the count unchanged, is still removed from the store.
+        deleted = repositories.pop(8)
+        created = copy.deepcopy(deleted)
+        created["id"] = "R31"
+        created["name"] = "created"
+        created["stargazerCount"] = 0
+        created["updatedAt"] = "2022-11-02T12:00:00Z"
+        repositories.append(created)
+        stats = FakeQueries(store)
+        self.assertEqual(1, stats.executed)
+        self.assertEqual(30, len(store))
+        self.assertEqual(30, stats._repo["public"][1])
+        self.assertEqual(7, deleted["stargazerCount"])
+        self.assertEqual(41 - 7, stats._repo["starredBy"][0])
+        self.assertEqual([repo["id"] for repo in repositories], [repo["id"] for repo in store.getRepositories()])
+        # A repository that wasn't updated, but is missing from the store
+        # (e.g., made visible to the token), requires a full refresh.
+        repositories.insert(0, deleted)
+        stats = FakeQueries(store)
+        self.assertEqual(1 + 4, stats.executed)
+        self.assertEqual(31, len(store))
+        self.assertEqual([repo["id"] for repo in repositories], [repo["id"] for repo in store.getRepositories()])
+
+    def test_decodeQueryResults(self) :
+        # Simulate the output of gh, which concatenates the pages when paginating.
+        def ghOutput(pages) :
+            return "".join(json.dumps(page, separators=(",", ":")) for page in pages).encode()
+        raw = [
+            ghOutput([executedQueryResultsMultiPage[0]]),
+            ghOutput(executedQueryResultsMultiPage[1]),
+            ghOutput(executedQueryResultsMultiPage[2]),
+            ghOutput([executedQueryResultsMultiPage[3]]),
+            ghOutput(executedQueryResultsMultiPage[4])
+            ]
+        self.assertTrue(len(executedQueryResultsMultiPage[1]) > 1)
+        backends = [ (JsonDecoder._loads, JsonDecoder.decoderName), (json.loads, "json") ]
+        try :
+            for loads, name in backends :
+                JsonDecoder._loads, JsonDecoder.decoderName = loads, name
+                for compact in [False, True] :
+                    executedQueryResults = [
+                        JsonDecoder.decode(raw[0], compact),
+                        JsonDecoder.decodePages(raw[1], compact),
+                        JsonDecoder.decodePages(raw[2], compact),
+                        JsonDecoder.decode(raw[3], compact),
+                        JsonDecoder.decodePages(raw[4], compact)
+                        ]
+                    self.assertEqual(executedQueryResultsMultiPage[1], JsonDecoder.toPlain(executedQueryResults[1]))
+                    if compact :
+                        self.assertTrue(isinstance(executedQueryResults[0]["data"], JsonDecoder.CompactRecord))
+                    stats = NoQueries(True, False, 1000, set(), None, executedQueryResults)
+                    self._validate(stats)
+        finally :
+            JsonDecoder._loads, JsonDecoder.decoderName = backends[0]
+
+    def test_internLanguages(self) :
+        first = NoQueries(True, False, 1000, set(), None)
+        second = NoQueries(True, False, 1000, set(), None)
+        for L1, L2 in zip(first._languages["languages"], second._languages["languages"]) :
+            self.assertTrue(L1[0] is L2[0])
+            self.assertTrue(L1[1]["color"] is L2[1]["color"])
+        table = InternTable()
+        partial = StatsPartial(table)
+        partial.addRepositories(executedQueryResultsOriginal[1][0]["data"]["user"]["repositories"]["nodes"], set())
+        # 11 languages, each with a distinct color
+        self.assertEqual(22, len(table))
+        ids = partial.getLanguageIds()
+        self.assertEqual(11, len(ids))
+        self.assertEqual(3385976, ids[table.getId("Java")])
+        self.assertEqual("Java", table.getString(table.getId("Java")))
+
     def test_color_themes(self) :
         originalThemes = {
             "batty",
@@ -226,6 +498,12 @@ class TestSomething(unittest.TestCase) :
                 self.assertTrue(cat in labelMap)
                 for t in types :
                     self.assertTrue(t in labelMap[cat])
+        # Optional categories may only have English labels.
+        for cat in optionalCategories :
+            self.assertTrue(cat in statsByCategory)
+            self.assertFalse(cat in categoryOrder)
+            for t in types :
+                self.assertTrue(t in categoryLabels["en"][cat])
                     
     def test_stat_labels(self) :
         keys = {
@@ -244,6 +522,34 @@ class TestSomething(unittest.TestCase) :
             for locale in supportedLocales :
                 self.assertTrue(locale in labelsByLocale)
 
+    def test_label_widths(self) :
+        # If this fails, regenerate src/LabelWidths.py by
+        # running util/LabelWidths.py from the util directory.
+        for locale in supportedLocales :
+            for cat in categoryOrder :
+                for label in categoryLabels[locale][cat].values() :
+                    if label != None :
+                        self.assertEqual(calculateTextLength110(label), labelWidths[label])
+            for stat in statLabels.values() :
+                label = stat["label"][locale]
+                self.assertEqual(calculateTextLength110(label), labelWidths[label])
+            prefix, sep, suffix = titleTemplates[locale].partition("{0}")
+            self.assertEqual(
+                (calculateTextLength110(prefix), calculateTextLength110(suffix)),
+                titleTemplateWidths[locale]
+                )
+            if sep == "" :
+                continue
+            title = titleTemplates[locale].format("Firstname M. Lastname")
+            self.assertAlmostEqual(
+                calculateTextLength110(title),
+                calculateConcatenatedTextLength110([
+                    (prefix, titleTemplateWidths[locale][0]),
+                    ("Firstname M. Lastname", calculateTextLength110("Firstname M. Lastname")),
+                    (suffix, titleTemplateWidths[locale][1])
+                    ])
+                )
+                    
     def test_isValidColor(self) :
         for colorName, colorHex in _namedColors.items() :
             self.assertTrue(isValidColor(colorHex))
@@ -287,6 +593,29 @@ class TestSomething(unittest.TestCase) :
         self.assertAlmostEqual(76.5, calculateTextLength("coverage", 14 + 2/3, True, 600))
         self.assertAlmostEqual(76.05, calculateTextLength("branches", 14 + 2/3, True, 600))
  
+    def test_widthsTable(self) :
+        with open("util/default-widths.json", "r") as f :
+            defaultWidths = json.load(f)
+        widths = _loadWidths()
+        self.assertIs(widths, _loadWidths())
+        self.assertEqual(defaultWidths["mean-character-length"], widths.meanCharacterLength)
+        for c, length in defaultWidths["character-lengths"].items() :
+            self.assertEqual(length, _characterLength(widths, c))
+        for pair, length in defaultWidths["kerning-pairs"].items() :
+            self.assertEqual(length, _kerning(widths, pair[0], pair[1]))
+        self.assertEqual(defaultWidths["mean-character-length"], _characterLength(widths, "\U0010ffff"))
+        self.assertEqual(0, _kerning(widths, "\U0010ffff", "\U0010ffff"))
+        self.assertEqual(0, _kerning(widths, "a", "\U0010ffff"))
+        s = "Languages \u00e9\u20ac\u4e2d"
+        expected = sum(
+            defaultWidths["character-lengths"].get(c, defaultWidths["mean-character-length"])
+            for c in s
+            ) - sum(
+            defaultWidths["kerning-pairs"].get(s[i-1:i+1], 0)
+            for i in range(1, len(s))
+            )
+        self.assertEqual(expected, calculateTextLength110(s))
+
     def test_generateSVG(self) :
         executedQueryResults = copy.deepcopy(executedQueryResultsOriginal)
         # UNCOMMENT: to generate SVG when user only owns forks, which should
@@ -328,7 +657,623 @@ class TestSomething(unittest.TestCase) :
         image = svgGen.generateImage()
         if outputSampleSVG :
             writeImageToFile("testing.svg", image, False)
-        
+        # Each distinct string is measured once, whether for the
+        # width calculation or for generating the image, and the
+        # static labels aren't measured at all.
+        metrics = svgGen.getTextMetrics().statistics()
+        self.assertEqual(metrics["misses"] + metrics["precomputed"], metrics["size"])
+        self.assertTrue(metrics["hits"] >= metrics["size"])
+        self.assertTrue(metrics["precomputed"] > 0)
+
+    def test_generateSVGChunks(self) :
+        for maxLanguages in [1, 3, 100] :
+            stats = NoQueries(True, False, maxLanguages, set(), "FavoriteRepo")
+            for includeTitle in [True, False] :
+                for exclude in [set(), {"languages"}, {"general", "contributions"}, {"repositories", "stargazers"}] :
+                    for compact in [False, True] :
+                        images = []
+                        for streamed in [False, True] :
+                            svgGen = makeGenerator(stats, includeTitle=includeTitle, exclude=exclude, compact=compact)
+                            if streamed :
+                                images.append(b"".join(svgGen.generateImageChunks()))
+                            else :
+                                images.append(svgGen.generateImage().encode(encoding="UTF-8"))
+                        self.assertEqual(images[0], images[1])
+
+    def test_paintLayout(self) :
+        stats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        def generator(colors, locale) :
+            return makeGenerator(stats, colors=colors, locale=locale)
+        for locale in ["en", "ja", "ru"] :
+            layouts = {
+                True : generator(colorMapping["halloween"], locale).generateLayout(),
+                False : generator({ k : v for k, v in colorMapping["halloween"].items() if k != "title-icon" }, locale).generateLayout()
+                }
+            for theme, colors in colorMapping.items() :
+                layout = layouts["title-icon" in colors]
+                self.assertEqual(generator(colors, locale).generateImage(), layout.paint(colors))
+        self.assertRaises(ValueError, layouts[False].paint, colorMapping["halloween"])
+
+    def test_generateSVGDefs(self) :
+        stats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        colors = colorMapping["halloween"]
+        def generator(useDefs) :
+            return makeGenerator(stats, colors=colors, useDefs=useDefs)
+        image = generator(False).generateImage()
+        imageWithDefs = generator(True).generateImage()
+        self.assertTrue(len(imageWithDefs) < len(image))
+        self.assertEqual(1, imageWithDefs.count("<defs>"))
+        self.assertEqual(2, imageWithDefs.count('<use href="#ti"'))
+        titleIcon = iconTemplates[colors["title-icon"]].format(25, 0, 0, highContrastingColor(colors["bg"]))
+        self.assertEqual(1, imageWithDefs.count(titleIcon))
+        for k in statsByCategory["repositories"] :
+            self.assertTrue(imageWithDefs.count(statLabels[k]["icon"].format(colors["icons"])) <= 1)
+        self.assertEqual(imageWithDefs, generator(True).generateLayout().paint(colors))
+
+    def test_skeletonCache(self) :
+        stats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        def generator(locale, exclude, skeletonCache) :
+            return makeGenerator(stats, locale=locale, exclude=exclude, skeletonCache=skeletonCache)
+        cache = SkeletonCache(maxSize=3)
+        for exclude in [set(), {"languages"}, {"followers", "stargazers"}] :
+            expected = generator("en", exclude, None).generateImage()
+            # Generates and caches the skeleton.
+            self.assertEqual(expected, generator("en", exclude, cache).generateImage())
+            # Fills the values into the cached skeleton.
+            self.assertEqual(expected, generator("en", exclude, cache).generateImage())
+        self.assertEqual(3, len(cache))
+        with tempfile.TemporaryDirectory() as tempDir :
+            filename = os.path.join(tempDir, "skeletons", "cache.json")
+            cache.save(filename)
+            loaded = SkeletonCache.load(filename, maxSize=3)
+            self.assertEqual(3, len(loaded))
+            expected = generator("en", set(), None).generateImage()
+            self.assertEqual(expected, generator("en", set(), loaded).generateImage())
+            self.assertEqual(0, len(SkeletonCache.load(os.path.join(tempDir, "missing.json"))))
+        # The least recently used skeleton is evicted when the cache is full.
+        generator("de", set(), loaded).generateImage()
+        self.assertEqual(3, len(loaded))
+        key = generator("en", {"languages"}, None).calculateSkeletonKey()
+        self.assertEqual(None, loaded.get(key))
+        key = generator("en", set(), None).calculateSkeletonKey()
+        self.assertNotEqual(None, loaded.get(key))
+        # A skeleton cached by a version that renders differently isn't reused.
+        module = sys.modules["StatsImageGenerator"]
+        digest = module._calculateSourceDigest()
+        try :
+            module._sourceDigest = "0" * 64
+            self.assertEqual(None, loaded.get(generator("en", set(), None).calculateSkeletonKey()))
+            self.assertEqual(expected, generator("en", set(), loaded).generateImage())
+        finally :
+            module._sourceDigest = digest
+
+    def test_fingerprint(self) :
+        stats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        otherStats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        otherStats._user["followers"] = StatValue.number(otherStats._user["followers"][0] + 1)
+        def generator(stats, theme, skeletonCache=None) :
+            return makeGenerator(stats, colors=colorMapping[theme], skeletonCache=skeletonCache, embedFingerprint=True)
+        fingerprint = generator(stats, "light").calculateFingerprint()
+        self.assertEqual(fingerprint, generator(stats, "light").calculateFingerprint())
+        self.assertNotEqual(fingerprint, generator(stats, "dark").calculateFingerprint())
+        self.assertNotEqual(fingerprint, generator(otherStats, "light").calculateFingerprint())
+        with tempfile.TemporaryDirectory() as tempDir :
+            filename = os.path.join(tempDir, "stats.svg")
+            self.assertEqual(None, readImageFingerprint(filename))
+            writeImageChunksToFile(filename, generator(stats, "light").generateImageChunks(), False)
+            self.assertEqual(fingerprint, readImageFingerprint(filename))
+        # The fingerprint is a value of the skeleton, rather than part of it.
+        cache = SkeletonCache()
+        self.assertTrue(fingerprint in generator(stats, "light", cache).generateImage())
+        image = generator(otherStats, "light", cache).generateImage()
+        self.assertEqual(1, len(cache))
+        self.assertEqual(generator(otherStats, "light").generateImage(), image)
+        self.assertFalse(fingerprint in image)
+
+    def test_compressedImages(self) :
+        chunks = [b'<svg width="10">', "<g>é</g>".encode(encoding="UTF-8"), b"</svg>"]
+        image = b"".join(chunks)
+        with tempfile.TemporaryDirectory() as tempDir :
+            filename = os.path.join(tempDir, "images", "stats.svg")
+            sidecars = ["gz", "br"] if brotli != None else ["gz"]
+            writeImageChunksToFile(filename, iter(chunks), False, sidecars)
+            with open(filename, "rb") as f :
+                self.assertEqual(image, f.read())
+            with open(filename + ".gz", "rb") as f :
+                compressed = f.read()
+            self.assertEqual(image, gzip.decompress(compressed))
+            if brotli != None :
+                with open(filename + ".br", "rb") as f :
+                    self.assertEqual(image, brotli.decompress(f.read()))
+            # Compression is deterministic, so unchanged images don't need committing.
+            writeImageChunksToFile(filename, iter(chunks), False, sidecars)
+            with open(filename + ".gz", "rb") as f :
+                self.assertEqual(compressed, f.read())
+            self.assertEqual(sorted(["stats.svg"] + ["stats.svg." + s for s in sidecars]), sorted(os.listdir(os.path.dirname(filename))))
+            filename = os.path.join(tempDir, "stats.svgz")
+            writeImageChunksToFile(filename, iter([b'<svg><metadata>user-statistician:' + b"a" * 64 + b'</metadata></svg>']), False)
+            self.assertEqual("a" * 64, readImageFingerprint(filename))
+            with open(filename, "wb") as f :
+                f.write(b"<svg></svg>")
+            self.assertEqual(None, readImageFingerprint(filename))
+
+    def test_interruptedImage(self) :
+        def failingChunks() :
+            yield b'<svg width="10">'
+            raise RuntimeError("generating the image failed")
+        with tempfile.TemporaryDirectory() as tempDir :
+            filename = os.path.join(tempDir, "stats.svg")
+            writeImageChunksToFile(filename, iter([b"<svg></svg>"]), False, ["gz"])
+            with self.assertRaises(RuntimeError) :
+                writeImageChunksToFile(filename, failingChunks(), False, ["gz"])
+            # The prior image and sidecar are left as is, with no temporary files.
+            self.assertEqual(["stats.svg", "stats.svg.gz"], sorted(os.listdir(tempDir)))
+            with open(filename, "rb") as f :
+                self.assertEqual(b"<svg></svg>", f.read())
+
+    def test_patchImage(self) :
+        def generator(stats, skeletonCache) :
+            return makeGenerator(stats, skeletonCache=skeletonCache, embedFingerprint=True)
+        cache = SkeletonCache()
+        stats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        image = generator(stats, cache).generateImage()
+        self.assertTrue(image is generator(stats, cache).patchImage(image))
+        changedStats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        changedStats._user["followers"] = StatValue.number(changedStats._user["followers"][0] + 1)
+        changedStats._contrib["commits"] = StatValue.number(changedStats._contrib["commits"][0] + 5, changedStats._contrib["commits"][1] + 5)
+        patched = generator(changedStats, cache).patchImage(image)
+        self.assertEqual(generator(changedStats, None).generateImage(), patched)
+        self.assertEqual(1, len(cache))
+        # Changing the languages shifts the layout, so the image is generated.
+        changedLayout = NoQueries(True, False, 3, set(), "FavoriteRepo")
+        patched = generator(changedLayout, cache).patchImage(image)
+        self.assertEqual(generator(changedLayout, None).generateImage(), patched)
+        self.assertEqual(2, len(cache))
+        # An image that wasn't filled from the skeleton is generated.
+        patched = generator(changedStats, cache).patchImage(image.replace("</svg>", "<g/></svg>"))
+        self.assertEqual(generator(changedStats, None).generateImage(), patched)
+        patched = generator(changedStats, None).patchImage(image)
+        self.assertEqual(generator(changedStats, None).generateImage(), patched)
+        # Adjacent slots can't be located, so the image is generated
+        # (here, from the cached skeleton).
+        key = generator(stats, None).calculateSkeletonKey()
+        parts = cache.get(key).getParts()
+        adjacent = ImageSkeleton(parts[:-1] + ["", parts[-2], parts[-1]])
+        adjacentCache = SkeletonCache()
+        adjacentCache.put(key, adjacent)
+        patched = generator(changedStats, adjacentCache).patchImage(adjacent.fill(generator(stats, None).generateValues()))
+        self.assertEqual(adjacent.fill(generator(changedStats, None).generateValues()), patched)
+
+    def test_patchSkeleton(self) :
+        skeleton = ImageSkeleton(["<svg>", 0, "</a>", 1, "</svg>"])
+        image = skeleton.fill(["x</a>y", "z"])
+        # A value that contains the literal that follows it is located
+        # as ending at that literal, which still patches correctly.
+        for values in [["x</a>y", "z"], ["x</a>y", "w"], ["v", "z"], ["x", "</a>"], ["</a></a>", "</a>"]] :
+            self.assertEqual(skeleton.fill(values), skeleton.patch(image, values))
+        self.assertEqual(None, skeleton.patch(image.replace("<svg>", "<svg "), ["v", "z"]))
+        self.assertEqual(None, skeleton.patch(image + " ", ["v", "z"]))
+        adjacent = ImageSkeleton(["<svg>", 0, "", 1, "</svg>"])
+        self.assertEqual(None, adjacent.patch(adjacent.fill(["x", "y"]), ["x", "z"]))
+
+    def test_statValue(self) :
+        value = StatValue.number(3, 7)
+        self.assertFalse(value.isText())
+        self.assertTrue(value.isNonZero())
+        self.assertFalse(value.totalIsLowerBound())
+        self.assertEqual([3, 7], value.toPlain())
+        self.assertEqual(StatValue.number(3, 7), value)
+        self.assertNotEqual(StatValue.number(3), value)
+        self.assertFalse(StatValue.number(0, 0).isNonZero())
+        self.assertTrue(StatValue.number(0, 2).isNonZero())
+        self.assertTrue(StatValue.number(4, totalIsLowerBound=True).totalIsLowerBound())
+        # A repository whose name looks like a number is still text.
+        name = StatValue.text("2048")
+        self.assertTrue(name.isText())
+        self.assertTrue(name.isNonZero())
+        self.assertNotEqual(StatValue.number(2048), name)
+        stats = NoQueries(True, False, 100, set(), "1000000")
+        self.assertTrue(stats._user["featured"].isText())
+        self.assertTrue(stats._contrib["contribTo"].totalIsLowerBound() == statLabels["contribTo"].get("totalIsLowerBound", False))
+        image = makeGenerator(stats).generateImage()
+        self.assertTrue(">1000000<" in image)
+
+    def test_concurrentRendering(self) :
+        executedQueryResults = copy.deepcopy(executedQueryResultsOriginal)
+        queryFiles = {
+            "basicstats" : 0,
+            "repostats" : 1,
+            "watchingAdjustment" : 2,
+            "singleYearQueryFragment" : 3,
+            "reposContributedTo" : 4
+            }
+        class FakeQueries(Statistician) :
+            __slots__ = [ 'executed' ]
+            def __init__(self, autoLanguages, maxLanguages, lazy) :
+                self.executed = []
+                Statistician.__init__(self, True, autoLanguages, maxLanguages, set(), "FavoriteRepo", lazy)
+            def ghDisableInteractivePrompts(self) :
+                pass
+            def loadQuery(self, queryFilepath, failOnError=True) :
+                return queryFilepath
+            def executeQuery(self, query, needsPagination=False, failOnError=True) :
+                name = next(k for k in queryFiles if query.find(k) >= 0)
+                self.executed.append(name)
+                return copy.deepcopy(executedQueryResults[queryFiles[name]])
+        configurations = [
+            (theme, locale, useDefs, compact, animate)
+            for theme in ["light", "dark", "halloween"]
+            for locale in ["en", "de", "ja"]
+            for useDefs in [False, True]
+            for compact in [False, True]
+            for animate in [False, True]
+            ]
+        colors = { theme : copy.deepcopy(colorMapping[theme]) for theme in ["light", "dark", "halloween"] }
+        def render(stats, configuration) :
+            theme, locale, useDefs, compact, animate = configuration
+            return StatsImageGenerator(
+                stats,
+                colors[theme],
+                locale,
+                6,
+                18,
+                categoryOrder,
+                animate,
+                10,
+                0,
+                None,
+                True,
+                set(),
+                useDefs=useDefs,
+                compact=compact,
+                embedFingerprint=True
+                ).generateImage()
+        for autoLanguages in [False, True] :
+            expected = [ render(FakeQueries(autoLanguages, 4, False), c) for c in configurations ]
+            stats = FakeQueries(autoLanguages, 4, True)
+            start = threading.Barrier(8)
+            def renderAfterBarrier(configuration) :
+                start.wait()
+                return render(stats, configuration)
+            with ThreadPoolExecutor(max_workers=8) as executor :
+                images = list(executor.map(renderAfterBarrier, configurations[:8]))
+                before = copy.deepcopy([ stats.getStatsByKey(category) for category in categoryOrder ])
+                images.extend(executor.map(lambda c : render(stats, c), configurations[8:] * 3))
+            self.assertEqual(expected + expected[8:] * 2, images)
+            # Each query executed once, even though the categories were first requested concurrently.
+            self.assertEqual(len(set(stats.executed)), len(stats.executed))
+            # Rendering didn't change the stats, nor the color themes.
+            self.assertEqual(before, [ stats.getStatsByKey(category) for category in categoryOrder ])
+            self.assertEqual(colorMapping["halloween"], colors["halloween"])
+
+    def test_generateImagesForWidths(self) :
+        stats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        widths = [0, 600, 750, 1000]
+        for useDefs in [False, True] :
+            for skeletonCache in [None, SkeletonCache()] :
+                def generator(width) :
+                    return makeGenerator(
+                        stats,
+                        colors=colorMapping["dark"],
+                        width=width,
+                        useDefs=useDefs,
+                        skeletonCache=skeletonCache,
+                        embedFingerprint=True
+                        )
+                expected = [ generator(w).generateImage() for w in widths ]
+                svgGen = generator(widths[1])
+                images = svgGen.generateImagesForWidths(widths)
+                self.assertEqual(expected, images)
+                # The generator is left at its own width, with no image generated.
+                self.assertEqual(generator(widths[1]).calculateSkeletonKey(), svgGen.calculateSkeletonKey())
+                self.assertEqual(generator(widths[1]).calculateFingerprint(), svgGen.calculateFingerprint())
+                self.assertEqual(expected[1], svgGen.generateImage())
+                self.assertEqual(len(widths), len(set(images)))
+                # Each string was measured once, for all of the widths.
+                metrics = svgGen.getTextMetrics().statistics()
+                self.assertEqual(metrics["misses"] + metrics["precomputed"], metrics["size"])
+                self.assertEqual(expected[2], svgGen.generateImagesForWidths([750])[0])
+
+    def test_calendar(self) :
+        executedQueryResults = copy.deepcopy(executedQueryResultsOriginal)
+        levelNames = ["NONE", "FIRST_QUARTILE", "SECOND_QUARTILE", "THIRD_QUARTILE", "FOURTH_QUARTILE"]
+        levels = [ (day * day) % 5 for day in range(60) ]
+        weeks = []
+        for i, level in enumerate(levels) :
+            weekday = (i + 3) % 7
+            if i == 0 or weekday == 0 :
+                weeks.append({ "contributionDays" : [] })
+            weeks[-1]["contributionDays"].append({ "weekday" : weekday, "contributionLevel" : levelNames[level] })
+        calendarResults = { "data" : { "user" : { "contributionsCollection" : { "contributionCalendar" : {
+            "totalContributions" : 123,
+            "weeks" : weeks
+            } } } } }
+        queryFiles = {
+            "basicstats" : 0,
+            "repostats" : 1,
+            "watchingAdjustment" : 2,
+            "singleYearQueryFragment" : 3,
+            "reposContributedTo" : 4
+            }
+        class FakeQueries(Statistician) :
+            __slots__ = [ 'executed' ]
+            def __init__(self, lazy) :
+                self.executed = []
+                Statistician.__init__(self, True, False, 1000, set(), None, lazy)
+            def ghDisableInteractivePrompts(self) :
+                pass
+            def loadQuery(self, queryFilepath, failOnError=True) :
+                return queryFilepath
+            def executeQuery(self, query, needsPagination=False, failOnError=True) :
+                if query.find("contributionCalendar") >= 0 :
+                    self.executed.append("contributionCalendar")
+                    return copy.deepcopy(calendarResults)
+                name = next(k for k in queryFiles if query.find(k) >= 0)
+                self.executed.append(name)
+                return copy.deepcopy(executedQueryResults[queryFiles[name]])
+        stats = FakeQueries(False)
+        self.assertFalse("contributionCalendar" in stats.executed)
+        calendar = stats.getStatsByKey("calendar")
+        self.assertEqual({ "totalContributions" : 123, "firstWeekday" : 3, "levels" : levels }, calendar)
+        self.assertTrue(calendar is stats.getStatsByKey("calendar"))
+        self.assertEqual(1, stats.executed.count("contributionCalendar"))
+        stats = FakeQueries(True)
+        def generator(locale, categories, skeletonCache=None) :
+            return makeGenerator(
+                stats,
+                colors=colorMapping["dark"],
+                locale=locale,
+                categories=categories,
+                animateLanguageChart=False,
+                skeletonCache=skeletonCache
+                )
+        categories = categoryOrder + ["calendar"]
+        for locale in ["en", "de"] :
+            image = generator(locale, categories).generateImage()
+            self.assertEqual(1, image.count("<defs>"))
+            for level in range(5) :
+                self.assertEqual(1, image.count('<rect id="c{0}"'.format(level)))
+                self.assertEqual(levels.count(level), image.count('<use href="#c{0}"'.format(level)))
+            # Wednesday of the first week, and Saturday of the last.
+            self.assertTrue('<use href="#c0" x="0" y="36"/>' in image)
+            self.assertTrue('<use href="#c{0}" x="96" y="72"/>'.format(levels[-1]) in image)
+            self.assertTrue(categoryLabels["en"]["calendar"]["heading"] in image)
+            self.assertEqual(image, b"".join(generator(locale, categories).generateImageChunks()).decode(encoding="UTF-8"))
+            cache = SkeletonCache()
+            self.assertEqual(image, generator(locale, categories, cache).generateImage())
+            self.assertEqual(image, generator(locale, categories, cache).generateImage())
+        self.assertEqual(1, stats.executed.count("contributionCalendar"))
+        # It is only queried if it is included.
+        stats = FakeQueries(True)
+        image = generator("en", categoryOrder).generateImage()
+        self.assertFalse("contributionCalendar" in stats.executed)
+        self.assertFalse('<use href="#c' in image)
+
+    def test_leaderboard(self) :
+        def repo(name, stars, forks, watchers) :
+            return {
+                "isPrivate" : False, "isFork" : False, "isArchived" : False, "isTemplate" : False,
+                "name" : name, "stargazerCount" : stars, "forkCount" : forks,
+                "watchers" : { "totalCount" : watchers },
+                "languages" : { "totalSize" : 0, "edges" : None }
+                }
+        nodes = [ repo("repo" + str(i), (i * 7) % 25, i % 4, 30 - i) for i in range(30) ]
+        whole = StatsPartial()
+        whole.addRepositories(nodes, set())
+        expected = sorted(
+            [ (r["name"], r["stargazerCount"], i) for i, r in enumerate(nodes) ],
+            key=lambda r : (-r[1], r[2])
+            )[:StatsPartial.topSize]
+        self.assertEqual([ (r[0], r[1]) for r in expected ], whole.getTop("stars"))
+        # Ties go to the repository that came first.
+        self.assertEqual(["repo3", "repo7", "repo11"], [ r[0] for r in whole.getTop("forks")[:3] ])
+        self.assertEqual([ ("repo" + str(i), 30 - i) for i in range(10) ], whole.getTop("watchers"))
+        watching = StatsPartial()
+        watching.addRepositories(nodes, set(), {"repo0", "repo2"})
+        self.assertEqual([("repo0", 29), ("repo1", 29), ("repo2", 27), ("repo3", 27)], watching.getTop("watchers")[:4])
+        self.assertEqual([], StatsPartial().getTop("stars"))
+        # Partials of pages merge to the same rankings, including after serialization.
+        pages = [ StatsPartial() for i in range(3) ]
+        for i, p in enumerate(pages) :
+            p.addRepositories(nodes[10*i:10*(i+1)], set())
+        merged = mergePartials(StatsPartial.fromDict(json.loads(json.dumps(p.toDict()))) for p in pages)
+        for key in ["stars", "forks", "watchers"] :
+            self.assertEqual(whole.getTop(key), merged.getTop(key))
+
+        stats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        leaderboard = stats.getStatsByKey("leaderboard")
+        self.assertEqual(stats._user["mostStarred"][0], leaderboard["stars"][0][0])
+        self.assertEqual(stats._user["mostForked"][0], leaderboard["forks"][0][0])
+        # The user watching their own repositories is excluded, as it is
+        # from the watchedBy stat, which the watchers then sum to.
+        self.assertEqual([("repo7", 2), ("repo23", 1)], [ e for e in leaderboard["watchers"] if e[1] > 0 ])
+        self.assertEqual(stats._repo["watchedBy"][0], sum(e[1] for e in leaderboard["watchers"]))
+        def generator(ranking, size, useDefs=False, skeletonCache=None, categories=["leaderboard", "general"]) :
+            return makeGenerator(
+                stats,
+                colors=colorMapping["light"],
+                locale="de",
+                categories=categories,
+                animateLanguageChart=False,
+                useDefs=useDefs,
+                skeletonCache=skeletonCache,
+                leaderboardRanking=ranking,
+                leaderboardSize=size
+                )
+        for ranking, statKey in leaderboardRankings.items() :
+            entries = [ e for e in leaderboard[ranking][:3] if e[1] > 0 ]
+            image = generator(ranking, 3).generateImage()
+            self.assertTrue(categoryLabels["en"]["leaderboard"]["heading"] in image)
+            for name, count in entries :
+                self.assertTrue(">" + name + "<" in image)
+            icon = statLabels[statKey]["icon"].format(colorMapping["light"]["icons"])
+            others = generator(ranking, 3, categories=["general"]).generateImage().count(icon)
+            self.assertEqual(len(entries) + others, image.count(icon))
+            self.assertEqual(image, b"".join(generator(ranking, 3).generateImageChunks()).decode(encoding="UTF-8"))
+            cache = SkeletonCache()
+            self.assertEqual(image, generator(ranking, 3, skeletonCache=cache).generateImage())
+            self.assertEqual(image, generator(ranking, 3, skeletonCache=cache).generateImage())
+            image = generator(ranking, 3, True).generateImage()
+            self.assertEqual(1, image.count(icon))
+
+    def test_statsHistory(self) :
+        with tempfile.TemporaryDirectory() as directory :
+            filename = os.path.join(directory, "history", "stats.bin")
+            history = StatsHistory(filename)
+            self.assertEqual(0, len(history))
+            self.assertEqual([], history.readLast(5))
+            self.assertEqual({ "starredBy" : [], "followers" : [], "commits" : [] }, history.readTrends(5))
+            for day in range(100, 140) :
+                history.append(day, [day, 2 * day, day % 7])
+            self.assertEqual(40, len(history))
+            # Another run on the same day replaces that day's record.
+            history.append(139, [1, 2, 3])
+            self.assertEqual(40, len(history))
+            self.assertEqual([(137, 137, 274, 4), (138, 138, 276, 5), (139, 1, 2, 3)], history.readLast(3))
+            self.assertEqual(40, len(history.readLast(50)))
+            self.assertEqual(
+                { "starredBy" : [138, 1], "followers" : [276, 2], "commits" : [5, 3] },
+                history.readTrends(2)
+                )
+            # A partial record from an interrupted run is overwritten.
+            with open(filename, "ab") as f :
+                f.write(b"\x01\x02\x03")
+            self.assertEqual(40, len(history))
+            history.append(140, [4, 5, 6])
+            self.assertEqual(41, len(history))
+            self.assertEqual([(139, 1, 2, 3), (140, 4, 5, 6)], history.readLast(2))
+            # A file that isn't a history is started over.
+            with open(filename, "wb") as f :
+                f.write(b"<svg></svg>")
+            self.assertEqual(0, len(history))
+            history.append(141, [7, 8, 9])
+            self.assertEqual([(141, 7, 8, 9)], history.readLast(2))
+
+    def test_sparklines(self) :
+        stats = NoQueries(True, False, 100, set(), "FavoriteRepo")
+        with tempfile.TemporaryDirectory() as directory :
+            history = StatsHistory(os.path.join(directory, "stats.bin"))
+            history.appendStats(1, stats)
+            self.assertEqual(
+                [(1, stats._repo["starredBy"][0], stats._user["followers"][0], stats._contrib["commits"][0])],
+                history.readLast(1)
+                )
+            for day in range(2, 50) :
+                history.append(day, [day, 100 - day, 5])
+            trends = history.readTrends(StatsImageGenerator.sparklinePoints)
+        def generator(trends, skeletonCache=None) :
+            return makeGenerator(
+                stats,
+                colors=colorMapping["light"],
+                animateLanguageChart=False,
+                skeletonCache=skeletonCache,
+                trends=trends
+                )
+        plain = generator(None)
+        svgGen = generator(trends)
+        image = svgGen.generateImage()
+        self.assertEqual(3, image.count("<polyline"))
+        self.assertTrue(svgGen._width >= plain._width)
+        # Rising, falling, and flat trends, with 30 points spanning the width.
+        self.assertTrue('points="0,12 ' in image)
+        self.assertTrue(' 40,0"/>' in image)
+        self.assertTrue('points="0,0 ' in image)
+        self.assertTrue(' 40,12"/>' in image)
+        self.assertTrue('points="0,6 ' in image)
+        self.assertEqual(image, b"".join(generator(trends).generateImageChunks()).decode(encoding="UTF-8"))
+        cache = SkeletonCache()
+        self.assertEqual(image, generator(trends, cache).generateImage())
+        self.assertEqual(image, generator(trends, cache).generateImage())
+        # A sparkline needs at least two values, and begins part way if there are fewer than 30.
+        image = generator({ "starredBy" : [1, 2, 3], "followers" : [4], "commits" : [] }).generateImage()
+        self.assertEqual(1, image.count("<polyline"))
+        self.assertTrue('points="37.2,12 38.6,6 40,0"' in image)
+        self.assertEqual(plain.generateImage(), generator({}).generateImage())
+
+    def test_compactPieChart(self) :
+        wedges = [
+            { "color" : "#000000", "percentage" : 0.5 },
+            { "color" : "#ffffff", "percentage" : 0.25 },
+            { "color" : "#ff0000", "percentage" : 0.25 }
+            ]
+        expected = [
+            '<path fill="#000000" d="M0 50A50 50 0 1 1 100 50L50 50Z"/>',
+            '<path fill="#ffffff" d="M100 50A50 50 0 0 1 50 100L50 50Z"/>',
+            '<path fill="#ff0000" d="M50 100A50 50 0 0 1 0 50L50 50Z"/>'
+            ]
+        self.assertEqual("".join(expected), svgPieChart(copy.deepcopy(wedges), 50, False, 10, precision=2))
+        wedges = [
+            { "color" : "#000000", "percentage" : 1 / 3 },
+            { "color" : "#ffffff", "percentage" : 2 / 3 }
+            ]
+        expected = [
+            '<path fill="#000000" d="M0 50A50 50 0 0 1 75 6.7L50 50Z"/>',
+            '<path fill="#ffffff" d="M75 6.7A50 50 0 1 1 0 50L50 50Z"/>'
+            ]
+        self.assertEqual("".join(expected), svgPieChart(copy.deepcopy(wedges), 50, False, 10, precision=1))
+
+    def test_pieChartSlivers(self) :
+        # At radius 50, an arc of 1 pixel is about 0.32% of the circle.
+        wedges = [
+            { "color" : "#000000", "percentage" : 0.5 },
+            { "color" : "#ffffff", "percentage" : 0.25 },
+            { "color" : "#ff0000", "percentage" : 0.2 },
+            { "color" : "#00ff00", "percentage" : 0.003 },
+            { "color" : "#0000ff", "percentage" : 0.002 },
+            { "color" : "#00ffff", "percentage" : 0.044 },
+            { "color" : "#ff00ff", "percentage" : 0.001 }
+            ]
+        original = copy.deepcopy(wedges)
+        # The first run of slivers is visible once merged, and the last isn't.
+        merged = [
+            { "color" : "#000000", "percentage" : 0.5 },
+            { "color" : "#ffffff", "percentage" : 0.25 },
+            { "color" : "#ff0000", "percentage" : 0.2 },
+            { "color" : "#00ff00", "percentage" : 0.005 },
+            { "color" : "#00ffff", "percentage" : 0.045 }
+            ]
+        self.assertEqual(
+            svgPieChart(merged, 50, False, 10, precision=2),
+            svgPieChart(wedges, 50, False, 10, precision=2, minimumArcLength=1)
+            )
+        self.assertEqual(5, svgPieChart(wedges, 50, False, 10, minimumArcLength=1).count("<path"))
+        self.assertEqual(7, svgPieChart(wedges, 50, False, 10).count("<path"))
+        self.assertEqual(original, wedges)
+        # Slivers beside a single visible wedge leave a full circle.
+        wedges = [
+            { "color" : "#000000", "percentage" : 0.999 },
+            { "color" : "#ffffff", "percentage" : 0.001 }
+            ]
+        self.assertEqual(
+            '<circle fill="#000000" cx="50" cy="50" r="50"/>',
+            svgPieChart(wedges, 50, False, 10, minimumArcLength=1)
+            )
+
+    def test_pieChartAnimation(self) :
+        wedges = [
+            { "color" : "#000000", "percentage" : 0.5 },
+            { "color" : "#ffffff", "percentage" : 0.25 },
+            { "color" : "#ff0000", "percentage" : 0.25 }
+            ]
+        paths = svgPieChart(wedges, 50, False, 10, precision=2)
+        smil = svgPieChart(wedges, 50, True, 7, precision=2)
+        self.assertTrue(smil.startswith("<g>" + paths))
+        self.assertTrue(smil.endswith('dur="7s" repeatCount="indefinite"/></g>'))
+        css = svgPieChart(wedges, 50, True, 7, precision=2, cssAnimation=True)
+        self.assertTrue(css.startswith("<style>"))
+        self.assertTrue(css.endswith('<g class="pie-rotate">' + paths + "</g>"))
+        self.assertTrue("animation:pie-rotate 7s linear infinite" in css)
+        self.assertTrue("@media (prefers-reduced-motion:reduce){.pie-rotate{animation:none}}" in css)
+        self.assertEqual(paths, svgPieChart(wedges, 50, False, 10, precision=2, cssAnimation=True))
+        # The geometry is cached, and drawing it in other colors reuses it.
+        hits = _wedgeGeometry.cache_info().hits
+        recolored = [ dict(w, color="#123456") for w in wedges ]
+        recoloredPaths = paths
+        for w in wedges :
+            recoloredPaths = recoloredPaths.replace(w["color"], "#123456")
+        self.assertEqual(recoloredPaths, svgPieChart(recolored, 50, False, 10, precision=2))
+        self.assertEqual(hits + 1, _wedgeGeometry.cache_info().hits)
+
     def _colorValidation(self, theme) :
         props = {"bg", "border", "icons", "text", "title"}
         validHexDigits = set("0123456789abcdefABCDEF")
@@ -25,22 +25,40 @@
 # SOFTWARE.
 #
 
+# Generates src/default-widths.bin, the packed table of character widths
+# and kerning pairs that src/TextLength.py memory-maps, from
+# default-widths.json, which is derived from
+# https://github.com/google/pybadges, which is licensed under Apache-2.0.
+# Run this from the util directory whenever default-widths.json changes.
+
 import json
-import pprint
+import sys
+sys.path.insert(0, "../src")
+from TextLength import widthsMagic, widthsHeader, kerningPairKey
+import array
 
 if __name__ == "__main__" :
     with open("default-widths.json", "r") as f :
         defaultWidths = json.load(f)
-    with open("default-widths.py", "wb") as f :
-        heading = """########################################
-# The dict that follows is derived from
-# default-widths.json from
-# https://github.com/google/pybadges,
-# which is licensed under Apache-2.0.
-########################################
-"""
-        formatted = pprint.pformat(defaultWidths, indent=0, compact=True)
-        formatted = formatted.replace(" " * 21, "")
-        formatted = formatted.replace(" " * 17, "")
-        s = heading + "\ndefaultWidths = " + formatted
-        f.write(s.encode(encoding="UTF-8"))
+    characters = sorted(defaultWidths["character-lengths"].items())
+    pairs = sorted(
+        (kerningPairKey(ord(pair[0]), ord(pair[1])), length)
+        for pair, length in defaultWidths["kerning-pairs"].items()
+        )
+    sections = [
+        array.array("Q", (key for key, length in pairs)),
+        array.array("I", (ord(c) for c, length in characters)),
+        array.array("b", (length for key, length in pairs)),
+        array.array("B", (length for c, length in characters))
+        ]
+    with open("../src/default-widths.bin", "wb") as f :
+        f.write(widthsHeader.pack(
+            widthsMagic,
+            defaultWidths["mean-character-length"],
+            len(pairs),
+            len(characters)
+            ))
+        for section in sections :
+            if sys.byteorder != "little" :
+                section.byteswap()
+            f.write(section.tobytes())
@@ -0,0 +1,74 @@
+#
+# user-statistician: Github action for generating a user stats card
+# 
+# Copyright (c) 2022 Vincent A Cicirello
+# https://www.cicirello.org/
+#
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+# Generates src/LabelWidths.py, which contains the 110pt widths of
+# all of the static labels, headings, and title templates in StatConfig,
+# in all of the supported locales. Run this from the util directory
+# whenever any of those change (e.g., when adding a locale).
+
+import pprint
+import sys
+sys.path.insert(0, "../src")
+from StatConfig import statLabels, categoryLabels, titleTemplates, supportedLocales
+from TextLength import calculateTextLength110
+
+if __name__ == "__main__" :
+    labels = set()
+    for locale in supportedLocales :
+        for headings in categoryLabels[locale].values() :
+            for label in headings.values() :
+                if label != None :
+                    labels.add(label)
+        for stat in statLabels.values() :
+            labels.add(stat["label"][locale])
+    labelWidths = { label : calculateTextLength110(label) for label in sorted(labels) }
+    titleTemplateWidths = {}
+    for locale in sorted(supportedLocales) :
+        prefix, sep, suffix = titleTemplates[locale].partition("{0}")
+        titleTemplateWidths[locale] = (
+            calculateTextLength110(prefix),
+            calculateTextLength110(suffix)
+            )
+    with open("../src/LabelWidths.py", "wb") as f :
+        heading = """#
+# user-statistician: Github action for generating a user stats card
+#
+# GENERATED FILE: Do not edit. Generated by util/LabelWidths.py
+# from the labels in StatConfig.py.
+#
+
+# Maps each static label and heading, in all supported locales,
+# to its length in DejaVu Sans 110pt font.
+labelWidths = """
+        s = heading + pprint.pformat(labelWidths, indent=0)
+        s += """
+
+# Maps each locale to the lengths in DejaVu Sans 110pt font of
+# the parts of its title template before and after the name.
+titleTemplateWidths = """
+        s += pprint.pformat(titleTemplateWidths, indent=0) + "\n"
+        f.write(s.encode(encoding="UTF-8"))